@@ -1,15 +1,17 @@
 import abc
 import os
-import sys
-from time import sleep
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
 import traceback
 from multiprocessing.context import SpawnContext
 from multiprocessing.synchronize import RLock
-from threading import get_ident
+from threading import Lock, get_ident
 from typing import (
     Any,
     Callable,
     ContextManager,
+    Deque,
     Dict,
     Hashable,
     Iterable,
@@ -27,6 +29,7 @@ from dbt_common.exceptions import DbtInternalError, NotImplementedError
 from dbt_common.utils import cast_to_str
 
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
+from dbt.adapters.base.results import DEFAULT_FETCH_BATCH_SIZE, StreamingResult
 from dbt.adapters.contracts.connection import (
     AdapterRequiredConfig,
     AdapterResponse,
@@ -37,6 +40,7 @@ from dbt.adapters.contracts.connection import (
 )
 from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.events.types import (
+    AdapterEventDebug,
     ConnectionClosed,
     ConnectionClosedInCleanup,
     ConnectionLeftOpen,
@@ -47,6 +51,8 @@ from dbt.adapters.events.types import (
     RollbackFailed,
 )
 from dbt.adapters.exceptions import FailedToConnectError, InvalidConnectionError
+from dbt.adapters.profiling import profile_phase
+from dbt.adapters.retry import RetryPolicy
 
 if TYPE_CHECKING:
     import agate
@@ -56,6 +62,87 @@ SleepTime = Union[int, float]  # As taken by time.sleep.
 AdapterHandle = Any  # Adapter connection handle objects can be any class.
 
 
+def _close_handle_quietly(handle: AdapterHandle) -> None:
+    # handles leaving the pool may already be broken; closing them is best-effort
+    try:
+        if hasattr(handle, "close"):
+            handle.close()
+    except Exception:
+        pass
+
+
+class ConnectionPool:
+    """A bounded set of idle, open adapter handles shared by all threads.
+
+    Handles are checked in when a connection is released instead of being closed, and checked
+    out the next time any thread needs to open a connection. On checkout, handles that have been
+    idle for longer than `idle_timeout` seconds or that fail `health_check` are closed and
+    skipped; checkout returns None when no reusable handle is left.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        idle_timeout: Optional[float] = None,
+        health_check: Optional[Callable[[AdapterHandle], bool]] = None,
+        close: Callable[[AdapterHandle], None] = _close_handle_quietly,
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.close = close
+        self.hits = 0
+        self.misses = 0
+        self._idle: Deque[Tuple[float, AdapterHandle]] = deque()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def checkout(self) -> Optional[AdapterHandle]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    self.misses += 1
+                    return None
+                # most recently released first: it is the least likely to have gone stale
+                released_at, handle = self._idle.pop()
+
+            # check outside the lock, health checks may need a round trip to the warehouse
+            if self._is_reusable(released_at, handle):
+                with self._lock:
+                    self.hits += 1
+                return handle
+            self.close(handle)
+
+    def checkin(self, handle: AdapterHandle) -> bool:
+        """Add an idle handle to the pool. Returns False if the pool is full, in which case the
+        caller still owns the handle and should close it.
+        """
+        with self._lock:
+            if len(self._idle) >= self.max_size:
+                return False
+            self._idle.append((monotonic(), handle))
+            return True
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for _, handle in idle:
+            self.close(handle)
+
+    def _is_reusable(self, released_at: float, handle: AdapterHandle) -> bool:
+        if self.idle_timeout is not None and monotonic() - released_at > self.idle_timeout:
+            return False
+        if self.health_check is None:
+            return True
+        try:
+            return self.health_check(handle)
+        except Exception:
+            return False
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -71,12 +158,20 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
     """
 
     TYPE: str = NotImplemented
+    # the backoff used to retry transient errors, which the adapter's retryable errors
+    # and retry limits are applied to
+    RETRY_POLICY: RetryPolicy = RetryPolicy()
+    # how many connections warm_up opens at a time, unless told otherwise
+    WARM_UP_PARALLELISM: int = 8
 
     def __init__(self, profile: AdapterRequiredConfig, mp_context: SpawnContext) -> None:
         self.profile = profile
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = mp_context.RLock()
         self.query_header: Optional[MacroQueryStringSetter] = None
+        self.pool: Optional[ConnectionPool] = self.create_connection_pool()
+        # handles opened by warm_up for adapters without a pool, handed out until it is drained
+        self._warm_handles: Optional[ConnectionPool] = None
 
     def set_query_header(self, query_header_context: Dict[str, Any]) -> None:
         self.query_header = MacroQueryStringSetter(self.profile, query_header_context)
@@ -143,38 +238,43 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         Creates a connection for this thread if one doesn't already
         exist, and will rename an existing connection."""
 
-        conn_name: str = "master" if name is None else name
+        with profile_phase("acquire"):
+            conn_name: str = "master" if name is None else name
 
-        # Get a connection for this thread
-        conn = self.get_if_exists()
+            # Get a connection for this thread
+            conn = self.get_if_exists()
 
-        if conn and conn.name == conn_name and conn.state == "open":
-            # Found a connection and nothing to do, so just return it
-            return conn
+            if conn and conn.name == conn_name and conn.state == "open":
+                # Found a connection and nothing to do, so just return it
+                return conn
 
-        if conn is None:
-            # Create a new connection
-            conn = Connection(
-                type=Identifier(self.TYPE),
-                name=conn_name,
-                state=ConnectionState.INIT,  # type: ignore
-                transaction_open=False,
-                handle=None,
-                credentials=self.profile.credentials,
-            )
-            conn.handle = LazyHandle(self.open)
-            # Add the connection to thread_connections for this thread
-            self.set_thread_connection(conn)
-            fire_event(
-                NewConnection(conn_name=conn_name, conn_type=self.TYPE, node_info=get_node_info())
-            )
-        else:  # existing connection either wasn't open or didn't have the right name
-            if conn.state != "open":
-                conn.handle = LazyHandle(self.open)
-            if conn.name != conn_name:
-                orig_conn_name: str = conn.name or ""
-                conn.name = conn_name
-                fire_event(ConnectionReused(orig_conn_name=orig_conn_name, conn_name=conn_name))
+            if conn is None:
+                # Create a new connection
+                conn = Connection(
+                    type=Identifier(self.TYPE),
+                    name=conn_name,
+                    state=ConnectionState.INIT,  # type: ignore
+                    transaction_open=False,
+                    handle=None,
+                    credentials=self.profile.credentials,
+                )
+                conn.handle = LazyHandle(self._checkout_or_open)
+                # Add the connection to thread_connections for this thread
+                self.set_thread_connection(conn)
+                fire_event(
+                    NewConnection(
+                        conn_name=conn_name, conn_type=self.TYPE, node_info=get_node_info()
+                    )
+                )
+            else:  # existing connection either wasn't open or didn't have the right name
+                if conn.state != "open":
+                    conn.handle = LazyHandle(self._checkout_or_open)
+                if conn.name != conn_name:
+                    orig_conn_name: str = conn.name or ""
+                    conn.name = conn_name
+                    fire_event(
+                        ConnectionReused(orig_conn_name=orig_conn_name, conn_name=conn_name)
+                    )
 
         return conn
 
@@ -187,7 +287,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         retryable_exceptions: Iterable[Type[Exception]],
         retry_limit: int = 1,
         retry_timeout: Union[Callable[[int], SleepTime], SleepTime] = 1,
-        _attempts: int = 0,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Connection:
         """Given a Connection, set its handle by calling connect.
 
@@ -213,53 +313,46 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             Callable that takes the number of attempts so far, beginning at 0, and returns an int
             or float to be passed to time.sleep.
         :type retry_timeout: Union[Callable[[int], SleepTime], SleepTime] = 1
-        :param int _attempts: Parameter used to keep track of the number of attempts in calling the
-            connect function across recursive calls. Passed as an argument to retry_timeout if it
-            is a Callable. This parameter should not be set by the initial caller.
+        :param RetryPolicy retry_policy: How to retry the calls to connect, overriding
+            retryable_exceptions, retry_limit and retry_timeout.
         :raises dbt.adapters.exceptions.FailedToConnectError: Upon exhausting all retry attempts without
             successfully acquiring a handle.
         :return: The given connection with its appropriate state and handle attributes set
             depending on whether we successfully acquired a handle or not.
         """
-        timeout = retry_timeout(_attempts) if callable(retry_timeout) else retry_timeout
-        if timeout < 0:
-            raise FailedToConnectError(
-                "retry_timeout cannot be negative or return a negative time."
+        if retry_policy is None:
+
+            def delay(attempt: int) -> SleepTime:
+                timeout = retry_timeout(attempt) if callable(retry_timeout) else retry_timeout
+                if timeout < 0:
+                    raise FailedToConnectError(
+                        "retry_timeout cannot be negative or return a negative time."
+                    )
+                return timeout
+
+            delay(0)
+            retry_policy = RetryPolicy(
+                retries=retry_limit,
+                retryable_exceptions=tuple(retryable_exceptions),
+                delay=delay,
             )
 
-        if retry_limit < 0 or retry_limit > sys.getrecursionlimit():
-            # This guard is not perfect others may add to the recursion limit (e.g. built-ins).
+        if retry_policy.retries < 0:
             connection.handle = None
             connection.state = ConnectionState.FAIL  # type: ignore
             raise FailedToConnectError("retry_limit cannot be negative")
 
         try:
-            connection.handle = connect()
+            connection.handle = retry_policy.call(
+                connect, f"opening a {cls.TYPE} connection", name=logger.name
+            )
             connection.state = ConnectionState.OPEN  # type: ignore
             return connection
 
-        except tuple(retryable_exceptions) as e:
-            if retry_limit <= 0:
-                connection.handle = None
-                connection.state = ConnectionState.FAIL  # type: ignore
-                raise FailedToConnectError(str(e))
-
-            logger.debug(
-                f"Got a retryable error when attempting to open a {cls.TYPE} connection.\n"
-                f"{retry_limit} attempts remaining. Retrying in {timeout} seconds.\n"
-                f"Error:\n{e}"
-            )
-
-            sleep(timeout)
-            return cls.retry_connection(
-                connection=connection,
-                connect=connect,
-                logger=logger,
-                retry_limit=retry_limit - 1,
-                retry_timeout=retry_timeout,
-                retryable_exceptions=retryable_exceptions,
-                _attempts=_attempts + 1,
-            )
+        except FailedToConnectError:
+            connection.handle = None
+            connection.state = ConnectionState.FAIL  # type: ignore
+            raise
 
         except Exception as e:
             connection.handle = None
@@ -284,6 +377,154 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("`open` is not implemented for this adapter!")
 
+    def create_connection_pool(self) -> Optional[ConnectionPool]:
+        """Create the pool that released handles are returned to, or None to close handles on
+        release. (passable)
+        """
+        return None
+
+    @classmethod
+    def handle_is_healthy(cls, handle: AdapterHandle) -> bool:
+        """Check that an idle pooled handle can still be used before handing it out."""
+        return True
+
+    @classmethod
+    def reset_handle(cls, handle: AdapterHandle) -> None:
+        """Reset any session state on a handle before it is returned to the pool. (passable)"""
+        pass
+
+    def warm_up(self, count: int, parallelism: Optional[int] = None) -> List[float]:
+        """Open count connections concurrently, at most parallelism at a time, and keep their
+        handles for the next threads that open a connection, so that the handshakes are not
+        serialized behind the first nodes to run. Returns the time taken by each handshake
+        that succeeded, in seconds; connections that fail to open are opened by their threads.
+        """
+        if count <= 0:
+            return []
+
+        if self.pool is None:
+            with self.lock:
+                if self._warm_handles is None:
+                    self._warm_handles = ConnectionPool(
+                        max_size=count, health_check=self.handle_is_healthy
+                    )
+                else:
+                    self._warm_handles.max_size += count
+
+        def open_one(index: int) -> Optional[float]:
+            connection = Connection(
+                type=Identifier(self.TYPE),
+                name=f"warm_up_{index}",
+                state=ConnectionState.INIT,  # type: ignore
+                transaction_open=False,
+                handle=None,
+                credentials=self.profile.credentials,
+            )
+            start = monotonic()
+            try:
+                with profile_phase("open"):
+                    self.open(connection)
+            except Exception as e:
+                fire_event(
+                    AdapterEventDebug(
+                        name=self.TYPE,
+                        base_msg="Failed to warm up connection '{}': {}",
+                        args=[cast_to_str(connection.name), str(e)],
+                    )
+                )
+                return None
+            latency = monotonic() - start
+            fire_event(
+                AdapterEventDebug(
+                    name=self.TYPE,
+                    base_msg="Warmed up connection '{}' in {}s",
+                    args=[cast_to_str(connection.name), f"{latency:.3f}"],
+                )
+            )
+            if connection.state == ConnectionState.OPEN:
+                # the warmed up handles are dropped once threads find them all in use
+                with self.lock:
+                    pool = self.pool if self.pool is not None else self._warm_handles
+                    kept = pool is not None and pool.checkin(connection.handle)
+                if not kept:
+                    self._close_handle(connection)
+            return latency
+
+        start = monotonic()
+        workers = min(count, parallelism or self.WARM_UP_PARALLELISM)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warm-up") as tpe:
+            results = list(tpe.map(open_one, range(count)))
+        latencies = [latency for latency in results if latency is not None]
+        fire_event(
+            AdapterEventDebug(
+                name=self.TYPE,
+                base_msg="Warmed up {} of {} connection(s) in {}s",
+                args=[str(len(latencies)), str(count), f"{monotonic() - start:.3f}"],
+            )
+        )
+        return latencies
+
+    def _checkout_or_open(self, connection: Connection) -> Connection:
+        pool = self.pool if self.pool is not None else self._warm_handles
+        if pool is None:
+            with profile_phase("open"):
+                return self.open(connection)
+
+        start = monotonic()
+        with profile_phase("acquire"):
+            handle = pool.checkout()
+        if handle is None:
+            with self.lock:
+                # the warmed up handles are all in use: open connections as usual from now on,
+                # unless a warm up has checked more in since
+                if pool is self._warm_handles and not len(pool):
+                    self._warm_handles = None
+        fire_event(
+            AdapterEventDebug(
+                name=self.TYPE,
+                base_msg="Connection pool {} for '{}' after {}s (hit rate {}/{})",
+                args=[
+                    "miss" if handle is None else "hit",
+                    cast_to_str(connection.name),
+                    f"{monotonic() - start:.3f}",
+                    str(pool.hits),
+                    str(pool.hits + pool.misses),
+                ],
+            )
+        )
+        if handle is None:
+            with profile_phase("open"):
+                return self.open(connection)
+
+        connection.handle = handle
+        connection.state = ConnectionState.OPEN  # type: ignore
+        connection.transaction_open = False
+        return connection
+
+    def _release_to_pool(self, connection: Connection) -> bool:
+        """Return the connection's handle to the pool. Returns False if the connection should
+        be closed instead.
+        """
+        if self.pool is None or connection.state != ConnectionState.OPEN:
+            return False
+
+        if connection.transaction_open:
+            fire_event(Rollback(conn_name=cast_to_str(connection.name), node_info=get_node_info()))
+            self._rollback_handle(connection)
+            connection.transaction_open = False
+
+        handle = connection.handle
+        try:
+            self.reset_handle(handle)
+        except Exception:
+            return False
+        if not self.pool.checkin(handle):
+            return False
+
+        connection.handle = None
+        connection.state = ConnectionState.CLOSED  # type: ignore
+        return True
+
     def release(self) -> None:
         with self.lock:
             conn = self.get_if_exists()
@@ -291,8 +532,10 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                 return
 
         try:
-            # always close the connection. close() calls _rollback() if there
-            # is an open transaction
+            if self._release_to_pool(conn):
+                return
+            # otherwise close the connection. close() calls _rollback() if
+            # there is an open transaction
             self.close(conn)
         except Exception:
             # if rollback or close failed, remove our busted connection
@@ -311,6 +554,13 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             # garbage collect these connections
             self.thread_connections.clear()
 
+        if self.pool is not None:
+            self.pool.close_all()
+        with self.lock:
+            warm_handles, self._warm_handles = self._warm_handles, None
+        if warm_handles is not None:
+            warm_handles.close_all()
+
     @abc.abstractmethod
     def begin(self) -> None:
         """Begin a transaction. (passable)"""
@@ -390,7 +640,8 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
     def _add_query_comment(self, sql: str) -> str:
         if self.query_header is None:
             return sql
-        return self.query_header.add(sql)
+        with profile_phase("comment"):
+            return self.query_header.add(sql)
 
     @abc.abstractmethod
     def execute(
@@ -412,6 +663,21 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("`execute` is not implemented for this adapter!")
 
+    def execute_streaming(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, StreamingResult]:
+        """Execute the given SQL and stream its results in batches of `batch_size` rows.
+
+        Adapters whose cursors can fetch incrementally should override this; by default the
+        result is fetched in full with `execute` and streamed from memory.
+        """
+        response, table = self.execute(sql, auto_begin=auto_begin, fetch=True, limit=limit)
+        return response, StreamingResult.from_table(table)
+
     def add_select_query(self, sql: str) -> Tuple[Connection, Any]:
         """
         This was added here because base.impl.BaseAdapter.get_column_schema_from_query expects it to be here.
@@ -1,12 +1,17 @@
 import abc
+import threading
 import time
+from collections.abc import Hashable
 from concurrent.futures import as_completed, Future
 from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from importlib import import_module
+import os
 from multiprocessing.context import SpawnContext
+from itertools import chain
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -16,6 +21,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -49,6 +55,7 @@ from dbt_common.exceptions import (
     NotImplementedError,
     UnexpectedNullError,
 )
+from dbt_common.invocation import get_invocation_id
 from dbt_common.record import auto_record_function, record_function, supports_replay
 from dbt_common.utils import (
     AttrDict,
@@ -56,6 +63,7 @@ from dbt_common.utils import (
     executor,
     filter_null_values,
 )
+from dbt_common.utils.formatting import lowercase
 
 from dbt.adapters.base.column import Column as BaseColumn
 from dbt.adapters.base.connections import (
@@ -64,6 +72,11 @@ from dbt.adapters.base.connections import (
     Connection,
 )
 from dbt.adapters.base.meta import AdapterMeta, available, available_property
+from dbt.adapters.base.results import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    StreamingResult,
+    agate_type_for_name,
+)
 from dbt.adapters.base.relation import (
     BaseRelation,
     ComponentName,
@@ -71,7 +84,11 @@ from dbt.adapters.base.relation import (
     SchemaSearchMap,
     AdapterTrackingRelationInfo,
 )
-from dbt.adapters.cache import RelationsCache, _make_ref_key_dict
+from dbt.adapters.cache import (
+    PersistedRelationsStore,
+    RelationsCache,
+    _make_ref_key_dict,
+)
 from dbt.adapters.capability import Capability, CapabilityDict
 from dbt.adapters.catalogs import (
     CatalogIntegration,
@@ -84,6 +101,7 @@ from dbt.adapters.contracts.macros import MacroResolverProtocol
 from dbt.adapters.contracts.relation import RelationConfig
 
 from dbt.adapters.events.types import (
+    AdapterEventDebug,
     CacheMiss,
     CatalogGenerationError,
     CodeExecution,
@@ -102,6 +120,7 @@ from dbt.adapters.exceptions import (
     SnapshotTargetNotSnapshotTableError,
     UnexpectedNonTimestampError,
 )
+from dbt.adapters.profiling import profile_phase
 from dbt.adapters.protocol import AdapterConfig, MacroContextGeneratorCallable
 
 if TYPE_CHECKING:
@@ -113,6 +132,7 @@ GET_CATALOG_RELATIONS_MACRO_NAME = "get_catalog_relations"
 FRESHNESS_MACRO_NAME = "collect_freshness"
 CUSTOM_SQL_FRESHNESS_MACRO_NAME = "collect_freshness_custom_sql"
 GET_RELATION_LAST_MODIFIED_MACRO_NAME = "get_relation_last_modified"
+RELATIONS_CACHE_FILE_NAME = "relations_cache.json"
 DEFAULT_BASE_BEHAVIOR_FLAGS = [
     {
         "name": "require_batched_execution_for_custom_microbatch_strategy",
@@ -140,32 +160,92 @@ def _parse_callback_empty_table(*args, **kwargs) -> Tuple[str, "agate.Table"]:
     return "", empty_table()
 
 
-def _expect_row_value(key: str, row: "agate.Row"):
-    if key not in row.keys():
-        raise DbtInternalError(
-            'Got a row without "{}" column, columns: {}'.format(key, row.keys())
-        )
-    return row[key]
+def _parse_callback_empty_stream(*args, **kwargs) -> Tuple[str, StreamingResult]:
+    return "", StreamingResult([], [])
+
+
+# catalog columns that are always text, even if their values look like numbers or nulls
+_CATALOG_TEXT_COLUMNS = frozenset(
+    {
+        "table_database",
+        "table_schema",
+        "table_name",
+        "table_type",
+        "table_comment",
+        "table_owner",
+        "column_name",
+        "column_type",
+        "column_comment",
+    }
+)
 
 
-def _catalog_filter_schemas(
-    used_schemas: FrozenSet[Tuple[str, str]]
-) -> Callable[["agate.Row"], bool]:
-    """Return a function that takes a row and decides if the row should be
-    included in the catalog output.
+def _catalog_key_part(value: Any) -> Optional[str]:
+    return None if value is None else str(value).casefold()
+
+
+def _catalog_rows_matching(
+    table: "agate.Table",
+    key_columns: Sequence[str],
+    keys: AbstractSet[Tuple[Optional[str], ...]],
+) -> List["agate.Row"]:
+    """Return the rows of a catalog table whose casefolded values in
+    key_columns are one of the (casefolded) keys. Catalogs repeat the same
+    database, schema and table for each column, so every distinct
+    combination of values is casefolded and looked up only once.
     """
-    schemas = frozenset((d.lower(), s.lower()) for d, s in used_schemas)
-
-    def test(row: "agate.Row") -> bool:
-        table_database = _expect_row_value("table_database", row)
-        table_schema = _expect_row_value("table_schema", row)
-        # the schema may be present but None, which is not an error and should
-        # be filtered out
-        if table_schema is None:
-            return False
-        return (table_database.lower(), table_schema.lower()) in schemas
+    indexes = []
+    for name in key_columns:
+        if name not in table.column_names:
+            raise DbtInternalError(
+                'Got a row without "{}" column, columns: {}'.format(name, table.column_names)
+            )
+        indexes.append(table.column_names.index(name))
+
+    matches: Dict[Tuple[Any, ...], bool] = {}
+    rows = []
+    for row in table.rows:
+        values = tuple(row[index] for index in indexes)
+        match = matches.get(values)
+        if match is None:
+            match = tuple(map(_catalog_key_part, values)) in keys
+            matches[values] = match
+        if match:
+            rows.append(row)
+    return rows
+
+
+def _catalog_table(
+    rows: List["agate.Row"], column_names: Sequence[str], column_types: Sequence[Any]
+) -> "agate.Table":
+    """Build a catalog table from rows of a table with the given columns,
+    forcing the columns in _CATALOG_TEXT_COLUMNS to text. Rows are only
+    copied if one of those columns was not text already.
+    """
+    import agate
 
-    return test
+    text = agate_type_for_name("TEXT")
+    to_text = [
+        index
+        for index, (name, column_type) in enumerate(zip(column_names, column_types))
+        if name in _CATALOG_TEXT_COLUMNS and not isinstance(column_type, agate.Text)
+    ]
+    if to_text:
+        keys = tuple(column_names)
+        rows = [agate.Row(_values_to_text(row, to_text), keys) for row in rows]
+    column_types = [
+        text if name in _CATALOG_TEXT_COLUMNS else column_type
+        for name, column_type in zip(column_names, column_types)
+    ]
+    return agate.Table(rows, column_names, column_types, _is_fork=True)
+
+
+def _values_to_text(row: "agate.Row", indexes: List[int]) -> List[Any]:
+    values = list(row.values())
+    for index in indexes:
+        if values[index] is not None:
+            values[index] = str(values[index])
+    return values
 
 
 def _utc(dt: Optional[datetime], source: Optional[BaseRelation], field_name: str) -> datetime:
@@ -184,6 +264,10 @@ def _utc(dt: Optional[datetime], source: Optional[BaseRelation], field_name: str
         return dt.replace(tzinfo=pytz.UTC)
 
 
+def _schema_marker_key(relation: BaseRelation) -> Tuple[Optional[str], Optional[str]]:
+    return lowercase(relation.database), lowercase(relation.schema)
+
+
 def _relation_name(rel: Optional[BaseRelation]) -> str:
     if rel is None:
         return "null relation"
@@ -234,6 +318,19 @@ class SnapshotStrategy(TypedDict):
     hard_deletes: Optional[str]
 
 
+class _MacroFunctions(threading.local):
+    """Each thread's macros, with the contexts built for them, by macro name,
+    project and resolver. Contexts are not shared across threads, since they
+    hold the results of the statements their macros run.
+    """
+
+    def __init__(self) -> None:
+        self.by_key: Dict[
+            Tuple[str, Optional[str], int],
+            Tuple[MacroResolverProtocol, CallableMacroGenerator],
+        ] = {}
+
+
 @supports_replay
 class BaseAdapter(metaclass=AdapterMeta):
     """The BaseAdapter provides an abstract base class for adapters.
@@ -298,7 +395,11 @@ class BaseAdapter(metaclass=AdapterMeta):
         ConstraintType.foreign_key: ConstraintSupport.ENFORCED,
     }
 
+    # The most relations to fetch the catalog of in one relation-scoped query.
     MAX_SCHEMA_METADATA_RELATIONS = 100
+    # The fixed cost of running one catalog query, counted in relations' worth of catalog
+    # rows, which is weighed against the rows a schema-wide scan fetches needlessly.
+    CATALOG_QUERY_COST = 100
 
     # This static member variable can be overridden in concrete adapter
     # implementations to indicate adapter support for optional capabilities.
@@ -310,8 +411,13 @@ class BaseAdapter(metaclass=AdapterMeta):
         self.connections = self.ConnectionManager(config, mp_context)
         self._macro_resolver: Optional[MacroResolverProtocol] = None
         self._macro_context_generator: Optional[MacroContextGeneratorCallable] = None
+        self._macro_functions = _MacroFunctions()
         self.behavior = DEFAULT_BASE_BEHAVIOR_FLAGS  # type: ignore
         self._catalog_client = CatalogIntegrationClient(self.CATALOG_INTEGRATIONS)
+        # the relations of nodes, built by relation_from_config for the invocation and quoting
+        # config in _relations_by_config_scope
+        self._relations_by_config: Dict[Hashable, BaseRelation] = {}
+        self._relations_by_config_scope: Optional[Tuple[Any, ...]] = None
 
     def add_catalog_integration(
         self, catalog_integration: CatalogIntegrationConfig
@@ -332,6 +438,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     ###
     def set_macro_resolver(self, macro_resolver: MacroResolverProtocol) -> None:
         self._macro_resolver = macro_resolver
+        self.clear_macro_functions()
 
     def get_macro_resolver(self) -> Optional[MacroResolverProtocol]:
         return self._macro_resolver
@@ -339,12 +446,18 @@ class BaseAdapter(metaclass=AdapterMeta):
     def clear_macro_resolver(self) -> None:
         if self._macro_resolver is not None:
             self._macro_resolver = None
+            self.clear_macro_functions()
 
     def set_macro_context_generator(
         self,
         macro_context_generator: MacroContextGeneratorCallable,
     ) -> None:
         self._macro_context_generator = macro_context_generator
+        self.clear_macro_functions()
+
+    def clear_macro_functions(self) -> None:
+        """Forget the macros and contexts cached by execute_macro, in every thread."""
+        self._macro_functions = _MacroFunctions()
 
     @available_property
     def behavior(self) -> Behavior:
@@ -382,6 +495,21 @@ class BaseAdapter(metaclass=AdapterMeta):
     def cleanup_connections(self) -> None:
         self.connections.cleanup_all()
 
+    @available
+    def warm_up_connections(
+        self, count: Optional[int] = None, parallelism: Optional[int] = None
+    ) -> List[float]:
+        """Open connections for the threads of the run ahead of time, e.g. from an
+        on-run-start hook. See BaseConnectionManager.warm_up.
+
+        :param count: How many connections to open, by default one per thread.
+        :param parallelism: How many connections to open at a time.
+        :return: The time taken by each handshake, in seconds.
+        """
+        if count is None:
+            count = self.config.threads
+        return self.connections.warm_up(count, parallelism)
+
     def clear_transaction(self) -> None:
         self.connections.clear_transaction()
 
@@ -437,6 +565,28 @@ class BaseAdapter(metaclass=AdapterMeta):
         """
         return self.connections.execute(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
 
+    @available.parse(_parse_callback_empty_stream)
+    def execute_streaming(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, StreamingResult]:
+        """Execute the given SQL and stream its results instead of loading them into a table.
+        This is a thin wrapper around ConnectionManager.execute_streaming.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param Optional[int] limit: If set, only fetch n number of rows
+        :param int batch_size: The number of rows to fetch from the warehouse at a time.
+        :return: A tuple of the query status and a StreamingResult over its rows.
+        """
+        return self.connections.execute_streaming(
+            sql=sql, auto_begin=auto_begin, limit=limit, batch_size=batch_size
+        )
+
     def validate_sql(self, sql: str) -> AdapterResponse:
         """Submit the given SQL to the engine for validation, but not execution.
 
@@ -516,14 +666,50 @@ class BaseAdapter(metaclass=AdapterMeta):
         else:
             return True
 
+    def relation_from_config(self, relation_config: RelationConfig) -> BaseRelation:
+        """The relation of a node, from `Relation.create_from` with the quoting
+        of the project. Relations are immutable, so each node's is built once
+        per invocation, under `Relation.create_from_key`, and shared, until the
+        quoting config changes or `clear_relations_by_config` is called.
+        """
+        key = self._relation_config_key(relation_config)
+        if key is None:
+            return self.Relation.create_from(quoting=self.config, relation_config=relation_config)
+        scope = (get_invocation_id(), tuple(sorted(self.config.quoting.items())))
+        if scope != self._relations_by_config_scope:
+            self.clear_relations_by_config()
+            self._relations_by_config_scope = scope
+        relation = self._relations_by_config.get(key)
+        if relation is None:
+            # threads may race to build the same relation, which is harmless
+            relation = self.Relation.create_from(
+                quoting=self.config, relation_config=relation_config
+            )
+            self._relations_by_config[key] = relation
+        return relation
+
+    def _relation_config_key(self, relation_config: RelationConfig) -> Optional[Hashable]:
+        relation_class = self.Relation
+        mro = relation_class.__mro__
+        defined_in = [
+            next(index for index, klass in enumerate(mro) if name in vars(klass))
+            for name in ("create_from", "create_from_key")
+        ]
+        # a create_from overridden below the key may read config that the key leaves out
+        if defined_in[0] < defined_in[1]:
+            return None
+        return relation_class.create_from_key(relation_config)
+
+    def clear_relations_by_config(self) -> None:
+        """Forget the relations built by `relation_from_config`."""
+        self._relations_by_config = {}
+
     def _get_cache_schemas(self, relation_configs: Iterable[RelationConfig]) -> Set[BaseRelation]:
         """Get the set of schema relations that the cache logic needs to
         populate.
         """
         return {
-            self.Relation.create_from(
-                quoting=self.config, relation_config=relation_config
-            ).without_identifier()
+            self.relation_from_config(relation_config).without_identifier()
             for relation_config in relation_configs
         }
 
@@ -562,8 +748,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         self, relation_configs: Iterable[RelationConfig]
     ) -> List[BaseRelation]:
         relations = [
-            self.Relation.create_from(quoting=self.config, relation_config=relation_config)
-            for relation_config in relation_configs
+            self.relation_from_config(relation_config) for relation_config in relation_configs
         ]
         return relations
 
@@ -571,28 +756,77 @@ class BaseAdapter(metaclass=AdapterMeta):
         self,
         relation_configs: Iterable[RelationConfig],
         cache_schemas: Optional[Set[BaseRelation]] = None,
+        clear: bool = False,
     ) -> None:
-        """Populate the relations cache for the given schemas. Returns an
-        iterable of the schemas populated, as strings.
+        """Populate the relations cache for the given schemas, replacing its
+        contents if `clear` is set.
+
+        The schemas are listed without holding the cache lock, so other
+        threads can keep reading the cache while the warehouse is queried. The
+        lock is only taken to insert the results.
         """
         if not cache_schemas:
             cache_schemas = self._get_cache_schemas(relation_configs)
-        with executor(self.config) as tpe:
-            futures: List[Future[List[BaseRelation]]] = []
+        relations: List[BaseRelation] = []
+
+        store = self._persisted_relations_store()
+        markers: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        schemas_to_list: List[BaseRelation] = list(cache_schemas)
+        if store is not None:
+            markers = self.get_relations_cache_markers(cache_schemas)
+            schemas_to_list = []
             for cache_schema in cache_schemas:
+                stored = store.get(
+                    cache_schema.database,
+                    cache_schema.schema,
+                    markers.get(_schema_marker_key(cache_schema)),
+                )
+                if stored is None:
+                    schemas_to_list.append(cache_schema)
+                    fire_event(
+                        CacheMiss(
+                            conn_name=self.nice_connection_name(),
+                            database=cast_to_str(cache_schema.database),
+                            schema=cast_to_str(cache_schema.schema),
+                        )
+                    )
+                else:
+                    relations.extend(self.Relation.from_dict(r) for r in stored)
+            fire_event(
+                AdapterEventDebug(
+                    name=self.type(),
+                    base_msg="Persisted relations cache: {} schema(s) reused, {} listed",
+                    args=[len(cache_schemas) - len(schemas_to_list), len(schemas_to_list)],
+                )
+            )
+
+        with executor(self.config) as tpe:
+            futures: Dict[Future[List[BaseRelation]], BaseRelation] = {}
+            for cache_schema in schemas_to_list:
                 fut = tpe.submit_connected(
                     self,
                     f"list_{cache_schema.database}_{cache_schema.schema}",
                     self.list_relations_without_caching,
                     cache_schema,
                 )
-                futures.append(fut)
+                futures[fut] = cache_schema
 
             for future in as_completed(futures):
                 # if we can't read the relations we need to just raise anyway,
                 # so just call future.result() and let that raise on failure
-                for relation in future.result():
-                    self.cache.add(relation)
+                listed = future.result()
+                relations.extend(listed)
+                if store is not None:
+                    cache_schema = futures[future]
+                    store.put(
+                        cache_schema.database,
+                        cache_schema.schema,
+                        markers.get(_schema_marker_key(cache_schema)),
+                        (r.to_dict(omit_none=True) for r in listed),
+                    )
+
+        if store is not None:
+            store.save()
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
@@ -601,7 +835,40 @@ class BaseAdapter(metaclass=AdapterMeta):
         for relation in cache_schemas:
             if relation.schema:
                 cache_update.add((relation.database, relation.schema))
-        self.cache.update_schemas(cache_update)
+        self.cache.add_relations(relations, cache_update, clear=clear)
+
+    def _persisted_relations_store(self) -> Optional[PersistedRelationsStore]:
+        """Return the on-disk store of schema listings, or None if it is not
+        enabled. It is enabled by setting `relations_cache_ttl` (in seconds) on
+        adapters whose credentials support it.
+        """
+        ttl = getattr(self.config.credentials, "relations_cache_ttl", None)
+        if not ttl:
+            return None
+        path = os.path.join(
+            getattr(self.config, "project_root", ""),
+            self.config.target_path,
+            RELATIONS_CACHE_FILE_NAME,
+        )
+        return PersistedRelationsStore(
+            path, self.config.profile_name, self.config.target_name, ttl
+        )
+
+    def get_relations_cache_markers(
+        self, schemas: Iterable[BaseRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        """Get a warehouse-side change marker for each of the given schemas.
+        (passable)
+
+        A marker is an opaque string that must change whenever relations are
+        created, dropped or renamed in the schema. Listings of a schema are
+        only reused from the persisted relations cache while its marker is
+        unchanged, so schemas without a marker are always listed again.
+
+        :param schemas: The schema relations to get markers for.
+        :return: A mapping of lowercased (database, schema) pairs to markers.
+        """
+        return {}
 
     def set_relations_cache(
         self,
@@ -612,10 +879,8 @@ class BaseAdapter(metaclass=AdapterMeta):
         """Run a query that gets a populated cache of the relations in the
         database and set the cache on this adapter.
         """
-        with self.cache.lock:
-            if clear:
-                self.cache.clear()
-            self._relations_cache_for_schemas(relation_configs, required_schemas)
+        with profile_phase("cache"):
+            self._relations_cache_for_schemas(relation_configs, required_schemas, clear=clear)
 
     @auto_record_function("AdapterCacheAdded", group="Available")
     @available
@@ -1247,6 +1512,41 @@ class BaseAdapter(metaclass=AdapterMeta):
         if resolver is None:
             raise DbtInternalError("Macro resolver was None when calling execute_macro!")
 
+        if context_override:
+            macro_function = self._build_macro_function(
+                macro_name, resolver, project, context_override
+            )
+        else:
+            # the macro and its context are built once per thread, and reused while the
+            # resolver and the context generator stay the same
+            functions = self._macro_functions.by_key
+            key = (macro_name, project, id(resolver))
+            cached = functions.get(key)
+            if cached is None or cached[0] is not resolver:
+                cached = (resolver, self._build_macro_function(macro_name, resolver, project))
+                functions[key] = cached
+            macro_function = cached[1]
+            # only the macro is reused: each call starts without the statement results of the
+            # previous ones, as it would with a context of its own
+            sql_results = (macro_function.context or {}).get("_sql_results")
+            if sql_results:
+                sql_results.clear()
+
+        if needs_conn:
+            connection = self.connections.get_thread_connection()
+            self.connections.open(connection)
+
+        with self.connections.exception_handler(f"macro {macro_name}"):
+            result = macro_function(**kwargs)
+        return result
+
+    def _build_macro_function(
+        self,
+        macro_name: str,
+        resolver: MacroResolverProtocol,
+        project: Optional[str],
+        context_override: Optional[Dict[str, Any]] = None,
+    ) -> CallableMacroGenerator:
         if self._macro_context_generator is None:
             raise DbtInternalError("Macro context generator was None when calling execute_macro!")
 
@@ -1264,17 +1564,10 @@ class BaseAdapter(metaclass=AdapterMeta):
             )
 
         macro_context = self._macro_context_generator(macro, self.config, resolver, project)
-        macro_context.update(context_override)
-
-        macro_function = CallableMacroGenerator(macro, macro_context)
-
-        if needs_conn:
-            connection = self.connections.get_thread_connection()
-            self.connections.open(connection)
+        if context_override:
+            macro_context.update(context_override)
 
-        with self.connections.exception_handler(f"macro {macro_name}"):
-            result = macro_function(**kwargs)
-        return result
+        return CallableMacroGenerator(macro, macro_context)
 
     @classmethod
     def _catalog_filter_table(
@@ -1283,25 +1576,10 @@ class BaseAdapter(metaclass=AdapterMeta):
         """Filter the table as appropriate for catalog entries. Subclasses can
         override this to change filtering rules on a per-adapter basis.
         """
-        from dbt_common.clients.agate_helper import table_from_rows
-
+        schemas = {(_catalog_key_part(d), _catalog_key_part(s)) for d, s in used_schemas}
+        rows = _catalog_rows_matching(table, ("table_database", "table_schema"), schemas)
         # force database + schema to be strings
-        table = table_from_rows(
-            table.rows,
-            table.column_names,
-            text_only_columns=[
-                "table_database",
-                "table_schema",
-                "table_name",
-                "table_type",
-                "table_comment",
-                "table_owner",
-                "column_name",
-                "column_type",
-                "column_comment",
-            ],
-        )
-        return table.where(_catalog_filter_schemas(used_schemas))
+        return _catalog_table(rows, table.column_names, table.column_types)
 
     def _get_one_catalog(
         self,
@@ -1337,11 +1615,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         relations: Optional[Set[BaseRelation]] = None,
     ):
         catalogs: "agate.Table"
-        if (
-            relations is None
-            or len(relations) > self.MAX_SCHEMA_METADATA_RELATIONS
-            or not self.supports(Capability.SchemaMetadataByRelations)
-        ):
+        if relations is None or not self.supports(Capability.SchemaMetadataByRelations):
             # Do it the traditional way. We get the full catalog.
             catalogs, exceptions = self.get_catalog(relation_configs, used_schemas)
         else:
@@ -1350,25 +1624,18 @@ class BaseAdapter(metaclass=AdapterMeta):
             catalogs, exceptions = self.get_catalog_by_relations(used_schemas, relations)
 
         if relations and catalogs:
-            relation_map = {
+            relation_keys = {
                 (
-                    r.database.casefold() if r.database else None,
-                    r.schema.casefold() if r.schema else None,
-                    r.identifier.casefold() if r.identifier else None,
+                    _catalog_key_part(r.database),
+                    _catalog_key_part(r.schema),
+                    _catalog_key_part(r.identifier),
                 )
                 for r in relations
             }
-
-            def in_map(row: "agate.Row"):
-                d = _expect_row_value("table_database", row)
-                s = _expect_row_value("table_schema", row)
-                i = _expect_row_value("table_name", row)
-                d = d.casefold() if d is not None else None
-                s = s.casefold() if s is not None else None
-                i = i.casefold() if i is not None else None
-                return (d, s, i) in relation_map
-
-            catalogs = catalogs.where(in_map)
+            rows = _catalog_rows_matching(
+                catalogs, ("table_database", "table_schema", "table_name"), relation_keys
+            )
+            catalogs = _catalog_table(rows, catalogs.column_names, catalogs.column_types)
 
         return catalogs, exceptions
 
@@ -1395,21 +1662,84 @@ class BaseAdapter(metaclass=AdapterMeta):
         catalogs, exceptions = catch_as_completed(futures)
         return catalogs, exceptions
 
+    def _estimate_schema_relation_count(
+        self, database: Optional[str], schema: Optional[str]
+    ) -> Optional[int]:
+        """Estimate how many relations are in a schema, or return None if
+        that is unknown. The default uses the relations cache.
+        """
+        if schema is None or (database, schema) not in self.cache:
+            return None
+        return len(self.cache.get_relations(database, schema))
+
+    def _plan_catalog_by_relations(
+        self, relations: Iterable[BaseRelation]
+    ) -> Tuple[SchemaSearchMap, List[Tuple[InformationSchema, List[BaseRelation]]]]:
+        """Decide how to fetch the catalog of the given relations.
+
+        A schema is scanned as a whole only if that is estimated to be
+        cheaper than selecting its relations, that is, if few catalog rows
+        are fetched needlessly compared to the queries saved. The remaining
+        relations are split into batches of at most
+        MAX_SCHEMA_METADATA_RELATIONS per information schema.
+
+        :return: The schemas to scan, by information schema, and the
+            batches of relations to select.
+        """
+        relations_by_schema: Dict[Tuple[InformationSchema, Optional[str]], List[BaseRelation]] = {}
+        for relation in relations:
+            schema = relation.schema.lower() if relation.schema is not None else None
+            key = (relation.information_schema_only(), schema)
+            relations_by_schema.setdefault(key, []).append(relation)
+
+        batch_size = self.MAX_SCHEMA_METADATA_RELATIONS
+        schema_scans = SchemaSearchMap()
+        selected: Dict[InformationSchema, List[BaseRelation]] = {}
+        for (info_schema, _), schema_relations in relations_by_schema.items():
+            first = schema_relations[0]
+            estimated = self._estimate_schema_relation_count(first.database, first.schema)
+            wanted = len(schema_relations)
+            selecting_cost = wanted + self.CATALOG_QUERY_COST * wanted / batch_size
+            if estimated is not None and estimated + self.CATALOG_QUERY_COST < selecting_cost:
+                schema_scans.add(first)
+            else:
+                selected.setdefault(info_schema, []).extend(schema_relations)
+
+        batches = [
+            (info_schema, info_relations[start : start + batch_size])
+            for info_schema, info_relations in selected.items()
+            for start in range(0, len(info_relations), batch_size)
+        ]
+        return schema_scans, batches
+
     def get_catalog_by_relations(
         self, used_schemas: FrozenSet[Tuple[str, str]], relations: Set[BaseRelation]
     ) -> Tuple["agate.Table", List[Exception]]:
+        schema_scans, batches = self._plan_catalog_by_relations(relations)
+        fire_event(
+            AdapterEventDebug(
+                name=self.type(),
+                base_msg="Catalog of {} relation(s): {} schema scan(s), {} relation batch(es)",
+                args=[len(relations), sum(map(len, schema_scans.values())), len(batches)],
+            )
+        )
+
         with executor(self.config) as tpe:
             futures: List[Future["agate.Table"]] = []
-            relations_by_schema = self._get_catalog_relations_by_info_schema(relations)
-            for info_schema in relations_by_schema:
+            for info_schema, schemas in schema_scans.items():
+                name = ".".join([str(info_schema.database), "information_schema"])
+                fut = tpe.submit_connected(
+                    self, name, self._get_one_catalog, info_schema, schemas, used_schemas
+                )
+                futures.append(fut)
+            for info_schema, batch in batches:
                 name = ".".join([str(info_schema.database), "information_schema"])
-                relations = set(relations_by_schema[info_schema])
                 fut = tpe.submit_connected(
                     self,
                     name,
                     self._get_one_catalog_by_relations,
                     info_schema,
-                    relations,
+                    batch,
                     used_schemas,
                 )
                 futures.append(fut)
@@ -1981,8 +2311,6 @@ join diff_count using (id)
 def catch_as_completed(
     futures,  # typing: List[Future["agate.Table"]]
 ) -> Tuple["agate.Table", List[Exception]]:
-    from dbt_common.clients.agate_helper import merge_tables
-
     # catalogs: "agate.Table" =".Table(rows=[])
     tables: List["agate.Table"] = []
     exceptions: List[Exception] = []
@@ -1999,4 +2327,24 @@ def catch_as_completed(
             warn_or_error(CatalogGenerationError(exc=str(exc)))
             # exc is not None, derives from Exception, and isn't ctrl+c
             exceptions.append(exc)
-    return merge_tables(tables), exceptions
+    return _merge_tables(tables), exceptions
+
+
+def _merge_tables(tables: List["agate.Table"]) -> "agate.Table":
+    """Merge tables like merge_tables does. If all the tables have the same
+    columns, of the same types, their rows are concatenated without copying.
+    """
+    import agate
+    from dbt_common.clients.agate_helper import merge_tables
+
+    if not tables:
+        return merge_tables(tables)
+    first = tables[0]
+    first_types = [type(column_type) for column_type in first.column_types]
+    for table in tables[1:]:
+        if table.column_names != first.column_names or first_types != [
+            type(column_type) for column_type in table.column_types
+        ]:
+            return merge_tables(tables)
+    rows = list(chain.from_iterable(table.rows for table in tables))
+    return agate.Table(rows, first.column_names, first.column_types, _is_fork=True)
@@ -1,7 +1,9 @@
 from threading import local
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from dbt_common.clients.jinja import get_environment
 from dbt_common.exceptions import DbtRuntimeError
+from jinja2 import nodes, Undefined
 
 from dbt.adapters.clients.jinja import QueryStringGenerator
 from dbt.adapters.contracts.connection import AdapterRequiredConfig, QueryComment
@@ -23,9 +25,21 @@ class _QueryComment(local):
     """
 
     def __init__(self, initial) -> None:
-        self.query_comment: Optional[str] = initial
+        self.query_comment = initial
         self.append: bool = False
 
+    @property
+    def query_comment(self) -> Optional[str]:
+        return self._query_comment
+
+    @query_comment.setter
+    def query_comment(self, comment: Optional[str]) -> None:
+        self._query_comment = comment
+        # the comment is added to every statement, so it is only formatted once
+        stripped = comment.strip() if comment else ""
+        self._prefix = f"/* {stripped} */\n"
+        self._suffix = f"\n/* {stripped} */"
+
     def add(self, sql: str) -> str:
         if not self.query_comment:
             return sql
@@ -34,12 +48,11 @@ class _QueryComment(local):
             # replace last ';' with '<comment>;'
             sql = sql.rstrip()
             if sql[-1] == ";":
-                sql = sql[:-1]
-                return "{}\n/* {} */;".format(sql, self.query_comment.strip())
+                return sql[:-1] + self._suffix + ";"
 
-            return "{}\n/* {} */".format(sql, self.query_comment.strip())
+            return sql + self._suffix
 
-        return "/* {} */\n{}".format(self.query_comment.strip(), sql)
+        return self._prefix + sql
 
     def set(self, comment: Optional[str], append: bool):
         if isinstance(comment, str) and "*/" in comment:
@@ -53,6 +66,91 @@ class _QueryComment(local):
 QueryStringFunc = Callable[[str, Optional[QueryHeaderContextWrapper]], str]
 
 
+def _lookup_path(node: nodes.Node) -> Optional[Tuple[str, ...]]:
+    """The names and attributes of an expression like `target.name` or
+    `node['unique_id']`, or None for any other expression.
+    """
+    if isinstance(node, nodes.Name):
+        return (node.name,)
+    if isinstance(node, nodes.Getattr):
+        parent = _lookup_path(node.node)
+        return None if parent is None else parent + (node.attr,)
+    if (
+        isinstance(node, nodes.Getitem)
+        and isinstance(node.arg, nodes.Const)
+        and isinstance(node.arg.value, str)
+    ):
+        parent = _lookup_path(node.node)
+        return None if parent is None else parent + (node.arg.value,)
+    return None
+
+
+class StaticQueryString:
+    """A query comment macro compiled into a format string, for macros that
+    only output text and the values of names and their attributes, so that
+    rendering it does not go through Jinja. It renders what the macro would.
+    """
+
+    def __init__(
+        self, macro: str, template: str, lookups: List[Tuple[str, ...]], context: Dict[str, Any]
+    ) -> None:
+        self.macro = macro
+        self.template = template
+        self.lookups = lookups
+        self.context = context
+        self._environment = get_environment()
+
+    @classmethod
+    def compile(cls, macro: str, context: Dict[str, Any]) -> Optional["StaticQueryString"]:
+        """Compile the query_comment_macro in macro, or return None if it
+        does more than output values.
+        """
+        parsed = get_environment().parse(macro)
+        if len(parsed.body) != 1 or not isinstance(parsed.body[0], nodes.Macro):
+            return None
+        parts: List[str] = []
+        lookups: List[Tuple[str, ...]] = []
+        for output in parsed.body[0].body:
+            if not isinstance(output, nodes.Output):
+                return None
+            for node in output.nodes:
+                if isinstance(node, nodes.TemplateData):
+                    text = node.data
+                elif isinstance(node, nodes.Const):
+                    text = str(node.value)
+                else:
+                    path = _lookup_path(node)
+                    if path is None:
+                        return None
+                    parts.append("{%d}" % len(lookups))
+                    lookups.append(path)
+                    continue
+                parts.append(text.replace("{", "{{").replace("}", "}}"))
+        return cls(macro, "".join(parts), lookups, context)
+
+    def _resolve(self, path: Tuple[str, ...], names: Dict[str, Any]) -> str:
+        name, *attributes = path
+        if name in names:
+            value = names[name]
+        elif name in self.context:
+            value = self.context[name]
+        else:
+            value = self._environment.undefined(name=name)
+        for attribute in attributes:
+            # the same lookup as Jinja's: an attribute, or else an item
+            value = self._environment.getattr(value, attribute)
+        return "" if isinstance(value, Undefined) else str(value)
+
+    def __call__(self, connection_name: str, node: Optional[QueryHeaderContextWrapper]) -> str:
+        names = {"connection_name": connection_name, "node": node}
+        try:
+            values = [self._resolve(path, names) for path in self.lookups]
+        except Exception:
+            # e.g. an attribute of an undefined name: let Jinja raise its error
+            return QueryStringGenerator(self.macro, self.context)(connection_name, node)
+        return self.template.format(*values)
+
+
 class MacroQueryStringSetter:
     DEFAULT_QUERY_COMMENT_APPEND = False
 
@@ -75,7 +173,11 @@ class MacroQueryStringSetter:
                 )
             )
             ctx = self._get_context()
-            self.generator = QueryStringGenerator(macro, ctx)
+            self.generator = StaticQueryString.compile(macro, ctx) or QueryStringGenerator(
+                macro, ctx
+            )
+        # rendered comments by connection name and node, for the contexts of nodes
+        self._comments: Dict[Tuple[str, Any], str] = {}
         self.comment = _QueryComment(None)
         self.reset()
 
@@ -92,10 +194,17 @@ class MacroQueryStringSetter:
         self.set("master", None)
 
     def set(self, name: str, query_header_context: Any):
-        wrapped: Optional[QueryHeaderContextWrapper] = None
-        if query_header_context is not None:
-            wrapped = QueryHeaderContextWrapper(query_header_context)
-        comment_str = self.generator(name, wrapped)
+        # the comment for a node only depends on the node, which is identified by its unique_id
+        node_id = getattr(query_header_context, "unique_id", None)
+        key = (name, node_id)
+        comment_str = self._comments.get(key)
+        if comment_str is None:
+            wrapped: Optional[QueryHeaderContextWrapper] = None
+            if query_header_context is not None:
+                wrapped = QueryHeaderContextWrapper(query_header_context)
+            comment_str = self.generator(name, wrapped)
+            if query_header_context is None or node_id is not None:
+                self._comments[key] = comment_str
 
         append = self.DEFAULT_QUERY_COMMENT_APPEND
         if (
@@ -1,8 +1,12 @@
 from collections.abc import Hashable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import (
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Iterator,
@@ -38,6 +42,39 @@ Self = TypeVar("Self", bound="BaseRelation")
 SerializableIterable = Union[Tuple, FrozenSet]
 
 
+# the fields of a relation that hold its path and policies, which are keyed by their parts
+_KEYED_FIELDS = frozenset({"path", "include_policy", "quote_policy"})
+
+
+@lru_cache(maxsize=None)
+def _other_fields_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+    return attrgetter(*(f.name for f in fields(cls) if f.name not in _KEYED_FIELDS))
+
+
+# types of field values that are hashable as they are
+_PLAIN_TYPES = frozenset({type(None), str, bool, int, frozenset})
+
+
+def _identity_value(value: Any) -> Hashable:
+    """A hashable form of a field value, equal for equal values."""
+    if type(value) in _PLAIN_TYPES:
+        return value
+    if is_dataclass(value):
+        return (type(value),) + tuple(
+            _identity_value(getattr(value, f.name)) for f in fields(value)
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_identity_value(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_identity_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _identity_value(v)) for k, v in value.items()))
+    if isinstance(value, Enum):
+        # relation types are string enums, which compare equal to their values
+        return value.value
+    return value
+
+
 @dataclass
 class EventTimeFilter(FakeAPIObject):
     field_name: str
@@ -88,10 +125,50 @@ class BaseRelation(FakeAPIObject, Hashable):
         # this should be unreachable
         raise ValueError(f"BaseRelation has no {field_name} field!")
 
+    def _identity(self) -> Tuple[Hashable, int]:
+        """The values of the fields of the relation, and their hash. Relations
+        are immutable, so both are computed once and kept on the instance.
+        """
+        try:
+            return self.__dict__["_identity_cache"]
+        except KeyError:
+            path, include, quote = self.path, self.include_policy, self.quote_policy
+            key = (
+                path.database,
+                path.schema,
+                path.identifier,
+                include.database,
+                include.schema,
+                include.identifier,
+                quote.database,
+                quote.schema,
+                quote.identifier,
+            ) + tuple(
+                [
+                    value if type(value) in _PLAIN_TYPES else _identity_value(value)
+                    for value in _other_fields_getter(type(self))(self)
+                ]
+            )
+            identity = (key, hash(key))
+            object.__setattr__(self, "_identity_cache", identity)
+            return identity
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the identity and rendering are recomputed after unpickling, since string hashes differ
+        # from one process to the next
+        state = self.__dict__.copy()
+        state.pop("_identity_cache", None)
+        state.pop("_render_cache", None)
+        return state
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
-        return self.to_dict(omit_none=True) == other.to_dict(omit_none=True)
+        key, hash_ = self._identity()
+        other_key, other_hash = other._identity()
+        return hash_ == other_hash and key == other_key
 
     @classmethod
     def get_default_quote_policy(cls) -> Policy:
@@ -199,8 +276,6 @@ class BaseRelation(FakeAPIObject, Hashable):
         set to included. To get the appropriately-quoted form the schema out of
         the result (for use as part of a query), use `.render()`. To get the
         raw database or schema name, use `.database` or `.schema`.
-
-        The hash of the returned object is the result of render().
         """
         return self.include(identifier=False).replace_path(identifier=None)
 
@@ -216,8 +291,16 @@ class BaseRelation(FakeAPIObject, Hashable):
             yield key, path_part
 
     def render(self) -> str:
+        # the rendering is kept with the quoting and policies it was rendered with, since some
+        # adapters swap them on the relation for a moment to render it differently
+        key = (self.quote_character, self.include_policy, self.quote_policy)
+        cached = self.__dict__.get("_render_cache")
+        if cached is not None and cached[0] == key:
+            return cached[1]
         # if there is nothing set, this will return the empty string.
-        return ".".join(part for _, part in self._render_iterator() if part is not None)
+        rendered = ".".join(part for _, part in self._render_iterator() if part is not None)
+        object.__setattr__(self, "_render_cache", (key, rendered))
+        return rendered
 
     def _render_subquery_alias(self, namespace: str) -> str:
         """Some databases require an alias for subqueries (postgres, mysql) for all others we want to avoid adding
@@ -307,11 +390,7 @@ class BaseRelation(FakeAPIObject, Hashable):
         config_quoting = relation_config.quoting_dict
         config_quoting.pop("column", None)
 
-        catalog_name = (
-            relation_config.catalog_name
-            if hasattr(relation_config, "catalog_name")
-            else relation_config.config.get("catalog", None)  # type: ignore
-        )
+        catalog_name = cls._catalog_name_from(relation_config)
 
         # precedence: kwargs quoting > relation config quoting > base quoting > default quoting
         quote_policy = deep_merge(
@@ -330,6 +409,31 @@ class BaseRelation(FakeAPIObject, Hashable):
             **kwargs,
         )
 
+    @classmethod
+    def create_from_key(cls, relation_config: RelationConfig) -> Optional[Hashable]:
+        """A key of everything `create_from` reads from relation_config, under
+        which `BaseAdapter.relation_from_config` builds the relation of a node
+        once per invocation. Relations whose `create_from` reads more of the
+        config have to extend the key with it, or return None to have their
+        relations built every time.
+        """
+        return (
+            getattr(relation_config, "unique_id", None),
+            relation_config.database,
+            relation_config.schema,
+            relation_config.identifier,
+            tuple(sorted(relation_config.quoting_dict.items())),
+            cls._catalog_name_from(relation_config),
+        )
+
+    @staticmethod
+    def _catalog_name_from(relation_config: RelationConfig) -> Optional[str]:
+        return (
+            relation_config.catalog_name
+            if hasattr(relation_config, "catalog_name")
+            else relation_config.config.get("catalog", None)  # type: ignore
+        )
+
     @classmethod
     def create(
         cls: Type[Self],
@@ -373,7 +477,7 @@ class BaseRelation(FakeAPIObject, Hashable):
         return "<{} {}>".format(self.__class__.__name__, self.render())
 
     def __hash__(self) -> int:
-        return hash(self.render())
+        return self._identity()[1]
 
     def __str__(self) -> str:
         rendered = self.render() if self.limit is None else self.render_limited()
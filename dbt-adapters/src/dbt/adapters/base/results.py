@@ -0,0 +1,357 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+import pytz
+
+if TYPE_CHECKING:
+    import agate
+    import pyarrow
+
+
+# rows per fetchmany call: keeps memory flat while amortizing round trips
+DEFAULT_FETCH_BATCH_SIZE = 10000
+
+Row = Sequence[Any]
+Fetch = Callable[[int], Sequence[Row]]
+
+
+def dedupe_column_names(column_names: Iterable[str]) -> List[str]:
+    """Suffix repeated column names with their occurrence count, e.g. a, a -> a, a_2."""
+    seen: Dict[str, int] = {}
+    unique_names = []
+    for name in column_names:
+        if name in seen:
+            seen[name] += 1
+            unique_names.append(f"{name}_{seen[name]}")
+        else:
+            seen[name] = 1
+            unique_names.append(name)
+    return unique_names
+
+
+# driver type names whose values can be loaded into agate as they are, without inference.
+# json, arrays, intervals and times are missing on purpose: those are stringified today.
+_INTEGER_TYPE_NAMES = {
+    "INTEGER",
+    "LONGINTEGER",
+    "INT",
+    "INT2",
+    "INT4",
+    "INT8",
+    "SMALLINT",
+    "BIGINT",
+}
+_NUMBER_TYPE_NAMES = {"DECIMAL", "NUMERIC", "FLOAT", "FLOAT4", "FLOAT8", "DOUBLE", "REAL"}
+_TEXT_TYPE_NAMES = {"STRING", "TEXT", "VARCHAR", "CHAR", "BPCHAR", "NAME", "UNICODE"}
+_BOOLEAN_TYPE_NAMES = {"BOOLEAN", "BOOL"}
+_DATE_TYPE_NAMES = {"DATE"}
+_DATETIME_TYPE_NAMES = {
+    "DATETIME",
+    "DATETIMETZ",
+    "TIMESTAMP",
+    "TIMESTAMPTZ",
+    "TIMESTAMP_NTZ",
+    "TIMESTAMP_LTZ",
+    "TIMESTAMP_TZ",
+}
+
+
+@lru_cache(maxsize=None)
+def _agate_types_by_name() -> Dict[str, "agate.data_types.DataType"]:
+    import agate
+    from dbt_common.clients.agate_helper import Integer, Number
+
+    # the same types the default type tester would infer for these values
+    null_values = ("null", "")
+    types: Dict[str, agate.data_types.DataType] = {}
+    for names, data_type in [
+        (_INTEGER_TYPE_NAMES, Integer(null_values=null_values)),
+        (_NUMBER_TYPE_NAMES, Number(null_values=null_values)),
+        (_TEXT_TYPE_NAMES, agate.data_types.Text(null_values=())),
+        (_BOOLEAN_TYPE_NAMES, agate.data_types.Boolean(null_values=null_values)),
+        (_DATE_TYPE_NAMES, agate.data_types.Date(null_values=null_values)),
+        (
+            _DATETIME_TYPE_NAMES,
+            agate.data_types.DateTime(
+                null_values=null_values, datetime_format="%Y-%m-%d %H:%M:%S"
+            ),
+        ),
+    ]:
+        types.update(dict.fromkeys(names, data_type))
+    return types
+
+
+def agate_type_for_name(type_name: str) -> Optional["agate.data_types.DataType"]:
+    """The agate type for values the driver returns for columns of the given type name, or
+    None if their type has to be inferred from the values.
+    """
+    return _agate_types_by_name().get(type_name.upper())
+
+
+def _value_converter(column_type: "agate.data_types.DataType") -> Optional[Callable[[Any], Any]]:
+    """How to convert the values of a column of `column_type` to the ones inference would load,
+    or None if the driver's values are loaded as they are. Drivers return floats for Number
+    columns (e.g. of type FLOAT or REAL) and may return 0 and 1 for Boolean ones.
+    """
+    import agate
+
+    if isinstance(column_type, agate.data_types.Number):
+        loaded: type = Decimal
+    elif isinstance(column_type, agate.data_types.Boolean):
+        loaded = bool
+    else:
+        return None
+    cast = column_type.cast
+    return lambda value: value if value is None or type(value) is loaded else cast(value)
+
+
+def table_from_typed_rows(
+    rows: Iterable[Row],
+    column_names: Sequence[str],
+    column_types: Sequence["agate.data_types.DataType"],
+) -> "agate.Table":
+    """Build an agate table from rows whose values are of `column_types`.
+
+    Unlike `table_from_data_flat`, this skips building a dict per row and agate's per-cell type
+    inference: each row is kept as a tuple of the driver's values, keyed by one shared tuple of
+    column names. Only the values of Number and Boolean columns are cast, so that they are the
+    same as inferred ones (e.g. Decimal rather than float).
+    """
+    import agate
+
+    converters = [_value_converter(column_type) for column_type in column_types]
+    if any(converters):
+        rows = (
+            tuple(
+                value if convert is None else convert(value)
+                for value, convert in zip(row, converters)
+            )
+            for row in rows
+        )
+    keys = tuple(column_names)
+    return agate.Table(
+        [agate.Row(tuple(row), keys) for row in rows], keys, column_types, _is_fork=True
+    )
+
+
+@lru_cache(maxsize=None)
+def arrow_available() -> bool:
+    """Whether pyarrow is installed, so that results can be fetched as Arrow record batches."""
+    return find_spec("pyarrow") is not None
+
+
+def _agate_type_for_arrow(arrow_type: "pyarrow.DataType") -> Optional["agate.data_types.DataType"]:
+    import pyarrow
+
+    if pyarrow.types.is_integer(arrow_type):
+        return agate_type_for_name("INTEGER")
+    if pyarrow.types.is_floating(arrow_type) or pyarrow.types.is_decimal(arrow_type):
+        return agate_type_for_name("DECIMAL")
+    if pyarrow.types.is_string(arrow_type) or pyarrow.types.is_large_string(arrow_type):
+        return agate_type_for_name("TEXT")
+    if pyarrow.types.is_boolean(arrow_type):
+        return agate_type_for_name("BOOLEAN")
+    if pyarrow.types.is_date(arrow_type):
+        return agate_type_for_name("DATE")
+    if pyarrow.types.is_timestamp(arrow_type):
+        return agate_type_for_name("TIMESTAMP")
+    return None
+
+
+@lru_cache(maxsize=None)
+def _fixed_offset(seconds: int) -> Any:
+    return pytz.FixedOffset(seconds // 60)
+
+
+def _arrow_column_values(column: "pyarrow.ChunkedArray") -> List[Any]:
+    """Convert an Arrow column to Python values. Floating point values become Decimals.
+    Timezone-aware timestamps are shifted to their local wall-clock time and get a fixed-offset
+    tzinfo, computed for the whole column at once rather than converting each datetime.
+    """
+    import pyarrow
+    import pyarrow.compute
+
+    if pyarrow.types.is_floating(column.type):
+        # like agate's Number.cast, so the values are the same as inferred ones
+        return [None if value is None else Decimal(repr(value)) for value in column.to_pylist()]
+    if not pyarrow.types.is_timestamp(column.type) or column.type.tz is None:
+        return column.to_pylist()
+    if not hasattr(pyarrow.compute, "local_timestamp"):
+        # pyarrow<12
+        return [
+            (
+                None
+                if value is None
+                else value.astimezone(_fixed_offset(int(value.utcoffset().total_seconds())))
+            )
+            for value in column.to_pylist()
+        ]
+
+    utc = column.cast(pyarrow.timestamp(column.type.unit))
+    local = pyarrow.compute.local_timestamp(column)
+    offsets = pyarrow.compute.subtract(local, utc).cast(pyarrow.int64()).to_pylist()
+    units_per_second = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}[column.type.unit]
+    return [
+        None if value is None else value.replace(tzinfo=_fixed_offset(offset // units_per_second))
+        for value, offset in zip(local.to_pylist(), offsets)
+    ]
+
+
+def table_from_arrow(
+    tables: Iterable["pyarrow.Table"], column_names: Sequence[str], limit: Optional[int] = None
+) -> "agate.Table":
+    """Build an agate table from Arrow tables or record batches sharing a schema.
+
+    Each column is converted to Python values at once. When every column has an agate type
+    the rows are loaded without inference, like `table_from_typed_rows`; otherwise (e.g. for
+    nested or time columns) the values go through `table_from_data_flat` like fetched rows.
+    Either way floating point values are loaded as Decimals, as inferred ones are.
+
+    :param limit: If set, load only this many rows. No more parts are read from `tables` once
+        they add up to `limit` rows, so batches that are downloaded lazily are not fetched.
+    """
+    import pyarrow
+    from dbt_common.clients.agate_helper import table_from_data_flat
+
+    parts = []
+    num_rows = 0
+    for part in tables:
+        parts.append(
+            part if isinstance(part, pyarrow.Table) else pyarrow.Table.from_batches([part])
+        )
+        num_rows += part.num_rows
+        if limit is not None and num_rows >= limit:
+            break
+    if not parts:
+        return table_from_data_flat([], column_names)
+    arrow_table = pyarrow.concat_tables(parts)
+    if limit is not None:
+        arrow_table = arrow_table.slice(0, limit)
+
+    columns = [_arrow_column_values(column) for column in arrow_table.columns]
+    column_types = [_agate_type_for_arrow(column.type) for column in arrow_table.columns]
+    if all(column_type is not None for column_type in column_types):
+        return table_from_typed_rows(zip(*columns), column_names, column_types)  # type: ignore[arg-type]
+    return table_from_data_flat(
+        (dict(zip(column_names, row)) for row in zip(*columns)), column_names
+    )
+
+
+@dataclass(frozen=True)
+class ResultColumn:
+    name: str
+    # the driver-specific type code from the cursor description
+    type_code: Any = None
+
+
+class StreamingResult:
+    """The rows of a query result, fetched from the warehouse in batches as they are consumed.
+
+    Rows are yielded once, in order, either one at a time by iterating over the result or a
+    batch at a time from `batches()`. `to_agate()` materializes whatever rows have not been
+    consumed yet. Closing the result (or exhausting it) releases any server-side state.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[ResultColumn],
+        batches: Iterable[Sequence[Row]],
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.columns = list(columns)
+        self._batches = iter(batches)
+        self._on_close = on_close
+
+    @classmethod
+    def from_cursor(
+        cls,
+        cursor: Any,
+        fetch: Optional[Fetch] = None,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        process_rows: Optional[Callable[[Sequence[Row]], Iterable[Row]]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> "StreamingResult":
+        """Stream the result of the query executed on `cursor`.
+
+        :param fetch: Called with a batch size to fetch the next rows, defaults to
+            `cursor.fetchmany`. The cursor description is read after the first fetch, so
+            results of server-side cursors are described too.
+        :param limit: If set, stop after this many rows.
+        :param process_rows: Applied to each fetched batch, to convert driver values.
+        """
+        if fetch is None:
+            if cursor.description is None:
+                # the statement did not return rows, so there is nothing to fetch
+                return cls([], [], on_close)
+            fetch = cursor.fetchmany
+
+        def fetch_batches() -> Iterator[Sequence[Row]]:
+            remaining = limit
+            while remaining is None or remaining > 0:
+                size = batch_size if remaining is None else min(batch_size, remaining)
+                rows = fetch(size)
+                if not rows:
+                    return
+                if remaining is not None:
+                    remaining -= len(rows)
+                yield rows if process_rows is None else list(process_rows(rows))
+
+        batches = fetch_batches()
+        first = next(batches, None)
+        description = cursor.description or []
+        names = dedupe_column_names(col[0] for col in description)
+        columns = [ResultColumn(name, col[1]) for name, col in zip(names, description)]
+        return cls(columns, chain([first] if first else [], batches), on_close)
+
+    @classmethod
+    def from_table(cls, table: "agate.Table") -> "StreamingResult":
+        columns = [
+            ResultColumn(name, type_)
+            for name, type_ in zip(table.column_names, table.column_types)
+        ]
+        return cls(columns, [table.rows] if table.rows else [])
+
+    @property
+    def column_names(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def batches(self) -> Iterator[Sequence[Row]]:
+        for batch in self._batches:
+            yield batch
+        self.close()
+
+    def __iter__(self) -> Iterator[Row]:
+        for batch in self.batches():
+            yield from batch
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def __enter__(self) -> "StreamingResult":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def to_agate(self) -> "agate.Table":
+        from dbt_common.clients.agate_helper import table_from_data_flat
+
+        column_names = self.column_names
+        return table_from_data_flat((dict(zip(column_names, row)) for row in self), column_names)
@@ -1,5 +1,8 @@
 from copy import deepcopy
+import json
+import os
 import threading
+import time
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from dbt_common.events.functions import fire_event, fire_event_if
@@ -20,6 +23,9 @@ from dbt.adapters.reference_keys import (
 )
 
 
+_SchemaKey = Tuple[Optional[str], Optional[str]]
+
+
 def dot_separated(key: _ReferenceKey) -> str:
     """Return the key in dot-separated string form.
 
@@ -105,7 +111,9 @@ class _CachedRelation:
 
         :param Iterable[_ReferenceKey] keys: The keys to drop.
         """
-        keys = set(self.referenced_by) & set(keys)
+        if not self.referenced_by:
+            return
+        keys = set(self.referenced_by).intersection(keys)
         for key in keys:
             self.referenced_by.pop(key)
 
@@ -159,14 +167,28 @@ class RelationsCache:
     """A cache of the relations known to dbt. Keeps track of relationships
     declared between tables and handles renames/drops as a real database would.
 
+    Writers serialize on `lock`. Readers of `get_relations` don't take it:
+    they read an immutable per-schema snapshot that writers discard whenever
+    they touch that schema, and only fall back to the lock to rebuild a
+    missing snapshot.
+
     :attr Dict[_ReferenceKey, _CachedRelation] relations: The known relations.
     :attr threading.RLock lock: The lock around relations, held during updates.
-        The adapters also hold this lock while filling the cache.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
+    :attr Dict[_SchemaKey, Set[_ReferenceKey]] relations_by_schema: An index
+        from each lowercased (database, schema) pair to the keys of the
+        relations cached in it. It is maintained alongside `relations` so that
+        per-schema operations don't have to scan the whole cache.
+    :attr Dict[_ReferenceKey, Set[_ReferenceKey]] referenced: The reverse of
+        each relation's `referenced_by`: the keys of the relations that a
+        relation refers to, so drops and renames only visit those.
     """
 
     def __init__(self, log_cache_events: bool = False) -> None:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
+        self.relations_by_schema: Dict[_SchemaKey, Set[_ReferenceKey]] = {}
+        self.referenced: Dict[_ReferenceKey, Set[_ReferenceKey]] = {}
+        self._snapshots: Dict[_SchemaKey, Tuple[Any, ...]] = {}
         self.lock = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
         self.log_cache_events = log_cache_events
@@ -241,8 +263,27 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
+        if key not in self.relations:
+            self._index_key(key)
         return self.relations.setdefault(key, relation)
 
+    def _index_key(self, key: _ReferenceKey) -> None:
+        """Add a key to the per-schema index. Callers should hold the lock."""
+        schema_key = (key.database, key.schema)
+        self.relations_by_schema.setdefault(schema_key, set()).add(key)
+        self._snapshots.pop(schema_key, None)
+
+    def _unindex_key(self, key: _ReferenceKey) -> None:
+        """Remove a key from the per-schema index. Callers should hold the lock."""
+        schema_key = (key.database, key.schema)
+        self._snapshots.pop(schema_key, None)
+        keys = self.relations_by_schema.get(schema_key)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self.relations_by_schema[schema_key]
+
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
         new entries must alraedy exist in the database.
@@ -266,6 +307,7 @@ class RelationsCache:
         assert dependent is not None  # we just raised!
 
         referenced.add_reference(dependent)
+        self.referenced.setdefault(dependent_key, set()).add(referenced_key)
 
     # This is called in plugins/postgres/dbt/adapters/postgres/impl.py
     def add_link(self, referenced, dependent):
@@ -339,12 +381,31 @@ class RelationsCache:
 
         :param Iterable[_ReferenceKey] keys: The keys to remove.
         """
+        keys = set(keys)
+        referencing: Set[_ReferenceKey] = set()
         # remove direct refs
         for key in keys:
-            del self.relations[key]
-        # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+            removed = self.relations.pop(key)
+            self._unindex_key(key)
+            referencing.update(self.referenced.pop(key, ()))
+            # the relations that referred to the removed one no longer do
+            for dependent_key in removed.referenced_by:
+                self._unreference(dependent_key, key)
+        # then remove all entries from each child that referenced them
+        for referenced_key in referencing - keys:
+            cached = self.relations.get(referenced_key)
+            if cached is not None:
+                cached.release_references(keys)
+
+    def _unreference(self, dependent_key: _ReferenceKey, referenced_key: _ReferenceKey) -> None:
+        """Remove a key from the reverse reference index. Callers should hold
+        the lock."""
+        referenced = self.referenced.get(dependent_key)
+        if referenced is None:
+            return
+        referenced.discard(referenced_key)
+        if not referenced:
+            del self.referenced[dependent_key]
 
     def drop(self, relation):
         """Drop the named relation and cascade it appropriately to all
@@ -388,25 +449,36 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._unindex_key(old_key)
         new_key = new_relation.key()
 
         # relation has to rename its innards, so it needs the _CachedRelation.
         relation.rename(new_relation)
         # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
-                fire_event(
-                    CacheAction(
-                        action="update_reference",
-                        ref_key=_make_ref_key_dict(old_key),
-                        ref_key_2=_make_ref_key_dict(new_key),
-                        ref_key_3=_make_ref_key_dict(cached.key()),
-                    )
+        referenced = self.referenced.pop(old_key, set())
+        for referenced_key in referenced:
+            cached = self.relations.get(referenced_key)
+            if cached is None or not cached.is_referenced_by(old_key):
+                continue
+            fire_event(
+                CacheAction(
+                    action="update_reference",
+                    ref_key=_make_ref_key_dict(old_key),
+                    ref_key_2=_make_ref_key_dict(new_key),
+                    ref_key_3=_make_ref_key_dict(cached.key()),
                 )
+            )
 
-                cached.rename_key(old_key, new_key)
+            cached.rename_key(old_key, new_key)
+        if referenced:
+            self.referenced[new_key] = referenced
+        # and the reverse references to it from the relations it refers to
+        for dependent_key in relation.referenced_by:
+            self._unreference(dependent_key, old_key)
+            self.referenced.setdefault(dependent_key, set()).add(new_key)
 
         self.relations[new_key] = relation
+        self._index_key(new_key)
         # also fixup the schemas!
         self.add_schema(new_key.database, new_key.schema)
 
@@ -479,23 +551,57 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        database = lowercase(database)
-        schema = lowercase(schema)
-        with self.lock:
-            results = [
-                r.inner
-                for r in self.relations.values()
-                if (lowercase(r.schema) == schema and lowercase(r.database) == database)
-            ]
+        key = (lowercase(database), lowercase(schema))
+        # dict lookups are atomic, so an existing snapshot can be read without
+        # the lock. Writers drop the snapshot for any schema they change.
+        results = self._snapshots.get(key)
+        if results is None:
+            with self.lock:
+                results = tuple(r.inner for r in self._list_relations_in_schema(database, schema))
+                self._snapshots[key] = results
 
         if None in results:
             raise NoneRelationFoundError()
-        return results
+        return list(results)
+
+    def add_relations(
+        self,
+        relations: Iterable[Any],
+        schemas: Iterable[Tuple[Optional[str], str]],
+        clear: bool = False,
+    ) -> None:
+        """Add a batch of relations, and the schemas they were listed from, in
+        one critical section. If `clear` is set, the previous contents are
+        replaced. Callers should do any slow work (like querying the
+        warehouse) before calling this, so the lock is only held for the
+        inserts.
+
+        :param Iterable[BaseRelation] relations: The relations to add.
+        :param schemas: The (database, schema) pairs that were listed, which
+            are marked as cached even if they turned out to be empty.
+        :param bool clear: Whether to clear the cache first.
+        """
+        with self.lock:
+            if clear:
+                self.relations.clear()
+                self.relations_by_schema.clear()
+                self.referenced.clear()
+                self._snapshots.clear()
+                # rebind rather than clear + update, so lock-free `in` checks
+                # never observe an empty set of schemas mid-swap
+                self.schemas = {(lowercase(d), s.lower()) for (d, s) in schemas}
+            else:
+                self.update_schemas(schemas)
+            for relation in relations:
+                self.add(relation)
 
     def clear(self):
         """Clear the cache"""
         with self.lock:
             self.relations.clear()
+            self.relations_by_schema.clear()
+            self.referenced.clear()
+            self._snapshots.clear()
             self.schemas.clear()
 
     def _list_relations_in_schema(
@@ -503,19 +609,123 @@ class RelationsCache:
     ) -> List[_CachedRelation]:
         """Get the relations in a schema. Callers should hold the lock."""
         key = (lowercase(database), lowercase(schema))
-
-        to_remove: List[_CachedRelation] = []
-        for cachekey, relation in self.relations.items():
-            if (cachekey.database, cachekey.schema) == key:
-                to_remove.append(relation)
-        return to_remove
+        return [self.relations[k] for k in self.relations_by_schema.get(key, ())]
 
     def _remove_all(self, to_remove: List[_CachedRelation]):
         """Remove all the listed relations. Ignore relations that have been
         cascaded out.
+
+        The consequences of every drop are collected first and then removed
+        in a single pass, so dropping a whole schema doesn't rescan the
+        cache once per relation. Callers should hold the lock.
         """
+        dropped: Set[_ReferenceKey] = set()
         for relation in to_remove:
-            # it may have been cascaded out already
             drop_key = _make_ref_key(relation)
-            if drop_key in self.relations:
-                self.drop(drop_key)
+            # it may have been cascaded out already
+            if drop_key in dropped or drop_key not in self.relations:
+                continue
+            dropped_key_msg = _make_ref_key_dict(relation)
+            fire_event(CacheAction(action="drop_relation", ref_key=dropped_key_msg))
+            consequences = self.relations[drop_key].collect_consequences()
+            fire_event(
+                CacheAction(
+                    action="drop_cascade",
+                    ref_key=dropped_key_msg,
+                    ref_list=[key._asdict() for key in consequences],
+                )
+            )
+            dropped.update(consequences)
+        self._remove_refs(dropped)
+
+
+class PersistedRelationsStore:
+    """An on-disk store of schema listings, so a later invocation can reuse
+    them instead of listing every schema again.
+
+    Entries are keyed by profile, target and lowercased (database, schema).
+    Each entry records the warehouse-side change marker that was current when
+    the schema was listed, and is only handed back if the marker is unchanged
+    and the entry is younger than `ttl` seconds. Nothing is ever reused for a
+    schema without a marker.
+
+    :param str path: The JSON file to read from and write to.
+    :param str profile_name: The profile the listings belong to.
+    :param str target_name: The target the listings belong to.
+    :param float ttl: The maximum age of a reusable entry, in seconds.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, profile_name: str, target_name: str, ttl: float) -> None:
+        self.path = path
+        self.target_key = f"{profile_name}.{target_name}"
+        self.ttl = ttl
+        self._targets: Dict[str, Dict[str, Dict[str, Any]]] = self._read()
+        self._entries = self._targets.setdefault(self.target_key, {})
+
+    def _read(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+        return data.get("targets", {})
+
+    @staticmethod
+    def _schema_key(database: Optional[str], schema: Optional[str]) -> str:
+        return json.dumps([lowercase(database), lowercase(schema)])
+
+    def get(
+        self, database: Optional[str], schema: Optional[str], marker: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return the serialized relations stored for a schema, or None if
+        there is no usable entry for the given marker.
+        """
+        if marker is None:
+            return None
+        entry = self._entries.get(self._schema_key(database, schema))
+        if entry is None or entry["marker"] != marker:
+            return None
+        if time.time() - entry["stored_at"] > self.ttl:
+            return None
+        return entry["relations"]
+
+    def put(
+        self,
+        database: Optional[str],
+        schema: Optional[str],
+        marker: Optional[str],
+        relations: Iterable[Dict[str, Any]],
+    ) -> None:
+        """Record a fresh listing of a schema. Listings without a marker can
+        never be reused, so they only evict any older entry.
+        """
+        key = self._schema_key(database, schema)
+        if marker is None:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = {
+            "marker": marker,
+            "stored_at": time.time(),
+            "relations": list(relations),
+        }
+
+    def save(self) -> None:
+        """Write the store back to disk, dropping expired entries. The file is
+        replaced atomically so concurrent invocations never see a partial
+        write.
+        """
+        now = time.time()
+        for entries in self._targets.values():
+            for key in [k for k, v in entries.items() if now - v["stored_at"] > self.ttl]:
+                del entries[key]
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump({"version": self.VERSION, "targets": self._targets}, fp)
+        os.replace(tmp_path, self.path)
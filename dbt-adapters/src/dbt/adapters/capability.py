@@ -24,6 +24,10 @@ class Capability(str, Enum):
     MicrobatchConcurrency = "MicrobatchConcurrency"
     """Indicates support running the microbatch incremental materialization strategy concurrently across threads."""
 
+    ParallelSeedLoad = "ParallelSeedLoad"
+    """Indicates support for loading the rows of a seed concurrently across threads, into staging tables that are then
+    merged into the seed."""
+
 
 class Support(str, Enum):
     Unknown = "Unknown"
@@ -0,0 +1,142 @@
+"""
+Timing of the phases of adapter work (acquiring and opening connections, rendering query
+comments, executing queries, fetching and converting results, populating the relations
+cache), per node.
+
+Profiling is off unless the DBT_ADAPTERS_PROFILE environment variable names a file to
+write the profile to when dbt exits. The profile is a JSON summary of the time spent in
+each phase, or a Chrome trace (viewable in chrome://tracing or Perfetto) of every span if
+DBT_ADAPTERS_PROFILE_FORMAT is "chrome". When profiling is off, `profile_phase` returns a
+shared no-op context manager, so instrumented code pays for one function call.
+"""
+
+import atexit
+from contextlib import nullcontext
+import json
+import os
+import threading
+import time
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+from dbt_common.events.contextvars import get_node_info
+
+
+PROFILE_PATH_ENV = "DBT_ADAPTERS_PROFILE"
+PROFILE_FORMAT_ENV = "DBT_ADAPTERS_PROFILE_FORMAT"
+
+# (phase, node, thread id, start, end), with times from time.perf_counter()
+_Span = Tuple[str, str, int, float, float]
+
+
+class _PhaseTimer:
+    __slots__ = ("_profiler", "_phase", "_start")
+
+    def __init__(self, profiler: "Profiler", phase: str) -> None:
+        self._profiler = profiler
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *args: Any) -> None:
+        self._profiler.record(self._phase, self._start, time.perf_counter())
+
+
+class Profiler:
+    """Collects the spans of time spent in each phase by the threads of a run."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        # appending to a list is atomic, so threads record spans without a lock
+        self.spans: List[_Span] = []
+
+    def phase(self, phase: str) -> ContextManager[None]:
+        return _PhaseTimer(self, phase)
+
+    def record(self, phase: str, start: float, end: float) -> None:
+        node = get_node_info().get("unique_id") or "<None>"
+        self.spans.append((phase, node, threading.get_ident(), start, end))
+
+    def summary(self) -> Dict[str, Any]:
+        """The number of spans and the total and longest time (in seconds) per phase, in
+        total and per node.
+        """
+        phases: Dict[str, Dict[str, Any]] = {}
+        nodes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for phase, node, _, start, end in list(self.spans):
+            duration = end - start
+            for stats in (
+                phases.setdefault(phase, {"count": 0, "total": 0.0, "max": 0.0}),
+                nodes.setdefault(node, {}).setdefault(
+                    phase, {"count": 0, "total": 0.0, "max": 0.0}
+                ),
+            ):
+                stats["count"] += 1
+                stats["total"] += duration
+                stats["max"] = max(stats["max"], duration)
+        return {"elapsed": time.perf_counter() - self.origin, "phases": phases, "nodes": nodes}
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """The spans as complete events of the Chrome trace event format."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": phase,
+                    "cat": "dbt.adapters",
+                    "ph": "X",
+                    "ts": (start - self.origin) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"node": node},
+                }
+                for phase, node, tid, start, end in list(self.spans)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path: str, format: str = "json") -> None:
+        profile = self.chrome_trace() if format == "chrome" else self.summary()
+        with open(path, "w") as fp:
+            json.dump(profile, fp, indent=2 if format != "chrome" else None)
+
+
+_profiler: Optional[Profiler] = None
+_disabled: ContextManager[None] = nullcontext()
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+def set_profiler(profiler: Optional[Profiler]) -> None:
+    """Start collecting spans with the given profiler, or stop if it is None."""
+    global _profiler
+    _profiler = profiler
+
+
+def profile_phase(phase: str) -> ContextManager[None]:
+    """Time the enclosed block as a span of the given phase, for the current node."""
+    profiler = _profiler
+    if profiler is None:
+        return _disabled
+    return profiler.phase(phase)
+
+
+def _write_profile_at_exit(profiler: Profiler, path: str, format: str) -> None:
+    try:
+        profiler.write(path, format)
+    except OSError:
+        # there is nowhere left to report this: dbt has already exited
+        pass
+
+
+if os.getenv(PROFILE_PATH_ENV):
+    _profiler = Profiler()
+    atexit.register(
+        _write_profile_at_exit,
+        _profiler,
+        os.environ[PROFILE_PATH_ENV],
+        os.getenv(PROFILE_FORMAT_ENV, "json"),
+    )
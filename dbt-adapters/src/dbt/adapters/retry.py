@@ -0,0 +1,124 @@
+"""
+Retrying of transient errors from the warehouse, shared by the connection managers for
+opening connections and running queries.
+
+After the n-th failed attempt, a RetryPolicy waits a random time between 0 and
+min(max_delay, base_delay * 2 ** n) seconds ("full jitter"), so that threads throttled by
+the warehouse at the same time spread their retries out instead of retrying in lockstep.
+"""
+
+from dataclasses import dataclass
+import random
+from time import monotonic, sleep
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+from dbt_common.events.functions import fire_event
+
+from dbt.adapters.events.types import AdapterEventDebug
+
+
+T = TypeVar("T")
+
+# 2 ** 32 seconds is long past any max_delay, and larger exponents overflow floats
+_MAX_EXPONENT = 32
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How to retry a call that fails with a transient error.
+
+    :param retries: How many times to retry after the first attempt.
+    :param retryable_exceptions: The errors to retry, unless classify is set.
+    :param base_delay: The longest wait, in seconds, before the first retry.
+    :param max_delay: The longest wait before any retry.
+    :param jitter: Whether to wait a random time up to the backoff, or the backoff itself.
+    :param max_elapsed: If set, stop retrying once waiting again would take the call past
+        this many seconds since its first attempt.
+    :param classify: If set, decides which errors to retry instead of retryable_exceptions.
+    :param delay: If set, gives the wait before each retry from the number of retries so
+        far, instead of the backoff.
+    """
+
+    retries: int = 1
+    retryable_exceptions: Tuple[Type[Exception], ...] = ()
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: bool = True
+    max_elapsed: Optional[float] = None
+    classify: Optional[Callable[[Exception], bool]] = None
+    delay: Optional[Callable[[int], float]] = None
+
+    def is_retryable(self, error: Exception) -> bool:
+        if self.classify is not None:
+            return self.classify(error)
+        return isinstance(error, self.retryable_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """The time to wait after attempt (counting from 0) fails."""
+        if self.delay is not None:
+            return self.delay(attempt)
+        ceiling = min(self.max_delay, self.base_delay * 2 ** min(attempt, _MAX_EXPONENT))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        description: str,
+        name: str = "",
+        on_retry: Optional[Callable[[Exception], None]] = None,
+    ) -> T:
+        """Call fn, retrying it as the policy allows, and return its result.
+
+        The error of the last attempt is raised if the call does not succeed. on_retry is
+        called with the error before each retry, e.g. to reconnect.
+        """
+        start = monotonic()
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if not self.is_retryable(e):
+                    raise
+                if attempt >= self.retries:
+                    fire_event(
+                        AdapterEventDebug(
+                            name=name,
+                            base_msg="Giving up on {} after {} attempt(s). Error:\n{}",
+                            args=[description, str(attempt + 1), str(e)],
+                        )
+                    )
+                    raise
+                wait = self.backoff(attempt)
+                if self.max_elapsed is not None and monotonic() - start + wait > self.max_elapsed:
+                    fire_event(
+                        AdapterEventDebug(
+                            name=name,
+                            base_msg="Giving up on {} after {} attempt(s) in {}s. Error:\n{}",
+                            args=[
+                                description,
+                                str(attempt + 1),
+                                f"{monotonic() - start:.1f}",
+                                str(e),
+                            ],
+                        )
+                    )
+                    raise
+                attempt += 1
+                fire_event(
+                    AdapterEventDebug(
+                        name=name,
+                        base_msg="Got a retryable error {} {}. Retry {} of {} in {}s. Error:\n{}",
+                        args=[
+                            type(e).__name__,
+                            description,
+                            str(attempt),
+                            str(self.retries),
+                            f"{wait:.2f}",
+                            str(e),
+                        ],
+                    )
+                )
+                sleep(wait)
+                if on_retry is not None:
+                    on_retry(e)
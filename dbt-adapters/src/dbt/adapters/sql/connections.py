@@ -1,4 +1,5 @@
 import abc
+from dataclasses import replace
 import time
 from typing import (
     Any,
@@ -7,6 +8,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     TYPE_CHECKING,
     Type,
@@ -18,17 +20,25 @@ from dbt_common.exceptions import DbtInternalError, NotImplementedError
 from dbt_common.utils import cast_to_str
 
 from dbt.adapters.base import BaseConnectionManager
+from dbt.adapters.base.results import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    Row,
+    StreamingResult,
+    dedupe_column_names,
+    table_from_typed_rows,
+)
 from dbt.adapters.contracts.connection import (
     AdapterResponse,
     Connection,
     ConnectionState,
 )
+from dbt.adapters.profiling import profile_phase
+from dbt.adapters.retry import RetryPolicy
 from dbt.adapters.events.types import (
     ConnectionUsed,
     SQLCommit,
     SQLQuery,
     SQLQueryStatus,
-    AdapterEventDebug,
 )
 
 if TYPE_CHECKING:
@@ -74,48 +84,19 @@ class SQLConnectionManager(BaseConnectionManager):
         abridge_sql_log: bool = False,
         retryable_exceptions: Tuple[Type[Exception], ...] = tuple(),
         retry_limit: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Tuple[Connection, Any]:
         """
-        Retry function encapsulated here to avoid commitment to some
-        user-facing interface. Right now, Redshift commits to a 1 second
-        retry timeout so this serves as a default.
+        Run sql on the thread's connection, attempting it up to retry_limit times if it fails
+        with one of retryable_exceptions, with the backoff of the adapter's RETRY_POLICY.
+        A retry_policy overrides retryable_exceptions and retry_limit.
         """
-
-        def _execute_query_with_retry(
-            cursor: Any,
-            sql: str,
-            bindings: Optional[Any],
-            retryable_exceptions: Tuple[Type[Exception], ...],
-            retry_limit: int,
-            attempt: int,
-        ):
-            """
-            A success sees the try exit cleanly and avoid any recursive
-            retries. Failure begins a sleep and retry routine.
-            """
-            try:
-                cursor.execute(sql, bindings)
-            except retryable_exceptions as e:
-                # Cease retries and fail when limit is hit.
-                if attempt >= retry_limit:
-                    raise e
-
-                fire_event(
-                    AdapterEventDebug(
-                        base_msg=f"Got a retryable error {type(e)}. {retry_limit - attempt} retries left. "
-                        f"Retrying in 1 second.\nError:\n{e}"
-                    )
-                )
-                time.sleep(1)
-
-                return _execute_query_with_retry(
-                    cursor=cursor,
-                    sql=sql,
-                    bindings=bindings,
-                    retryable_exceptions=retryable_exceptions,
-                    retry_limit=retry_limit,
-                    attempt=attempt + 1,
-                )
+        if retry_policy is None:
+            retry_policy = replace(
+                self.RETRY_POLICY,
+                retries=max(retry_limit - 1, 0),
+                retryable_exceptions=retryable_exceptions,
+            )
 
         connection = self.get_thread_connection()
         if auto_begin and connection.transaction_open is False:
@@ -145,14 +126,12 @@ class SQLConnectionManager(BaseConnectionManager):
             pre = time.perf_counter()
 
             cursor = connection.handle.cursor()
-            _execute_query_with_retry(
-                cursor=cursor,
-                sql=sql,
-                bindings=bindings,
-                retryable_exceptions=retryable_exceptions,
-                retry_limit=retry_limit,
-                attempt=1,
-            )
+
+            def execute() -> None:
+                with profile_phase("execute"):
+                    cursor.execute(sql, bindings)
+
+            retry_policy.call(execute, "running a query", name=self.TYPE)
 
             result = self.get_response(cursor)
 
@@ -177,18 +156,34 @@ class SQLConnectionManager(BaseConnectionManager):
     def process_results(
         cls, column_names: Iterable[str], rows: Iterable[Any]
     ) -> Iterator[Dict[str, Any]]:
-        unique_col_names = dict()  # type: ignore[var-annotated]
-        for idx in range(len(column_names)):  # type: ignore[arg-type]
-            col_name = column_names[idx]  # type: ignore[index]
-            if col_name in unique_col_names:
-                unique_col_names[col_name] += 1
-                column_names[idx] = f"{col_name}_{unique_col_names[col_name]}"  # type: ignore[index] # noqa
-            else:
-                unique_col_names[column_names[idx]] = 1  # type: ignore[index]
+        column_names[:] = dedupe_column_names(column_names)  # type: ignore[index]
 
         for row in rows:
             yield dict(zip(column_names, row))
 
+    @classmethod
+    def agate_type_for_column(cls, column: Sequence[Any]) -> Optional["agate.data_types.DataType"]:
+        """Get the agate type of the values the driver returns for a column, given its entry in
+        the cursor description, or None if it has to be inferred from the values. Results whose
+        columns all have known types are loaded without type inference. (passable)
+        """
+        return None
+
+    @classmethod
+    def get_agate_column_types(
+        cls, description: Sequence[Sequence[Any]]
+    ) -> Optional[List["agate.data_types.DataType"]]:
+        column_types = []
+        for column in description:
+            if len(column) < 2:
+                # no type code to go by
+                return None
+            column_type = cls.agate_type_for_column(column)
+            if column_type is None:
+                return None
+            column_types.append(column_type)
+        return column_types
+
     @classmethod
     def get_result_from_cursor(cls, cursor: Any, limit: Optional[int]) -> "agate.Table":
         from dbt_common.clients.agate_helper import table_from_data_flat
@@ -197,15 +192,45 @@ class SQLConnectionManager(BaseConnectionManager):
         column_names: List[str] = []
 
         if cursor.description is not None:
-            column_names = [col[0] for col in cursor.description]
-            if limit:
-                rows = cursor.fetchmany(limit)
-            else:
-                rows = cursor.fetchall()
-            data = cls.process_results(column_names, rows)
+            column_names = dedupe_column_names(col[0] for col in cursor.description)
+            with profile_phase("fetch"):
+                if limit:
+                    rows = cursor.fetchmany(limit)
+                else:
+                    rows = cursor.fetchall()
+            with profile_phase("convert"):
+                column_types = cls.get_agate_column_types(cursor.description)
+                if column_types is not None:
+                    return table_from_typed_rows(
+                        cls.process_rows(rows), column_names, column_types
+                    )
+                data = cls.process_results(column_names, rows)
+                return table_from_data_flat(data, column_names)
 
         return table_from_data_flat(data, column_names)
 
+    @classmethod
+    def process_rows(cls, rows: Sequence[Row]) -> Iterable[Row]:
+        """Convert a batch of rows fetched by the driver before they are streamed."""
+        return rows
+
+    def get_stream_from_cursor(
+        self,
+        cursor: Any,
+        sql: str,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> StreamingResult:
+        def fetch(size: int) -> Sequence[Row]:
+            with self.exception_handler(sql):
+                return cursor.fetchmany(size)
+
+        if cursor.description is None:
+            return StreamingResult([], [])
+        return StreamingResult.from_cursor(
+            cursor, fetch, limit=limit, batch_size=batch_size, process_rows=self.process_rows
+        )
+
     def execute(
         self,
         sql: str,
@@ -224,6 +249,18 @@ class SQLConnectionManager(BaseConnectionManager):
             table = empty_table()
         return response, table
 
+    def execute_streaming(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, StreamingResult]:
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_query(sql, auto_begin)
+        response = self.get_response(cursor)
+        return response, self.get_stream_from_cursor(cursor, sql, limit, batch_size)
+
     def add_begin_query(self):
         return self.add_query("BEGIN", auto_begin=False)
 
@@ -1,10 +1,16 @@
-from typing import Any, List, Optional, Tuple, Type, TYPE_CHECKING
+import threading
+from decimal import Decimal
+from multiprocessing.context import SpawnContext
+from typing import Any, IO, List, Optional, Tuple, Type, TYPE_CHECKING
+from uuid import uuid4
 
 from dbt_common.events.functions import fire_event
 from dbt_common.record import record_function
+from dbt_common.utils import executor
 
 from dbt.adapters.base import BaseAdapter, BaseRelation, available
 from dbt.adapters.cache import _make_ref_key_dict
+from dbt.adapters.capability import Capability
 from dbt.adapters.contracts.connection import AdapterResponse, Connection
 from dbt.adapters.events.types import ColTypeChange, SchemaCreation, SchemaDrop
 from dbt.adapters.exceptions import RelationTypeNullError
@@ -27,6 +33,19 @@ if TYPE_CHECKING:
     import agate
 
 
+def _seed_csv_field(value: Any, null: str) -> str:
+    if value is None:
+        return null
+    if isinstance(value, bool):
+        value = "true" if value else "false"
+    elif isinstance(value, Decimal):
+        # never in scientific notation, which integer columns reject
+        value = format(value, "f")
+    else:
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
 class SQLAdapter(BaseAdapter):
     """The default adapter with the common agate conversions and some SQL
     methods was implemented. This adapter has a different much shorter list of
@@ -48,6 +67,15 @@ class SQLAdapter(BaseAdapter):
     ConnectionManager: Type[SQLConnectionManager]
     connections: SQLConnectionManager
 
+    # the fewest rows of a seed worth loading over a connection of their own
+    SEED_LOAD_CHUNK_MIN_ROWS = 10000
+
+    def __init__(self, config, mp_context: SpawnContext) -> None:
+        super().__init__(config, mp_context)
+        # the connections that seeds loaded in parallel may open on top of the run's own, shared
+        # by every thread loading a seed
+        self._seed_load_slots = threading.BoundedSemaphore(config.threads)
+
     @available.parse(lambda *a, **k: (None, None))
     def add_query(
         self,
@@ -68,6 +96,180 @@ class SQLAdapter(BaseAdapter):
         """
         return self.connections.add_query(sql, auto_begin, bindings, abridge_sql_log)
 
+    @available
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, agate_table: "agate.Table", cols_sql: str
+    ) -> Optional[str]:
+        """Load the rows of a seed into its (empty) relation with the
+        warehouse's bulk-load path, like COPY. The default does nothing
+        (passable), and the rows are inserted in batches by load_csv_rows.
+
+        :param relation: The relation to load the rows into.
+        :param agate_table: The rows of the seed.
+        :param cols_sql: The quoted, comma-separated columns of the relation
+            to load the rows into.
+        :return: The SQL that loaded the rows, to render into the compiled
+            seed, or None if they have not been loaded.
+        """
+        return None
+
+    @classmethod
+    def can_bulk_load(cls, agate_table: "agate.Table") -> bool:
+        """Whether the rows can be written as CSV by write_seed_csv."""
+        import agate
+
+        # time deltas have no CSV form that every warehouse parses
+        return not any(
+            isinstance(column_type, agate.TimeDelta) for column_type in agate_table.column_types
+        )
+
+    @classmethod
+    def write_seed_csv(cls, agate_table: "agate.Table", fp: IO[str], null: str = "") -> None:
+        """Write the rows of a seed to fp as CSV, without a header. Values are
+        always quoted, so that empty strings are told apart from nulls, which
+        are written as `null`, unquoted.
+        """
+        for row in agate_table.rows:
+            fp.write(",".join([_seed_csv_field(value, null) for value in row]))
+            fp.write("\n")
+
+    @available
+    def load_csv_rows_in_parallel(
+        self,
+        relation: BaseRelation,
+        agate_table: "agate.Table",
+        columns_sql: str,
+        cols_sql: str,
+        threads: int,
+        batch_size: int,
+    ) -> Optional[str]:
+        """Load the rows of a seed in chunks, each into a staging table of its
+        own over a connection of the executor, and then merge the staging
+        tables into the relation with one statement on this thread's
+        connection, so that the seed gets all of its rows or none of them.
+
+        Each chunk is bulk loaded if the adapter can, and inserted in batches
+        of batch_size rows otherwise.
+
+        :param columns_sql: The column definitions of the relation, to create
+            the staging tables with. They cannot be created like the relation,
+            whose creation has not been committed yet.
+        :param threads: The most chunks to split the rows into.
+        :return: The SQL that merged the chunks into the relation, or None if
+            the adapter does not support it, the seed is too small to split or
+            other seeds loaded in parallel hold all but one of the run's
+            threads' worth of connections.
+        """
+        if not self.supports(Capability.ParallelSeedLoad):
+            return None
+        row_count = len(agate_table.rows)
+        chunk_count = min(threads, -(-row_count // self.SEED_LOAD_CHUNK_MIN_ROWS))
+        if chunk_count < 2:
+            return None
+        # take as many of the free slots as there are chunks, so that seeds loaded on several
+        # threads at once open no more connections than the run has threads
+        slots = 0
+        while slots < chunk_count and self._seed_load_slots.acquire(blocking=False):
+            slots += 1
+        try:
+            if slots < 2:
+                return None
+            return self._load_seed_chunks(
+                relation, agate_table, columns_sql, cols_sql, slots, batch_size
+            )
+        finally:
+            for _ in range(slots):
+                self._seed_load_slots.release()
+
+    def _load_seed_chunks(
+        self,
+        relation: BaseRelation,
+        agate_table: "agate.Table",
+        columns_sql: str,
+        cols_sql: str,
+        chunk_count: int,
+        batch_size: int,
+    ) -> str:
+        chunk_size = -(-len(agate_table.rows) // chunk_count)
+        # the staging tables are told apart from those of other runs loading the same seed
+        load_id = uuid4().hex[:8]
+        stages = [
+            self.seed_load_relation(relation, load_id, index) for index in range(chunk_count)
+        ]
+
+        # the executor only starts a thread per chunk it is given, at most chunk_count
+        with executor(self.config) as tpe:
+            futures = [
+                tpe.submit_connected(
+                    self,
+                    f"load_{stage.identifier}",
+                    self._load_seed_chunk,
+                    stage,
+                    agate_table.limit(index * chunk_size, (index + 1) * chunk_size),
+                    columns_sql,
+                    cols_sql,
+                    batch_size,
+                )
+                for index, stage in enumerate(stages)
+            ]
+            # wait for every chunk, so that no staging table is dropped while it is loaded
+            errors = [future.exception() for future in futures]
+            if any(errors):
+                for stage in stages:
+                    tpe.submit_connected(
+                        self, f"drop_{stage.identifier}", self._drop_seed_load_relation, stage
+                    )
+        for error in errors:
+            if error is not None:
+                raise error
+
+        sql = f"insert into {relation.render()} ({cols_sql}) " + " union all ".join(
+            f"select {cols_sql} from {stage.render()}" for stage in stages
+        )
+        self.connections.add_query(sql)
+        for stage in stages:
+            self.connections.add_query(f"drop table if exists {stage.render()}")
+        return sql
+
+    def seed_load_relation(self, relation: BaseRelation, load_id: str, index: int) -> BaseRelation:
+        """The staging table for a chunk of the rows of a seed, in the load
+        identified by load_id.
+        """
+        suffix = f"__dbt_load_{load_id}_{index}"
+        # 63 characters is the shortest identifier limit of the warehouses
+        identifier = (relation.identifier or "")[: 63 - len(suffix)] + suffix
+        return relation.incorporate(path={"identifier": identifier})
+
+    def _load_seed_chunk(
+        self,
+        stage: BaseRelation,
+        agate_table: "agate.Table",
+        columns_sql: str,
+        cols_sql: str,
+        batch_size: int,
+    ) -> None:
+        # a failed load can have left the staging table behind
+        self.connections.add_query(f"drop table if exists {stage.render()}")
+        self.connections.add_query(f"create table {stage.render()} ({columns_sql})")
+        if not self.bulk_load_csv_rows(stage, agate_table, cols_sql):
+            placeholders = "(" + ", ".join(["%s"] * len(agate_table.column_names)) + ")"
+            for start in range(0, len(agate_table.rows), batch_size):
+                rows = agate_table.rows[start : start + batch_size]
+                self.connections.add_query(
+                    f"insert into {stage.render()} ({cols_sql}) values "
+                    + ", ".join([placeholders] * len(rows)),
+                    bindings=[value for row in rows for value in row],
+                    abridge_sql_log=True,
+                )
+        # other connections have to see the staging table
+        if self.connections.get_thread_connection().transaction_open:
+            self.connections.commit()
+
+    def _drop_seed_load_relation(self, stage: BaseRelation) -> None:
+        self.connections.add_query(f"drop table if exists {stage.render()}")
+        if self.connections.get_thread_connection().transaction_open:
+            self.connections.commit()
+
     @classmethod
     def convert_text_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
         return "text"
@@ -0,0 +1,86 @@
+"""
+Splitting SQL into statements without tokenizing all of it.
+
+`split_statements` scans for the few things that decide where statements end (quotes,
+comments, dollar-quoted blocks, parentheses and semicolons) with a single compiled
+regular expression, skipping over everything else. SQL with procedural blocks or quoting it
+does not model (`begin ... end`, backslash escapes, ...) is split by the adapter's own
+splitter instead, so statements are split exactly as before, only faster.
+"""
+
+import re
+from typing import Callable, List, Pattern
+
+
+_TOKEN = re.compile(
+    r"""
+    (?P<skip>
+        '(?:''|[^'\\])*'
+      | "(?:""|[^"\\])*"
+      | --[^\r\n]*
+      | /\*[\s\S]*?\*/
+      | (?<![\w"$])\$\$[\s\S]*?\$\$
+      | \[[^\];]*\]
+    )
+  | (?P<semicolon>;)
+  | (?P<open>\()
+  | (?P<close>\))
+  | (?P<unsupported>
+        ['"`\#\[]
+      | /\*
+      | \$\$
+      | \$[A-Za-z_]\w*\$
+      | file://
+      | \r(?!\n)
+      | (?<![\w$.])(?:begin|declare|go)(?![\w$])
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# the spaces and line comments right after a statement's semicolon belong to it, as in
+# sqlparse.split
+SQLPARSE_TRAILER = re.compile(r"(?:[ \t]+|--[^\r\n]*(?:\r\n|\r|\n)?)*")
+# only the spaces and line comment on the line of a statement's semicolon belong to it, as in
+# the Snowflake connector's split_statements
+CONNECTOR_TRAILER = re.compile(r"[ \t]*(?:--[^\r\n]*)?")
+
+
+def split_statements(
+    sql: str, fallback: Callable[[str], List[str]], trailer: Pattern[str] = SQLPARSE_TRAILER
+) -> List[str]:
+    """Split sql into its statements, stripped and with their semicolons, as
+    sqlparse.split does, or as the splitter matched by trailer does.
+
+    :param fallback: Splits the SQL this function does not, e.g. sqlparse.split.
+    :param trailer: What follows a semicolon that belongs to the statement it
+        ends, for the split to match fallback's, e.g. CONNECTOR_TRAILER.
+    """
+    statements: List[str] = []
+    start = 0
+    depth = 0
+    position = 0
+    while True:
+        match = _TOKEN.search(sql, position)
+        if match is None:
+            break
+        kind = match.lastgroup
+        position = match.end()
+        if kind == "skip":
+            continue
+        elif kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif kind == "semicolon" and depth <= 0:
+            position = trailer.match(sql, position).end()  # type: ignore[union-attr]
+            statements.append(sql[start:position].strip())
+            start = position
+            depth = 0
+        else:
+            return fallback(sql)
+
+    last = sql[start:].strip()
+    if last:
+        statements.append(last)
+    return statements
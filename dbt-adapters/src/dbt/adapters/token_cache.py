@@ -0,0 +1,162 @@
+"""
+A process-wide cache of the access tokens and temporary credentials that adapters fetch from
+identity providers when opening connections.
+
+Tokens are cached by a key identifying what they were fetched for, until shortly before they
+expire. One thread fetches a missing or expired token while the others wait for it, so
+threads opening connections at the same time make a single call to the identity provider.
+A token close to expiring is refreshed by the first thread to use it, while the others keep
+using it until it expires.
+"""
+
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from dbt_common.events.functions import fire_event
+
+from dbt.adapters.events.types import AdapterEventDebug
+
+
+T = TypeVar("T")
+
+# the time before a token expires from which it is refreshed, in seconds
+DEFAULT_REFRESH_AHEAD = 300.0
+
+
+class _Entry:
+    __slots__ = ("lock", "token", "expires_at", "refresh_at")
+
+    def __init__(self) -> None:
+        # held by the thread fetching the token
+        self.lock = Lock()
+        self.token: Any = None
+        self.expires_at: Optional[float] = None
+        self.refresh_at: Optional[float] = None
+
+
+class TokenCache:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._lock = Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Tuple[T, float]],
+        name: str,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+    ) -> T:
+        """Return the token cached for key, fetching it if needed.
+
+        :param key: What the token is for, e.g. the identity provider and client.
+        :param fetch: Fetches a token, returning it and the seconds until it expires.
+        :param name: The name logged for the token; key is not logged, since it may
+            contain secrets.
+        :param refresh_ahead: How many seconds before the token expires to refresh it.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(key, _Entry())
+
+        if self._is_fresh(entry):
+            return self._hit(entry, name)
+
+        if self._is_valid(entry):
+            # the token is due for a refresh: one thread refreshes it, the others use it
+            if not entry.lock.acquire(blocking=False):
+                return self._hit(entry, name)
+        else:
+            entry.lock.acquire()
+
+        try:
+            # another thread may have fetched the token while this one waited
+            if self._is_fresh(entry):
+                return self._hit(entry, name)
+            return self._fetch(entry, fetch, name, refresh_ahead)
+        finally:
+            entry.lock.release()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget the token cached for key, e.g. after it was rejected."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _is_valid(entry: _Entry) -> bool:
+        return entry.expires_at is not None and monotonic() < entry.expires_at
+
+    @staticmethod
+    def _is_fresh(entry: _Entry) -> bool:
+        return entry.refresh_at is not None and monotonic() < entry.refresh_at
+
+    def _hit(self, entry: _Entry, name: str) -> Any:
+        with self._lock:
+            self.hits += 1
+        fire_event(
+            AdapterEventDebug(
+                name=name,
+                base_msg="Token cache hit, expires in {}s (hit rate {}/{})",
+                args=[
+                    f"{entry.expires_at - monotonic():.0f}",  # type: ignore[operator]
+                    str(self.hits),
+                    str(self.hits + self.misses),
+                ],
+            )
+        )
+        return entry.token
+
+    def _fetch(
+        self,
+        entry: _Entry,
+        fetch: Callable[[], Tuple[T, float]],
+        name: str,
+        refresh_ahead: float,
+    ) -> T:
+        with self._lock:
+            self.misses += 1
+        refreshing = self._is_valid(entry)
+        start = monotonic()
+        try:
+            token, expires_in = fetch()
+        except Exception as e:
+            if not self._is_valid(entry):
+                raise
+            # the token can still be used, and fetching it again will be retried
+            fire_event(
+                AdapterEventDebug(
+                    name=name,
+                    base_msg="Failed to refresh a cached token, still using it: {}",
+                    args=[str(e)],
+                )
+            )
+            return entry.token
+
+        entry.token = token
+        entry.expires_at = start + expires_in
+        # tokens that do not last long are refreshed halfway through their lifetime instead
+        entry.refresh_at = start + max(expires_in - refresh_ahead, expires_in / 2)
+        fire_event(
+            AdapterEventDebug(
+                name=name,
+                base_msg="Token cache {}, fetched a token in {}s, expires in {}s",
+                args=[
+                    "refresh" if refreshing else "miss",
+                    f"{monotonic() - start:.3f}",
+                    f"{expires_in:.0f}",
+                ],
+            )
+        )
+        return token
+
+
+_TOKEN_CACHE = TokenCache()
+
+
+def get_token_cache() -> TokenCache:
+    return _TOKEN_CACHE
@@ -85,6 +85,21 @@
 {% endmacro %}
 
 
+{% macro get_seed_column_definitions(model, agate_table) %}
+  {%- set column_override = model['config'].get('column_types', {}) -%}
+  {%- set quote_seed_column = model['config'].get('quote_columns', None) -%}
+    {% set definitions = [] %}
+    {% for col_name in agate_table.column_names -%}
+        {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
+        {%- set type = column_override.get(col_name, inferred_type) -%}
+        {%- set column_name = (col_name | string) -%}
+        {%- do definitions.append(adapter.quote_seed_column(column_name, quote_seed_column) ~ ' ' ~ type) -%}
+    {%- endfor %}
+
+    {{ return(definitions | join(', ')) }}
+{% endmacro %}
+
+
 {% macro load_csv_rows(model, agate_table) -%}
   {{ adapter.dispatch('load_csv_rows', 'dbt')(model, agate_table) }}
 {%- endmacro %}
@@ -94,6 +109,25 @@
   {% set batch_size = get_batch_size() %}
 
   {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+
+  {# Load large seeds in chunks across threads, if the seed is configured with load_threads #}
+  {% set load_threads = config.get('load_threads') %}
+  {% if load_threads and adapter.load_csv_rows_in_parallel is defined %}
+    {% set columns_sql = get_seed_column_definitions(model, agate_table) %}
+    {% set parallel_load_sql = adapter.load_csv_rows_in_parallel(this, agate_table, columns_sql, cols_sql, load_threads | int, batch_size) %}
+    {% if parallel_load_sql %}
+      {{ return(parallel_load_sql) }}
+    {% endif %}
+  {% endif %}
+
+  {# Load the rows in bulk where the adapter can, and insert them in batches otherwise #}
+  {% if adapter.bulk_load_csv_rows is defined %}
+    {% set bulk_load_sql = adapter.bulk_load_csv_rows(this, agate_table, cols_sql) %}
+    {% if bulk_load_sql %}
+      {{ return(bulk_load_sql) }}
+    {% endif %}
+  {% endif %}
+
   {% set bindings = [] %}
 
   {% set statements = [] %}
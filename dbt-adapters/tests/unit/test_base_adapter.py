@@ -1,8 +1,16 @@
+from dataclasses import dataclass, field
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, Optional
 from unittest import mock
 
+from dbt_common.clients.agate_helper import DEFAULT_TYPE_TESTER
+from dbt_common.context import set_invocation_context
 import pytest
 
-from dbt.adapters.base.impl import BaseAdapter, ConstraintSupport
+from dbt.adapters.base.impl import BaseAdapter, ConstraintSupport, _merge_tables
+from dbt.adapters.base.relation import BaseRelation
 
 from datetime import datetime
 from unittest.mock import MagicMock, patch
@@ -382,3 +390,501 @@ class TestCalculateFreshnessFromCustomSQL:
         assert freshness_response["max_loaded_at"] == expected_min_date
         assert freshness_response["snapshotted_at"] == current_time
         assert isinstance(freshness_response["age"], float)
+
+
+class TestRelationsCacheContention:
+    """Threads calling get_relation during a cache rebuild should be served
+    from the existing cache instead of waiting for the warehouse listing to
+    finish.
+    """
+
+    num_readers = 8
+
+    @pytest.fixture
+    def rebuilding_adapter(self, adapter, monkeypatch):
+        monkeypatch.setattr(type(adapter.connections), "TYPE", "test")
+        adapter.config.args = SimpleNamespace(single_threaded=False)
+        adapter.config.quoting = {"database": False, "schema": False, "identifier": False}
+        schemas = {
+            adapter.Relation.create(database="db", schema=f"schema_{i}").without_identifier()
+            for i in range(4)
+        }
+        relations = [
+            adapter.Relation.create(database="db", schema=s.schema, identifier=f"table_{j}")
+            for s in schemas
+            for j in range(50)
+        ]
+        adapter.cache.add_relations(relations, [(s.database, s.schema) for s in schemas])
+        return adapter, schemas, relations
+
+    def test_get_relation_during_rebuild(self, rebuilding_adapter):
+        adapter, schemas, relations = rebuilding_adapter
+        listing_started = threading.Event()
+        readers_done = threading.Event()
+        readers_done_during_listing = []
+
+        def listing(schema_relation):
+            listing_started.set()
+            # the listing only returns once every reader is done, so readers waiting on it
+            # would never finish; the timeout only keeps a regression from hanging the suite
+            readers_done_during_listing.append(readers_done.wait(timeout=30))
+            return [r for r in relations if r.schema == schema_relation.schema]
+
+        def rebuild():
+            set_invocation_context({})
+            adapter.set_relations_cache([], required_schemas=schemas)
+
+        found = []
+
+        def reader():
+            for i in range(50):
+                found.append(adapter.get_relation("db", f"schema_{i % 4}", f"table_{i}"))
+
+        adapter.list_relations_without_caching = listing
+        rebuilder = threading.Thread(target=rebuild)
+        rebuilder.start()
+        listing_started.wait()
+        readers = [threading.Thread(target=reader) for _ in range(self.num_readers)]
+        for thread in readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        readers_done.set()
+        rebuilder.join()
+
+        assert len(found) == 50 * self.num_readers
+        assert all(relation is not None for relation in found)
+        assert readers_done_during_listing and all(readers_done_during_listing)
+        assert len(adapter.cache.relations) == 200
+
+
+class TestPersistedRelationsCache:
+    @pytest.fixture
+    def persisting_adapter(self, adapter, monkeypatch, tmp_path):
+        monkeypatch.setattr(type(adapter.connections), "TYPE", "test")
+        adapter.config.args = SimpleNamespace(single_threaded=True)
+        adapter.config.target_path = str(tmp_path)
+        adapter.config.credentials.relations_cache_ttl = 3600
+        set_invocation_context({})
+
+        adapter.markers = {("db", "schema_a"): "1", ("db", "schema_b"): "1"}
+        adapter.listed = []
+        warehouse = {
+            schema: [
+                adapter.Relation.create(database="db", schema=schema, identifier=f"{schema}_table")
+            ]
+            for schema in ("schema_a", "schema_b")
+        }
+
+        def list_relations_without_caching(schema_relation):
+            adapter.listed.append(schema_relation.schema)
+            return warehouse[schema_relation.schema]
+
+        adapter.list_relations_without_caching = list_relations_without_caching
+        adapter.get_relations_cache_markers = lambda schemas: dict(adapter.markers)
+        return adapter
+
+    @pytest.fixture
+    def schemas(self, persisting_adapter):
+        return {
+            persisting_adapter.Relation.create(database="db", schema=schema).without_identifier()
+            for schema in ("schema_a", "schema_b")
+        }
+
+    def test_reuses_unchanged_schemas(self, persisting_adapter, schemas):
+        persisting_adapter.set_relations_cache([], required_schemas=schemas)
+        assert sorted(persisting_adapter.listed) == ["schema_a", "schema_b"]
+
+        persisting_adapter.listed.clear()
+        persisting_adapter.markers[("db", "schema_b")] = "2"
+        persisting_adapter.set_relations_cache([], clear=True, required_schemas=schemas)
+
+        assert persisting_adapter.listed == ["schema_b"]
+        reused = persisting_adapter.cache.get_relations("db", "schema_a")
+        assert [r.identifier for r in reused] == ["schema_a_table"]
+        assert isinstance(reused[0], persisting_adapter.Relation)
+
+    def test_schemas_without_markers_are_listed(self, persisting_adapter, schemas):
+        persisting_adapter.markers.clear()
+        persisting_adapter.set_relations_cache([], required_schemas=schemas)
+        persisting_adapter.listed.clear()
+        persisting_adapter.set_relations_cache([], clear=True, required_schemas=schemas)
+        assert sorted(persisting_adapter.listed) == ["schema_a", "schema_b"]
+
+    def test_disabled_without_ttl(self, persisting_adapter, schemas, tmp_path):
+        persisting_adapter.config.credentials.relations_cache_ttl = None
+        persisting_adapter.set_relations_cache([], required_schemas=schemas)
+        assert not (tmp_path / "relations_cache.json").exists()
+
+
+class TestCatalogPlan:
+    @pytest.fixture
+    def planning_adapter(self, adapter, monkeypatch):
+        monkeypatch.setattr(type(adapter.connections), "TYPE", "test")
+        monkeypatch.setattr(adapter, "MAX_SCHEMA_METADATA_RELATIONS", 2)
+        monkeypatch.setattr(adapter, "CATALOG_QUERY_COST", 2)
+        adapter.config.args = SimpleNamespace(single_threaded=True)
+        set_invocation_context({})
+        return adapter
+
+    @staticmethod
+    def _relations(adapter, schema, count):
+        return [
+            adapter.Relation.create(database="db", schema=schema, identifier=f"table_{i}")
+            for i in range(count)
+        ]
+
+    def test_uncached_schemas_are_selected_in_batches(self, planning_adapter):
+        relations = self._relations(planning_adapter, "a", 3) + self._relations(
+            planning_adapter, "b", 2
+        )
+
+        schema_scans, batches = planning_adapter._plan_catalog_by_relations(relations)
+
+        assert not schema_scans
+        assert [len(batch) for _, batch in batches] == [2, 2, 1]
+        assert {r for _, batch in batches for r in batch} == set(relations)
+
+    def test_mostly_wanted_schemas_are_scanned(self, planning_adapter):
+        mostly_wanted = self._relations(planning_adapter, "a", 10)
+        barely_wanted = self._relations(planning_adapter, "b", 10)
+        planning_adapter.cache.add_relations(
+            mostly_wanted + barely_wanted, [("db", "a"), ("db", "b")]
+        )
+
+        schema_scans, batches = planning_adapter._plan_catalog_by_relations(
+            mostly_wanted[:9] + barely_wanted[:2]
+        )
+
+        assert list(schema_scans.search()) == [(mostly_wanted[0].information_schema_only(), "a")]
+        assert [batch for _, batch in batches] == [barely_wanted[:2]]
+
+    def test_get_catalog_by_relations_runs_the_plan(self, planning_adapter, monkeypatch):
+        scanned = self._relations(planning_adapter, "a", 4)
+        selected = self._relations(planning_adapter, "b", 3)
+        planning_adapter.cache.add_relations(scanned, [("db", "a")])
+        column_names = ["table_database", "table_schema", "table_name"]
+
+        def rows(relations):
+            return agate.Table(
+                [(r.database, r.schema, r.identifier) for r in relations], column_names
+            )
+
+        monkeypatch.setattr(
+            planning_adapter, "_get_one_catalog", lambda info, schemas, used: rows(scanned)
+        )
+        monkeypatch.setattr(
+            planning_adapter,
+            "_get_one_catalog_by_relations",
+            lambda info, relations, used: rows(relations),
+        )
+
+        catalog, exceptions = planning_adapter.get_catalog_by_relations(
+            frozenset(), set(scanned + selected)
+        )
+
+        assert exceptions == []
+        assert sorted(row["table_name"] for row in catalog) == sorted(
+            r.identifier for r in scanned + selected
+        )
+
+
+@pytest.fixture
+def synthetic_catalog(request):
+    """A catalog of num_columns columns, in tables of 50 columns spread over
+    10 schemas, split into 20 partial results like those of concurrent
+    catalog queries.
+    """
+    num_columns = getattr(request, "param", 20000)
+    column_names = [
+        "table_database",
+        "table_schema",
+        "table_name",
+        "table_type",
+        "table_comment",
+        "column_name",
+        "column_index",
+        "column_type",
+        "column_comment",
+        "table_owner",
+    ]
+    column_types = [agate.Text()] * 6 + [agate.Number()] + [agate.Text()] * 3
+    parts = []
+    for part in range(20):
+        rows = [
+            (
+                "db",
+                f"Schema_{part % 10}",
+                f"table_{part}_{i // 50}",
+                "BASE TABLE",
+                None,
+                f"column_{i % 50}",
+                i % 50,
+                "integer",
+                None,
+                "owner",
+            )
+            for i in range(num_columns // 20)
+        ]
+        parts.append(agate.Table(rows, column_names, column_types))
+    return parts
+
+
+class TestCatalogPostProcessing:
+    used_schemas = frozenset(("DB", f"schema_{i}") for i in range(5))
+
+    def test_filter_table_matches_schemas_case_insensitively(self, synthetic_catalog):
+        table = BaseAdapter._catalog_filter_table(synthetic_catalog[0], self.used_schemas)
+        assert len(table.rows) == len(synthetic_catalog[0].rows)
+
+        table = BaseAdapter._catalog_filter_table(synthetic_catalog[5], self.used_schemas)
+        assert len(table.rows) == 0
+
+    def test_filter_table_forces_text_columns(self):
+        table = agate.Table(
+            [("db", "1234", "2020", 1)],
+            ["table_database", "table_schema", "table_name", "column_index"],
+            DEFAULT_TYPE_TESTER,
+        )
+        result = BaseAdapter._catalog_filter_table(table, frozenset({("db", "1234")}))
+        assert tuple(result.rows[0]) == ("db", "1234", "2020", 1)
+        assert isinstance(result.column_types[2], agate.Text)
+        assert not isinstance(result.column_types[3], agate.Text)
+
+    def test_merge_reuses_rows(self, synthetic_catalog):
+        merged = _merge_tables(synthetic_catalog)
+        assert len(merged.rows) == sum(len(part.rows) for part in synthetic_catalog)
+        assert merged.rows[0] is synthetic_catalog[0].rows[0]
+
+    def test_merge_falls_back_for_different_types(self):
+        merged = _merge_tables(
+            [
+                agate.Table([(None,)], ["a"], [agate.Boolean()]),
+                agate.Table([(1,)], ["a"], [agate.Number()]),
+            ]
+        )
+        assert [row["a"] for row in merged.rows] == [None, 1]
+
+    def test_post_processing_is_faster_than_retabulating(self, synthetic_catalog):
+        """A benchmark against filtering the way it used to be done: each
+        partial table was re-tabulated with agate, filtered with a predicate
+        and merged. Pass a larger num_columns (e.g. 2M) through
+        synthetic_catalog to reproduce numbers for a large project.
+        """
+        from dbt_common.clients.agate_helper import merge_tables, table_from_rows
+
+        schemas = {(d.lower(), s.lower()) for d, s in self.used_schemas}
+        start = time.perf_counter()
+        expected = merge_tables(
+            [
+                table_from_rows(
+                    part.rows,
+                    part.column_names,
+                    text_only_columns=["table_database", "table_schema", "table_name"],
+                ).where(
+                    lambda row: (row["table_database"].lower(), row["table_schema"].lower())
+                    in schemas
+                )
+                for part in synthetic_catalog
+            ]
+        )
+        retabulating_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        catalog = _merge_tables(
+            [
+                BaseAdapter._catalog_filter_table(part, self.used_schemas)
+                for part in synthetic_catalog
+            ]
+        )
+        elapsed = time.perf_counter() - start
+
+        assert [tuple(row) for row in catalog.rows] == [tuple(row) for row in expected.rows]
+        assert elapsed < retabulating_time
+
+
+class TestSeedCsv:
+    def test_write_seed_csv(self):
+        from decimal import Decimal
+        import io
+
+        from dbt.adapters.sql import SQLAdapter
+
+        table = agate.Table(
+            [(Decimal("1E+2"), True, 'say "hi"'), (None, None, "")],
+            ["amount", "flag", "greeting"],
+            [agate.Number(), agate.Boolean(), agate.Text(cast_nulls=False)],
+        )
+        fp = io.StringIO()
+        SQLAdapter.write_seed_csv(table, fp, null="\\N")
+
+        assert fp.getvalue() == '"100","true","say ""hi"""\n\\N,\\N,""\n'
+        assert SQLAdapter.can_bulk_load(table)
+
+    def test_time_deltas_are_not_bulk_loaded(self):
+        from dbt.adapters.sql import SQLAdapter
+
+        table = agate.Table([], ["elapsed"], [agate.TimeDelta()])
+        assert not SQLAdapter.can_bulk_load(table)
+
+
+class TestRelationFromConfig:
+    @dataclass
+    class Node:
+        unique_id: str
+        identifier: str
+        database: str = "db"
+        schema: str = "schema"
+        quoting: Dict[str, bool] = field(default_factory=dict)
+        catalog_name: Optional[str] = None
+
+        @property
+        def quoting_dict(self) -> Dict[str, bool]:
+            return dict(self.quoting)
+
+    @pytest.fixture
+    def quoting_adapter(self, adapter):
+        adapter.config.quoting = {"identifier": False}
+        return adapter
+
+    def test_relations_are_built_once_per_node(self, quoting_adapter):
+        node = self.Node("model.test.a", "a")
+        with mock.patch.object(
+            quoting_adapter.Relation, "create_from", wraps=quoting_adapter.Relation.create_from
+        ) as create_from:
+            first = quoting_adapter.relation_from_config(node)
+            second = quoting_adapter.relation_from_config(self.Node("model.test.a", "a"))
+            other = quoting_adapter.relation_from_config(self.Node("model.test.b", "b"))
+
+        assert first is second
+        assert first.render() == '"db"."schema".a'
+        assert other.identifier == "b"
+        assert create_from.call_count == 2
+
+    def test_quoting_changes_invalidate_relations(self, quoting_adapter):
+        node = self.Node("model.test.a", "a")
+        unquoted = quoting_adapter.relation_from_config(node)
+
+        quoting_adapter.config.quoting = {"identifier": True}
+        quoted = quoting_adapter.relation_from_config(node)
+        node.quoting = {"identifier": False}
+
+        assert quoted.render() == '"db"."schema"."a"'
+        assert quoting_adapter.relation_from_config(node) == unquoted
+
+    def test_relations_reading_more_config_are_keyed_on_it(self, quoting_adapter):
+        @dataclass(frozen=True, eq=False, repr=False)
+        class FormatRelation(BaseRelation):
+            table_format: str = "default"
+
+            @classmethod
+            def create_from(cls, quoting, relation_config, **kwargs):
+                return super().create_from(
+                    quoting, relation_config, table_format=relation_config.table_format
+                )
+
+        @dataclass(frozen=True, eq=False, repr=False)
+        class KeyedFormatRelation(FormatRelation):
+            @classmethod
+            def create_from_key(cls, relation_config):
+                return (super().create_from_key(relation_config), relation_config.table_format)
+
+        node = self.Node("model.test.a", "a")
+        for relation_class in (FormatRelation, KeyedFormatRelation):
+            quoting_adapter.clear_relations_by_config()
+            with mock.patch.object(type(quoting_adapter), "Relation", relation_class):
+                node.table_format = "default"
+                default = quoting_adapter.relation_from_config(node)
+                node.table_format = "iceberg"
+                iceberg = quoting_adapter.relation_from_config(node)
+
+            assert default.table_format == "default"
+            assert iceberg.table_format == "iceberg"
+
+    def test_clear_relations_by_config(self, quoting_adapter):
+        node = self.Node("model.test.a", "a")
+        relation = quoting_adapter.relation_from_config(node)
+        quoting_adapter.clear_relations_by_config()
+
+        assert quoting_adapter.relation_from_config(node) is not relation
+
+
+class TestExecuteMacroCache:
+    class MacroFunction:
+        def __init__(self, macro, context):
+            self.macro = macro
+            self.context = context
+
+        def __call__(self, **kwargs):
+            return self.context
+
+    @pytest.fixture
+    def macro_adapter(self, adapter):
+        resolver = mock.Mock()
+        resolver.find_macro_by_name.side_effect = lambda name, root, project: SimpleNamespace(
+            name=name
+        )
+        context_generator = mock.Mock(side_effect=lambda macro, config, resolver, project: {})
+        adapter.set_macro_resolver(resolver)
+        adapter.set_macro_context_generator(context_generator)
+        with mock.patch("dbt.adapters.base.impl.CallableMacroGenerator", self.MacroFunction):
+            yield adapter, context_generator
+
+    def test_contexts_are_built_once(self, macro_adapter):
+        adapter, context_generator = macro_adapter
+        first = adapter.execute_macro("a", needs_conn=False)
+        second = adapter.execute_macro("a", needs_conn=False)
+        adapter.execute_macro("b", needs_conn=False)
+
+        assert first is second
+        assert context_generator.call_count == 2
+
+    def test_statement_results_are_not_kept_across_calls(self, macro_adapter):
+        class StatementMacro(self.MacroFunction):
+            def __call__(self, run_statement):
+                sql_results = self.context["_sql_results"]
+                if run_statement:
+                    sql_results["main"] = "result"
+                return sql_results.get("main")
+
+        adapter, context_generator = macro_adapter
+        context_generator.side_effect = lambda macro, config, resolver, project: {
+            "_sql_results": {}
+        }
+        with mock.patch("dbt.adapters.base.impl.CallableMacroGenerator", StatementMacro):
+            ran = adapter.execute_macro("a", kwargs={"run_statement": True}, needs_conn=False)
+            skipped = adapter.execute_macro("a", kwargs={"run_statement": False}, needs_conn=False)
+
+        assert ran == "result"
+        assert skipped is None
+        assert context_generator.call_count == 1
+
+    def test_context_overrides_are_not_cached(self, macro_adapter):
+        adapter, context_generator = macro_adapter
+        cached = adapter.execute_macro("a", needs_conn=False)
+        overridden = adapter.execute_macro("a", context_override={"x": 1}, needs_conn=False)
+
+        assert overridden == {"x": 1}
+        assert cached == {}
+        assert adapter.execute_macro("a", needs_conn=False) is cached
+        assert context_generator.call_count == 2
+
+    def test_setting_the_resolver_clears_the_cache(self, macro_adapter):
+        adapter, context_generator = macro_adapter
+        first = adapter.execute_macro("a", needs_conn=False)
+        adapter.set_macro_resolver(adapter.get_macro_resolver())
+
+        assert adapter.execute_macro("a", needs_conn=False) is not first
+        assert context_generator.call_count == 2
+
+    def test_contexts_are_not_shared_across_threads(self, macro_adapter):
+        adapter, context_generator = macro_adapter
+        contexts = [adapter.execute_macro("a", needs_conn=False)]
+        thread = threading.Thread(
+            target=lambda: contexts.append(adapter.execute_macro("a", needs_conn=False))
+        )
+        thread.start()
+        thread.join()
+
+        assert contexts[0] is not contexts[1]
+        assert context_generator.call_count == 2
@@ -1,12 +1,16 @@
+import json
 from multiprocessing.dummy import Pool as ThreadPool
+import os
 import random
+import tempfile
+import threading
 import time
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from dbt_common.exceptions import DbtInternalError
 
 from dbt.adapters.base import BaseRelation
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import PersistedRelationsStore, RelationsCache, _CachedRelation
 
 
 def make_relation(database, schema, identifier):
@@ -525,3 +529,275 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
         self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestRelationsBySchemaIndex(TestCache):
+    def assert_index_consistent(self):
+        expected = {}
+        for key in self.cache.relations:
+            expected.setdefault((key.database, key.schema), set()).add(key)
+        self.assertEqual(self.cache.relations_by_schema, expected)
+        expected_referenced = {}
+        for key, cached in self.cache.relations.items():
+            for dependent_key in cached.referenced_by:
+                expected_referenced.setdefault(dependent_key, set()).add(key)
+        self.assertEqual(self.cache.referenced, expected_referenced)
+
+    def test_add_and_drop(self):
+        self.cache.add(make_relation("DBT", "Foo", "bar"))
+        self.cache.add(make_relation("dbt", "foo", "baz"))
+        self.assert_index_consistent()
+        self.cache.drop(make_relation("dbt", "foo", "bar"))
+        self.assert_index_consistent()
+        self.cache.drop(make_relation("dbt", "foo", "baz"))
+        self.assertEqual(self.cache.relations_by_schema, {})
+
+    def test_rename_across_schemas(self):
+        self.cache.add(make_relation("dbt", "foo", "bar"))
+        self.cache.rename(make_relation("dbt", "foo", "bar"), make_relation("dbt", "baz", "bar"))
+        self.assert_index_consistent()
+        self.assertEqual(self.cache.get_relations("dbt", "foo"), [])
+        self.assert_relations_exist("dbt", "baz", "bar")
+
+    def test_drop_schema(self):
+        for ident in "abc":
+            self.cache.add(make_relation("dbt", "foo", ident))
+            self.cache.add(make_relation("dbt", "other", ident))
+        # other.a references foo.a, so dropping foo cascades into other
+        self.cache.add_link(make_relation("dbt", "foo", "a"), make_relation("dbt", "other", "a"))
+        self.cache.drop_schema("dbt", "foo")
+        self.assert_index_consistent()
+        self.assertNotIn(("dbt", "foo"), self.cache)
+        self.assert_relations_do_not_exist("dbt", "other", "a")
+        self.assert_relations_exist("dbt", "other", "b", "c")
+
+    def test_references_follow_renames_and_drops(self):
+        for schema, ident in [("foo", "a"), ("foo", "b"), ("other", "c")]:
+            self.cache.add(make_relation("dbt", schema, ident))
+        self.cache.add_link(make_relation("dbt", "foo", "a"), make_relation("dbt", "foo", "b"))
+        self.cache.add_link(make_relation("dbt", "foo", "b"), make_relation("dbt", "other", "c"))
+        self.assert_index_consistent()
+
+        self.cache.rename(make_relation("dbt", "foo", "b"), make_relation("dbt", "foo", "b2"))
+        self.assert_index_consistent()
+        (relation,) = [r for k, r in self.cache.relations.items() if k.identifier == "a"]
+        self.assertEqual([key.identifier for key in relation.referenced_by], ["b2"])
+
+        self.cache.drop(make_relation("dbt", "foo", "a"))
+        self.assert_index_consistent()
+        self.assertEqual(self.cache.relations, {})
+
+    def test_drop_schema_only_visits_referencing_relations(self):
+        for ident in "abc":
+            self.cache.add(make_relation("dbt", "foo", ident))
+            self.cache.add(make_relation("dbt", "other", ident))
+        self.cache.add_link(make_relation("dbt", "other", "b"), make_relation("dbt", "foo", "a"))
+        with mock.patch.object(
+            _CachedRelation, "release_references", autospec=True
+        ) as release_references:
+            self.cache.drop_schema("dbt", "foo")
+
+        (call,) = release_references.call_args_list
+        self.assertEqual(call.args[0].identifier, "b")
+        self.assert_relations_exist("dbt", "other", "a", "b", "c")
+
+    def test_drop_schema_skips_cascaded_relations(self):
+        for ident in "abc":
+            self.cache.add(make_relation("dbt", "foo", ident))
+        self.cache.add_link(make_relation("dbt", "foo", "a"), make_relation("dbt", "foo", "b"))
+        with mock.patch("dbt.adapters.cache.fire_event") as fire_event:
+            self.cache.drop_schema("dbt", "foo")
+
+        actions = [c.args[0].action for c in fire_event.call_args_list]
+        dropped = [
+            c.args[0].ref_key.identifier
+            for c in fire_event.call_args_list
+            if c.args[0].action == "drop_relation"
+        ]
+        self.assertNotIn("drop_missing_relation", actions)
+        self.assertEqual(len(dropped), len(set(dropped)))
+
+    def test_clear(self):
+        self.cache.add(make_relation("dbt", "foo", "bar"))
+        self.cache.clear()
+        self.assertEqual(self.cache.relations_by_schema, {})
+
+
+class _CountingRelations(dict):
+    """The relations of a cache, counting lookups by key and whole scans."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = 0
+        self.scans = 0
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.lookups += 1
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super().get(key, default)
+
+    def pop(self, key, *default):
+        self.lookups += 1
+        return super().pop(key, *default)
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+    def keys(self):
+        self.scans += 1
+        return super().keys()
+
+    def values(self):
+        self.scans += 1
+        return super().values()
+
+    def items(self):
+        self.scans += 1
+        return super().items()
+
+
+class TestCacheScaling(TestCase):
+    """Looking up or dropping a small schema should not touch the relations of
+    unrelated schemas in the cache.
+    """
+
+    schema_size = 20
+
+    def _build_cache(self, num_schemas):
+        cache = RelationsCache()
+        for schema_idx in range(num_schemas):
+            for ident_idx in range(self.schema_size):
+                cache.add(make_relation("dbt", f"schema_{schema_idx}", f"table_{ident_idx}"))
+        cache.relations = _CountingRelations(cache.relations)
+        return cache
+
+    def test_schema_index_holds_each_schema(self):
+        cache = self._build_cache(5)
+
+        self.assertEqual(len(cache.relations_by_schema), 5)
+        for (database, schema), keys in cache.relations_by_schema.items():
+            self.assertEqual(len(keys), self.schema_size)
+            self.assertTrue(all((k.database, k.schema) == (database, schema) for k in keys))
+
+    def test_get_relations_scales_with_schema_size(self):
+        small = self._build_cache(5)
+        large = self._build_cache(500)
+
+        self.assertEqual(len(small.get_relations("dbt", "schema_0")), self.schema_size)
+        self.assertEqual(len(large.get_relations("dbt", "schema_0")), self.schema_size)
+        self.assertEqual(large.relations.scans, 0)
+        self.assertEqual(large.relations.lookups, small.relations.lookups)
+        self.assertEqual(large.relations.lookups, self.schema_size)
+
+    def test_drop_schema_scales_with_schema_size(self):
+        small = self._build_cache(5)
+        large = self._build_cache(500)
+
+        small.drop_schema("dbt", "schema_0")
+        large.drop_schema("dbt", "schema_0")
+
+        self.assertNotIn(("dbt", "schema_0"), large)
+        self.assertNotIn(("dbt", "schema_0"), large.relations_by_schema)
+        self.assertEqual(len(large.relations), 499 * self.schema_size)
+        self.assertEqual(large.relations.scans, 0)
+        self.assertEqual(large.relations.lookups, small.relations.lookups)
+
+
+class TestSnapshotReads(TestCache):
+    def test_snapshot_invalidated_by_writes(self):
+        self.cache.add(make_relation("dbt", "foo", "bar"))
+        self.assert_relations_exist("dbt", "foo", "bar")
+        self.cache.add(make_relation("dbt", "foo", "baz"))
+        self.assert_relations_exist("dbt", "foo", "bar", "baz")
+        self.cache.rename(make_relation("dbt", "foo", "baz"), make_relation("dbt", "foo", "qux"))
+        self.assert_relations_exist("dbt", "foo", "bar", "qux")
+        self.assert_relations_do_not_exist("dbt", "foo", "baz")
+        self.cache.drop(make_relation("dbt", "foo", "bar"))
+        self.assert_relations_do_not_exist("dbt", "foo", "bar")
+
+    def test_get_relations_returns_a_copy(self):
+        self.cache.add(make_relation("dbt", "foo", "bar"))
+        self.cache.get_relations("dbt", "foo").clear()
+        self.assert_relations_exist("dbt", "foo", "bar")
+
+    def test_get_relations_does_not_take_lock_when_cached(self):
+        self.cache.add(make_relation("dbt", "foo", "bar"))
+        self.cache.get_relations("dbt", "foo")
+        result = []
+        with self.cache.lock:
+            thread = threading.Thread(
+                target=lambda: result.extend(self.cache.get_relations("dbt", "foo"))
+            )
+            thread.start()
+            thread.join(timeout=5)
+        self.assertEqual([r.identifier for r in result], ["bar"])
+
+    def test_add_relations_clear(self):
+        self.cache.add(make_relation("dbt", "foo", "bar"))
+        self.cache.add_relations(
+            [make_relation("dbt", "new", "baz")], [("dbt", "new"), ("dbt", "empty")], clear=True
+        )
+        self.assertEqual(self.cache.schemas, {("dbt", "new"), ("dbt", "empty")})
+        self.assertEqual(self.cache.get_relations("dbt", "foo"), [])
+        self.assert_relations_exist("dbt", "new", "baz")
+        self.assertIn(("dbt", "empty"), self.cache)
+
+
+class TestPersistedRelationsStore(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "target", "relations_cache.json")
+        self.relations = [make_relation("dbt", "foo", "bar").to_dict(omit_none=True)]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _store(self, target_name="dev", ttl=60):
+        return PersistedRelationsStore(self.path, "profile", target_name, ttl)
+
+    def test_round_trip(self):
+        store = self._store()
+        store.put("DBT", "Foo", "marker-1", self.relations)
+        store.save()
+        self.assertEqual(self._store().get("dbt", "foo", "marker-1"), self.relations)
+
+    def test_changed_marker_is_a_miss(self):
+        store = self._store()
+        store.put("dbt", "foo", "marker-1", self.relations)
+        self.assertIsNone(store.get("dbt", "foo", "marker-2"))
+        self.assertIsNone(store.get("dbt", "foo", None))
+
+    def test_missing_marker_evicts(self):
+        store = self._store()
+        store.put("dbt", "foo", "marker-1", self.relations)
+        store.put("dbt", "foo", None, self.relations)
+        self.assertIsNone(store.get("dbt", "foo", "marker-1"))
+
+    def test_expired_entries(self):
+        store = self._store(ttl=10)
+        store.put("dbt", "foo", "marker-1", self.relations)
+        with mock.patch("dbt.adapters.cache.time.time", return_value=time.time() + 11):
+            self.assertIsNone(store.get("dbt", "foo", "marker-1"))
+            store.save()
+        with open(self.path) as fp:
+            self.assertEqual(json.load(fp)["targets"]["profile.dev"], {})
+
+    def test_keyed_by_target(self):
+        store = self._store("dev")
+        store.put("dbt", "foo", "marker-1", self.relations)
+        store.save()
+        self.assertIsNone(self._store("prod").get("dbt", "foo", "marker-1"))
+
+    def test_unreadable_file_is_empty(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as fp:
+            fp.write("not json")
+        self.assertIsNone(self._store().get("dbt", "foo", "marker-1"))
@@ -0,0 +1,235 @@
+from multiprocessing import get_context
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.base.connections import ConnectionPool
+from dbt.adapters.contracts.connection import Connection, ConnectionState
+
+from tests.unit.fixtures.connection_manager import ConnectionManagerStub
+from tests.unit.fixtures.credentials import CredentialsStub
+
+
+class HandleStub:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class PooledConnectionManagerStub(ConnectionManagerStub):
+    TYPE = "test"
+    opened = 0
+
+    def create_connection_pool(self):
+        return ConnectionPool(max_size=2, idle_timeout=60, health_check=self.handle_is_healthy)
+
+    @classmethod
+    def handle_is_healthy(cls, handle) -> bool:
+        return not handle.closed
+
+    @classmethod
+    def open(cls, connection: Connection) -> Connection:
+        cls.opened += 1
+        connection.handle = HandleStub()
+        connection.state = ConnectionState.OPEN  # type: ignore
+        return connection
+
+
+@pytest.fixture
+def connections():
+    PooledConnectionManagerStub.opened = 0
+    profile = SimpleNamespace(credentials=CredentialsStub("test_database", "test_schema"))
+    return PooledConnectionManagerStub(profile, get_context("spawn"))
+
+
+def _use_connection(connections, name):
+    conn = connections.set_connection_name(name)
+    handle = conn.handle
+    connections.release()
+    return handle
+
+
+class TestConnectionPool:
+    def test_checkout_from_empty_pool_is_a_miss(self):
+        pool = ConnectionPool(max_size=1)
+        assert pool.checkout() is None
+        assert (pool.hits, pool.misses) == (0, 1)
+
+    def test_checkin_respects_max_size(self):
+        pool = ConnectionPool(max_size=1)
+        assert pool.checkin(HandleStub())
+        assert not pool.checkin(HandleStub())
+        assert len(pool) == 1
+
+    def test_checkout_skips_idle_and_unhealthy_handles(self):
+        stale, broken, healthy = HandleStub(), HandleStub(), HandleStub()
+        pool = ConnectionPool(
+            max_size=3, idle_timeout=10, health_check=lambda handle: handle is not broken
+        )
+        with mock.patch("dbt.adapters.base.connections.monotonic", return_value=0):
+            pool.checkin(stale)
+        with mock.patch("dbt.adapters.base.connections.monotonic", return_value=20):
+            pool.checkin(healthy)
+            pool.checkin(broken)
+            assert pool.checkout() is healthy
+            assert pool.checkout() is None
+        assert broken.closed
+        assert stale.closed
+        assert not healthy.closed
+
+    def test_close_all_closes_idle_handles(self):
+        handles = [HandleStub(), HandleStub()]
+        pool = ConnectionPool(max_size=2)
+        for handle in handles:
+            pool.checkin(handle)
+        pool.close_all()
+        assert len(pool) == 0
+        assert all(handle.closed for handle in handles)
+
+
+class TestPooledConnectionManager:
+    def test_release_returns_handle_to_pool(self, connections):
+        first = _use_connection(connections, "model.a")
+        second = _use_connection(connections, "model.b")
+
+        assert first is second
+        assert not first.closed
+        assert PooledConnectionManagerStub.opened == 1
+        assert (connections.pool.hits, connections.pool.misses) == (1, 1)
+
+    def test_handles_are_shared_across_threads(self, connections):
+        handle = _use_connection(connections, "model.a")
+        reused = []
+        thread = threading.Thread(
+            target=lambda: reused.append(_use_connection(connections, "model.b"))
+        )
+        thread.start()
+        thread.join()
+
+        assert reused == [handle]
+        assert PooledConnectionManagerStub.opened == 1
+
+    def test_unhealthy_handle_is_replaced(self, connections):
+        handle = _use_connection(connections, "model.a")
+        handle.closed = True
+
+        assert _use_connection(connections, "model.b") is not handle
+        assert PooledConnectionManagerStub.opened == 2
+
+    def test_release_closes_when_reset_fails(self, connections):
+        with mock.patch.object(
+            PooledConnectionManagerStub, "reset_handle", side_effect=RuntimeError
+        ):
+            handle = _use_connection(connections, "model.a")
+
+        assert handle.closed
+        assert len(connections.pool) == 0
+
+    def test_cleanup_all_drains_pool(self, connections):
+        handle = _use_connection(connections, "model.a")
+        connections.cleanup_all()
+
+        assert handle.closed
+        assert len(connections.pool) == 0
+
+    def test_pooling_is_disabled_by_default(self):
+        profile = SimpleNamespace(credentials=CredentialsStub("test_database", "test_schema"))
+        connections = ConnectionManagerStub(profile, get_context("spawn"))
+        assert connections.pool is None
+
+
+class UnpooledConnectionManagerStub(PooledConnectionManagerStub):
+    def create_connection_pool(self):
+        return None
+
+
+class TestWarmUp:
+    @pytest.fixture
+    def unpooled(self):
+        UnpooledConnectionManagerStub.opened = 0
+        profile = SimpleNamespace(credentials=CredentialsStub("test_database", "test_schema"))
+        return UnpooledConnectionManagerStub(profile, get_context("spawn"))
+
+    def test_warm_up_fills_the_pool(self, connections):
+        latencies = connections.warm_up(3, parallelism=2)
+
+        assert len(latencies) == 3
+        assert PooledConnectionManagerStub.opened == 3
+        # the pool holds two handles, the third is closed
+        assert len(connections.pool) == 2
+        _use_connection(connections, "model.a")
+        assert PooledConnectionManagerStub.opened == 3
+
+    def test_warm_up_opens_concurrently(self, connections):
+        barrier = threading.Barrier(2, timeout=5)
+        opened = []
+
+        def open_together(connection):
+            barrier.wait()
+            opened.append(connection.name)
+            connection.handle = HandleStub()
+            connection.state = ConnectionState.OPEN
+            return connection
+
+        with mock.patch.object(PooledConnectionManagerStub, "open", side_effect=open_together):
+            connections.warm_up(2, parallelism=2)
+
+        assert sorted(opened) == ["warm_up_0", "warm_up_1"]
+
+    def test_warm_handles_are_handed_out_without_a_pool(self, unpooled):
+        unpooled.warm_up(2)
+        first = _use_connection(unpooled, "model.a")
+        handed_out = []
+        thread = threading.Thread(
+            target=lambda: handed_out.append(unpooled.set_connection_name("model.b").handle)
+        )
+        thread.start()
+        thread.join()
+
+        # released handles are closed as usual once the warm handles have been handed out
+        assert first.closed
+        assert not handed_out[0].closed
+        assert _use_connection(unpooled, "model.c") not in (first, handed_out[0])
+        assert UnpooledConnectionManagerStub.opened == 3
+        assert unpooled._warm_handles is None
+
+    def test_handles_warmed_up_after_the_warm_handles_are_dropped_are_closed(self, unpooled):
+        warmed = []
+
+        def open_stub(connection):
+            if connection.name == "warm_up_0":
+                # a node finds no warm handle while the handshake is in flight
+                _use_connection(unpooled, "model.a")
+            connection.handle = HandleStub()
+            connection.state = ConnectionState.OPEN
+            if connection.name == "warm_up_0":
+                warmed.append(connection.handle)
+            return connection
+
+        with mock.patch.object(UnpooledConnectionManagerStub, "open", side_effect=open_stub):
+            latencies = unpooled.warm_up(1)
+
+        assert len(latencies) == 1
+        assert unpooled._warm_handles is None
+        assert warmed[0].closed
+
+    def test_failed_handshakes_are_skipped(self, connections):
+        handles = iter([RuntimeError("no"), HandleStub()])
+
+        def open_or_fail(connection):
+            handle = next(handles)
+            if isinstance(handle, Exception):
+                raise handle
+            connection.handle = handle
+            connection.state = ConnectionState.OPEN
+            return connection
+
+        with mock.patch.object(PooledConnectionManagerStub, "open", side_effect=open_or_fail):
+            latencies = connections.warm_up(2, parallelism=1)
+
+        assert len(latencies) == 1
+        assert len(connections.pool) == 1
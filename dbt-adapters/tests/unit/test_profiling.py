@@ -0,0 +1,67 @@
+import json
+
+from dbt_common.events.contextvars import reset_contextvars, set_log_contextvars
+import pytest
+
+from dbt.adapters.profiling import Profiler, profile_phase, set_profiler
+from dbt.adapters.sql import SQLConnectionManager
+
+from tests.unit.test_sql_result import FakeCursor
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    set_profiler(profiler)
+    yield profiler
+    set_profiler(None)
+
+
+@pytest.fixture
+def node():
+    tokens = set_log_contextvars(node_info={"unique_id": "model.test.a"})
+    yield "model.test.a"
+    reset_contextvars("log_", **tokens)
+
+
+def _fetch():
+    cursor = FakeCursor([(1, "a"), (2, "b")], [("id", None), ("name", None)])
+    return SQLConnectionManager.get_result_from_cursor(cursor, None)
+
+
+class TestProfiling:
+    def test_disabled_records_nothing(self):
+        assert profile_phase("fetch") is profile_phase("execute")
+        _fetch()
+
+    def test_phases_are_recorded_per_node(self, profiler, node):
+        _fetch()
+        _fetch()
+
+        summary = profiler.summary()
+        assert summary["phases"]["fetch"]["count"] == 2
+        assert set(summary["nodes"][node]) == {"fetch", "convert"}
+        stats = summary["nodes"][node]["convert"]
+        assert 0 <= stats["max"] <= stats["total"]
+
+    def test_spans_without_a_node(self, profiler):
+        with profile_phase("acquire"):
+            pass
+        assert list(profiler.summary()["nodes"]) == ["<None>"]
+
+    def test_write_chrome_trace(self, profiler, node, tmp_path):
+        _fetch()
+        path = tmp_path / "trace.json"
+        profiler.write(str(path), "chrome")
+
+        events = json.loads(path.read_text())["traceEvents"]
+        assert [event["name"] for event in events] == ["fetch", "convert"]
+        assert all(event["ph"] == "X" and event["args"]["node"] == node for event in events)
+        assert events[0]["ts"] + events[0]["dur"] <= events[1]["ts"]
+
+    def test_write_json_summary(self, profiler, node, tmp_path):
+        _fetch()
+        path = tmp_path / "profile.json"
+        profiler.write(str(path))
+
+        assert json.loads(path.read_text())["nodes"][node]["fetch"]["count"] == 1
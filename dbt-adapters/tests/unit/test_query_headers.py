@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from dbt_common.exceptions.macros import CaughtMacroError
+import pytest
+
+from dbt.adapters.base.query_headers import (
+    MacroQueryStringSetter,
+    QueryHeaderContextWrapper,
+    StaticQueryString,
+)
+from dbt.adapters.clients.jinja import QueryStringGenerator
+from dbt.adapters.contracts.connection import QueryComment
+
+
+CONTEXT = {"target": {"name": "dev", "profile_name": "test"}, "dbt_version": "1.9.0"}
+
+
+def _macro(comment):
+    return "\n".join(
+        (
+            "{%- macro query_comment_macro(connection_name, node) -%}",
+            comment,
+            "{% endmacro %}",
+        )
+    )
+
+
+def _query_header(comment, append=None):
+    config = SimpleNamespace(query_comment=QueryComment(comment=comment, append=append))
+    return MacroQueryStringSetter(config, CONTEXT)
+
+
+class TestStaticQueryString:
+    @pytest.mark.parametrize(
+        "comment",
+        [
+            "  {{ connection_name }} on {{ target.name }} {}",
+            "{{ node.unique_id }} {{ node['name'] }} {{ target.missing }} {{ missing }}",
+            "{{- dbt_version -}} {{ 'quoted' }} {{ 1 }}",
+        ],
+    )
+    def test_renders_what_the_macro_renders(self, comment):
+        static = StaticQueryString.compile(_macro(comment), CONTEXT)
+        generator = QueryStringGenerator(_macro(comment), CONTEXT)
+        node = QueryHeaderContextWrapper(SimpleNamespace(unique_id="model.test.a", name="a"))
+
+        assert static is not None
+        for args in [("master", None), ("model.test.a", node)]:
+            assert static(*args) == generator(*args)
+
+    def test_errors_are_raised_by_jinja(self):
+        static = StaticQueryString.compile(_macro("{{ missing.name }}"), CONTEXT)
+
+        with pytest.raises(CaughtMacroError, match="'missing' is undefined"):
+            static("master", None)
+
+    @pytest.mark.parametrize(
+        "comment",
+        [
+            QueryComment().comment,
+            "{{ target.name | upper }}",
+            "{{ env_var('USER') }}",
+            "{% if node %}{{ node.unique_id }}{% endif %}",
+        ],
+    )
+    def test_macros_with_logic_are_not_compiled(self, comment):
+        assert StaticQueryString.compile(_macro(comment), CONTEXT) is None
+
+
+class TestMacroQueryStringSetter:
+    def test_static_comment(self):
+        query_header = _query_header("dbt {{ target.name }} {{ node.unique_id }}")
+        query_header.set("model.test.a", SimpleNamespace(unique_id="model.test.a"))
+
+        assert isinstance(query_header.generator, StaticQueryString)
+        assert query_header.add("select 1") == "/* dbt dev model.test.a */\nselect 1"
+
+    def test_comments_are_rendered_once_per_node(self):
+        query_header = _query_header(
+            "{% if node %}node_id: {{ node.unique_id }}{% endif %}", append=True
+        )
+        node = SimpleNamespace(unique_id="model.test.a")
+        with mock.patch.object(
+            query_header, "generator", wraps=query_header.generator
+        ) as generator:
+            for _ in range(3):
+                query_header.set("model.test.a", node)
+                query_header.reset()
+
+        # the comment for "master" was rendered when the query header was created
+        assert generator.call_count == 1
+        query_header.set("model.test.a", node)
+        assert query_header.add("select 1;") == "select 1\n/* node_id: model.test.a */;"
+
+    def test_contexts_without_unique_id_are_not_memoized(self):
+        query_header = _query_header("{{ node.name }}")
+        query_header.set("a", SimpleNamespace(name="first"))
+        query_header.set("a", SimpleNamespace(name="second"))
+
+        assert query_header.add("select 1") == "/* second */\nselect 1"
+
+    def test_comment_can_be_replaced(self):
+        query_header = _query_header("dbt")
+        query_header.comment.query_comment = "replaced"
+
+        assert query_header.add("select 1") == "/* replaced */\nselect 1"
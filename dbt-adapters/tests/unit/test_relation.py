@@ -1,5 +1,6 @@
 from dataclasses import dataclass, replace
 from datetime import datetime
+import pickle
 import pytest
 
 from dbt.adapters.base import BaseRelation
@@ -188,3 +189,91 @@ def test_create_ephemeral_from_uses_identifier():
     node = Node(name="name_should_not_be_used", identifier="test")
     ephemeral_relation = BaseRelation.create_ephemeral_from(node)
     assert str(ephemeral_relation) == "__dbt__cte__test"
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"path": {"identifier": "other"}},
+        {"quote_policy": {"identifier": False}},
+        {"include_policy": {"database": False}},
+        {"type": "view"},
+        {"limit": 10},
+        {"event_time_filter": {"field_name": "column", "start": "2020-01-01T00:00:00"}},
+    ],
+)
+def test_relations_differing_in_a_field_are_not_equal(changes):
+    relation = BaseRelation.create(database="db", schema="schema", identifier="table")
+    changed = relation.incorporate(**changes)
+
+    assert relation != changed
+    assert len({relation, changed}) == 2
+
+
+def test_equal_relations_have_equal_hashes():
+    relation = BaseRelation.create(
+        database="db", schema="schema", identifier="table", type=RelationType.Table
+    )
+    same = replace(relation, type="table")
+
+    assert relation.render() is relation.render()
+    assert relation == same
+    assert hash(relation) == hash(same)
+    assert {relation: 1}[same] == 1
+
+
+def test_pickled_relations_do_not_carry_their_identity_or_rendering():
+    relation = BaseRelation.create(database="db", schema="schema", identifier="table")
+    hash(relation)
+    relation.render()
+
+    unpickled = pickle.loads(pickle.dumps(relation))
+
+    assert "_identity_cache" not in unpickled.__dict__
+    assert "_render_cache" not in unpickled.__dict__
+    assert "_identity_cache" in relation.__dict__
+    assert unpickled == relation
+    assert unpickled.render() == relation.render()
+
+
+def test_render_follows_a_swapped_quote_character():
+    relation = BaseRelation.create(database="db", schema="schema", identifier="table")
+    assert relation.render() == '"db"."schema"."table"'
+
+    object.__setattr__(relation, "quote_character", "`")
+    assert relation.render() == "`db`.`schema`.`table`"
+    object.__setattr__(relation, "quote_character", '"')
+    assert relation.render() == '"db"."schema"."table"'
+
+
+def test_relation_set_is_faster_than_rendering_and_serializing():
+    """A benchmark against how relations used to be hashed and compared: by
+    rendering them on every hash and serializing both sides on every
+    comparison.
+    """
+    import time
+
+    @dataclass(frozen=True, eq=False, repr=False)
+    class UncachedRelation(BaseRelation):
+        def __eq__(self, other):
+            if not isinstance(other, self.__class__):
+                return False
+            return self.to_dict(omit_none=True) == other.to_dict(omit_none=True)
+
+        def __hash__(self):
+            return hash(".".join(part for _, part in self._render_iterator() if part is not None))
+
+    def build_and_probe(relation_class):
+        relations = [
+            relation_class.create(database="db", schema=f"schema_{i % 100}", identifier=f"t_{i}")
+            for i in range(100_000)
+        ]
+        start = time.perf_counter()
+        relation_set = set(relations)
+        assert all(relation in relation_set for relation in relations[::10])
+        return time.perf_counter() - start
+
+    uncached_time = build_and_probe(UncachedRelation)
+    elapsed = build_and_probe(BaseRelation)
+
+    assert elapsed < uncached_time
@@ -0,0 +1,138 @@
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.contracts.connection import ConnectionState
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.exceptions import FailedToConnectError
+from dbt.adapters.retry import RetryPolicy
+
+from tests.unit.fixtures.connection_manager import ConnectionManagerStub
+
+
+class Throttled(Exception):
+    pass
+
+
+@pytest.fixture
+def sleeps():
+    with mock.patch("dbt.adapters.retry.sleep") as sleep:
+        yield sleep
+
+
+def _failing(*errors, result="ok"):
+    return mock.Mock(side_effect=[*errors, result])
+
+
+class TestRetryPolicy:
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10, jitter=False)
+        assert [policy.backoff(n) for n in range(6)] == [1, 2, 4, 8, 10, 10]
+        assert policy.backoff(10000) == 10
+
+    def test_full_jitter(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        waits = [policy.backoff(3) for _ in range(200)]
+        assert all(0 <= wait <= 8 for wait in waits)
+        assert len(set(waits)) > 1
+
+    def test_retries_until_success(self, sleeps):
+        fn = _failing(Throttled(), Throttled())
+        on_retry = mock.Mock()
+        policy = RetryPolicy(retries=2, retryable_exceptions=(Throttled,))
+
+        assert policy.call(fn, "testing", on_retry=on_retry) == "ok"
+        assert fn.call_count == 3
+        assert sleeps.call_count == 2
+        assert on_retry.call_count == 2
+
+    def test_gives_up_after_retries(self, sleeps):
+        fn = _failing(Throttled("1"), Throttled("2"), Throttled("3"))
+        policy = RetryPolicy(retries=2, retryable_exceptions=(Throttled,))
+
+        with pytest.raises(Throttled, match="3"):
+            policy.call(fn, "testing")
+        assert fn.call_count == 3
+
+    def test_does_not_retry_other_errors(self, sleeps):
+        fn = _failing(ValueError())
+        policy = RetryPolicy(retries=2, retryable_exceptions=(Throttled,))
+
+        with pytest.raises(ValueError):
+            policy.call(fn, "testing")
+        sleeps.assert_not_called()
+
+    def test_classify(self, sleeps):
+        fn = _failing(ValueError("transient"), ValueError("fatal"))
+        policy = RetryPolicy(retries=5, classify=lambda e: "transient" in str(e))
+
+        with pytest.raises(ValueError, match="fatal"):
+            policy.call(fn, "testing")
+        assert fn.call_count == 2
+
+    def test_max_elapsed(self, sleeps):
+        fn = _failing(Throttled(), Throttled())
+        policy = RetryPolicy(
+            retries=5, retryable_exceptions=(Throttled,), base_delay=4, max_elapsed=5, jitter=False
+        )
+
+        with pytest.raises(Throttled):
+            policy.call(fn, "testing")
+        assert [c.args for c in sleeps.call_args_list] == [(4,)]
+
+    def test_retry_events(self, sleeps):
+        policy = RetryPolicy(retries=1, retryable_exceptions=(Throttled,), jitter=False)
+        with mock.patch("dbt.adapters.retry.fire_event") as fire_event:
+            policy.call(_failing(Throttled("slow down")), "testing", name="test")
+
+        (event,) = [c.args[0] for c in fire_event.call_args_list]
+        assert event.message() == (
+            "test adapter: Got a retryable error Throttled testing. Retry 1 of 1 in 1.00s. "
+            "Error:\nslow down"
+        )
+
+
+class TestRetryConnection:
+    @pytest.fixture
+    def connection(self):
+        return mock.Mock(state=ConnectionState.INIT, handle=None)
+
+    def test_retry_timeout(self, connection, sleeps):
+        connect = _failing(Throttled(), Throttled(), result="handle")
+        ConnectionManagerStub.retry_connection(
+            connection,
+            connect=connect,
+            logger=AdapterLogger("test"),
+            retryable_exceptions=[Throttled],
+            retry_limit=2,
+            retry_timeout=lambda attempt: attempt + 1,
+        )
+
+        assert connection.handle == "handle"
+        assert connection.state == ConnectionState.OPEN
+        assert [c.args for c in sleeps.call_args_list] == [(1,), (2,)]
+
+    def test_retry_policy(self, connection, sleeps):
+        connect = _failing(Throttled(), Throttled())
+        with pytest.raises(FailedToConnectError):
+            ConnectionManagerStub.retry_connection(
+                connection,
+                connect=connect,
+                logger=AdapterLogger("test"),
+                retryable_exceptions=[],
+                retry_policy=RetryPolicy(retries=1, retryable_exceptions=(Throttled,)),
+            )
+
+        assert connect.call_count == 2
+        assert connection.handle is None
+        assert connection.state == ConnectionState.FAIL
+
+    def test_negative_retry_timeout(self, connection):
+        with pytest.raises(FailedToConnectError, match="retry_timeout cannot be negative"):
+            ConnectionManagerStub.retry_connection(
+                connection,
+                connect=mock.Mock(),
+                logger=AdapterLogger("test"),
+                retryable_exceptions=[Throttled],
+                retry_timeout=-1,
+            )
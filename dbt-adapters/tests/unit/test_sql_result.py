@@ -1,5 +1,19 @@
+import datetime
+import decimal
+import time
+import tracemalloc
 import unittest
+from unittest import mock
 
+import agate
+
+from dbt.adapters.base.results import (
+    ResultColumn,
+    StreamingResult,
+    agate_type_for_name,
+    arrow_available,
+    table_from_arrow,
+)
 from dbt.adapters.sql import SQLConnectionManager
 
 
@@ -18,3 +32,283 @@ class TestProcessSQLResult(unittest.TestCase):
             list(SQLConnectionManager.process_results(cols_with_more_dupes, rows)),
             [{"a": 1, "a_2": 2, "a_3": 3, "b": 4}],
         )
+
+
+class FakeCursor:
+    def __init__(self, rows, description):
+        self.rows = list(rows)
+        self.description = description
+        self.fetch_sizes = []
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+
+class TestStreamingResult(unittest.TestCase):
+    def test_rows_are_fetched_in_batches(self):
+        cursor = FakeCursor([(i, str(i)) for i in range(5)], [("a", 1), ("b", 2)])
+        result = StreamingResult.from_cursor(cursor, batch_size=2)
+
+        # the first batch is fetched up front to describe the result
+        self.assertEqual(cursor.fetch_sizes, [2])
+        self.assertEqual(result.columns, [ResultColumn("a", 1), ResultColumn("b", 2)])
+        self.assertEqual([len(batch) for batch in result.batches()], [2, 2, 1])
+        self.assertEqual(cursor.fetch_sizes, [2, 2, 2, 2])
+
+    def test_limit_stops_fetching(self):
+        cursor = FakeCursor([(i,) for i in range(10)], [("a", None)])
+        result = StreamingResult.from_cursor(cursor, limit=3, batch_size=2)
+
+        self.assertEqual(list(result), [(0,), (1,), (2,)])
+        self.assertEqual(cursor.fetch_sizes, [2, 1])
+
+    def test_duplicated_columns(self):
+        cursor = FakeCursor([(1, 2, 3)], [("a", None), ("a", None), ("b", None)])
+        result = StreamingResult.from_cursor(cursor)
+        self.assertEqual(result.column_names, ["a", "a_2", "b"])
+
+    def test_no_result_set(self):
+        result = StreamingResult.from_cursor(FakeCursor([], None))
+        self.assertEqual(result.columns, [])
+        self.assertEqual(list(result), [])
+
+    def test_close_on_exhaustion(self):
+        on_close = mock.Mock()
+        cursor = FakeCursor([(1,)], [("a", None)])
+        result = StreamingResult.from_cursor(cursor, on_close=on_close)
+
+        list(result)
+        result.close()
+        on_close.assert_called_once_with()
+
+    def test_to_agate(self):
+        cursor = FakeCursor([(1, "x"), (2, "y")], [("a", None), ("b", None)])
+        table = StreamingResult.from_cursor(cursor, batch_size=1).to_agate()
+
+        self.assertEqual(table.column_names, ("a", "b"))
+        self.assertEqual([tuple(row) for row in table.rows], [(1, "x"), (2, "y")])
+
+    def test_process_rows(self):
+        cursor = FakeCursor([(1,), (2,)], [("a", None)])
+        result = StreamingResult.from_cursor(
+            cursor, process_rows=lambda rows: [(value * 10,) for (value,) in rows]
+        )
+        self.assertEqual(list(result), [(10,), (20,)])
+
+
+class TypedConnectionManager(SQLConnectionManager):
+    """Reports agate types for type codes that are the driver's type names."""
+
+    @classmethod
+    def agate_type_for_column(cls, column):
+        return agate_type_for_name(column[1])
+
+
+class TestResultFromCursor(unittest.TestCase):
+    description = [
+        ("id", "integer"),
+        ("amount", "numeric"),
+        ("name", "text"),
+        ("name", "text"),
+        ("is_active", "boolean"),
+        ("day", "date"),
+        ("updated_at", "timestamp"),
+    ]
+    rows = [
+        (1, decimal.Decimal("1.5"), "a", "", True, datetime.date(2020, 1, 1), None),
+        (2, None, "null", "b", False, None, datetime.datetime(2020, 1, 1, 1)),
+    ]
+
+    def test_typed_result_matches_inferred_result(self):
+        typed = TypedConnectionManager.get_result_from_cursor(
+            FakeCursor(self.rows, self.description), None
+        )
+        inferred = SQLConnectionManager.get_result_from_cursor(
+            FakeCursor(self.rows, self.description), None
+        )
+
+        self.assertEqual(typed.column_names, inferred.column_names)
+        self.assertEqual(
+            [type(column_type) for column_type in typed.column_types],
+            [type(column_type) for column_type in inferred.column_types],
+        )
+        self.assertEqual([tuple(row) for row in typed.rows], [tuple(row) for row in inferred.rows])
+        self.assertEqual(typed.rows[1]["name_2"], "b")
+
+    def test_float_values_are_loaded_as_decimals(self):
+        description = [("ratio", "float8"), ("amount", "numeric")]
+        rows = [(1.5, 2), (0.1, None)]
+        typed = TypedConnectionManager.get_result_from_cursor(FakeCursor(rows, description), None)
+        inferred = SQLConnectionManager.get_result_from_cursor(FakeCursor(rows, description), None)
+
+        self.assertEqual(
+            [tuple(row) for row in typed.rows],
+            [(decimal.Decimal("1.5"), decimal.Decimal(2)), (decimal.Decimal("0.1"), None)],
+        )
+        self.assertEqual([tuple(row) for row in typed.rows], [tuple(row) for row in inferred.rows])
+        self.assertEqual(
+            typed.aggregate(agate.Sum("ratio")), inferred.aggregate(agate.Sum("ratio"))
+        )
+
+    def test_boolean_values_are_loaded_as_booleans(self):
+        description = [("is_active", "boolean")]
+        table = TypedConnectionManager.get_result_from_cursor(
+            FakeCursor([(1,), (0,), (True,), (None,)], description), None
+        )
+
+        self.assertEqual([row["is_active"] for row in table.rows], [True, False, True, None])
+        self.assertTrue(all(type(row["is_active"]) is bool for row in table.rows[:3]))
+
+    def test_unknown_type_falls_back_to_inference(self):
+        description = [("id", "integer"), ("payload", "jsonb")]
+        table = TypedConnectionManager.get_result_from_cursor(
+            FakeCursor([(1, {"a": 1})], description), None
+        )
+        self.assertEqual(table.rows[0]["payload"], '{"a": 1}')
+
+
+@unittest.skipUnless(arrow_available(), "pyarrow is not installed")
+class TestTableFromArrow(unittest.TestCase):
+    def setUp(self):
+        import pyarrow
+
+        self.pyarrow = pyarrow
+
+    def test_typed_columns_match_row_result(self):
+        batch = self.pyarrow.RecordBatch.from_pydict(
+            {
+                "id": [1, 2],
+                "amount": self.pyarrow.array(
+                    [decimal.Decimal("1.5"), None], self.pyarrow.decimal128(10, 2)
+                ),
+                "name": ["a", "null"],
+                "is_active": [True, False],
+                "day": [datetime.date(2020, 1, 1), None],
+            }
+        )
+        table = table_from_arrow([batch], list(batch.schema.names))
+        inferred = SQLConnectionManager.get_result_from_cursor(
+            FakeCursor(
+                [tuple(row.values()) for row in batch.to_pylist()],
+                [(name, None) for name in batch.schema.names],
+            ),
+            None,
+        )
+
+        self.assertEqual(
+            [type(column_type) for column_type in table.column_types],
+            [type(column_type) for column_type in inferred.column_types],
+        )
+        self.assertEqual([tuple(row) for row in table.rows], [tuple(row) for row in inferred.rows])
+
+    def test_floats_are_loaded_as_decimals(self):
+        table = self.pyarrow.table(
+            {
+                "ratio": self.pyarrow.array([1.5, 0.1, None], self.pyarrow.float64()),
+                "small": self.pyarrow.array([0.5, None, 2.0], self.pyarrow.float32()),
+            }
+        )
+        typed = table_from_arrow([table], ["ratio", "small"])
+        inferred = SQLConnectionManager.get_result_from_cursor(
+            FakeCursor(
+                [tuple(row.values()) for row in table.to_pylist()],
+                [("ratio", None), ("small", None)],
+            ),
+            None,
+        )
+
+        self.assertEqual(
+            [tuple(row) for row in typed.rows],
+            [
+                (decimal.Decimal("1.5"), decimal.Decimal("0.5")),
+                (decimal.Decimal("0.1"), None),
+                (None, decimal.Decimal("2.0")),
+            ],
+        )
+        self.assertEqual([tuple(row) for row in typed.rows], [tuple(row) for row in inferred.rows])
+
+    def test_floats_are_decimals_when_falling_back_to_inference(self):
+        table = self.pyarrow.table({"ratio": [1.5], "tags": [["a"]]})
+        self.assertEqual(
+            table_from_arrow([table], ["ratio", "tags"]).rows[0]["ratio"], decimal.Decimal("1.5")
+        )
+
+    def test_timestamps_keep_their_offset(self):
+        utc = datetime.datetime(2020, 1, 1, 12, tzinfo=datetime.timezone.utc)
+        column = self.pyarrow.array(
+            [utc, None], self.pyarrow.timestamp("us", tz="America/New_York")
+        )
+        table = table_from_arrow([self.pyarrow.table({"ts": column})], ["ts"])
+
+        value = table.rows[0]["ts"]
+        self.assertEqual(value, utc)
+        self.assertEqual(value.hour, 7)
+        self.assertEqual(value.utcoffset(), datetime.timedelta(hours=-5))
+        self.assertIsNone(table.rows[1]["ts"])
+
+    def test_nested_columns_fall_back_to_inference(self):
+        table = self.pyarrow.table({"id": [1], "tags": [["a", "b"]]})
+        self.assertEqual(table_from_arrow([table], ["id", "tags"]).rows[0]["tags"], '["a", "b"]')
+
+    def test_limit_spans_batches(self):
+        batches = [self.pyarrow.RecordBatch.from_pydict({"id": [i, i + 1]}) for i in (0, 2)]
+        table = table_from_arrow(batches, ["id"], limit=3)
+        self.assertEqual([row["id"] for row in table.rows], [0, 1, 2])
+
+    def test_limit_stops_reading_batches(self):
+        read = []
+
+        def batches():
+            for i in range(0, 10, 2):
+                read.append(i)
+                yield self.pyarrow.RecordBatch.from_pydict({"id": [i, i + 1]})
+
+        table = table_from_arrow(batches(), ["id"], limit=4)
+        self.assertEqual([row["id"] for row in table.rows], [0, 1, 2, 3])
+        self.assertEqual(read, [0, 2])
+
+    def test_no_batches(self):
+        table = table_from_arrow([], ["id"])
+        self.assertEqual((table.column_names, len(table.rows)), (("id",), 0))
+
+
+class TestResultFromCursorBenchmark(unittest.TestCase):
+    """A benchmark of loading a wide result with and without known column types. Scale
+    num_rows up (e.g. to 1M) to reproduce the numbers for a large fetch.
+    """
+
+    num_rows = 20000
+    num_columns = 20
+
+    def _measure(self, connection_manager, cursor):
+        tracemalloc.start()
+        start = time.perf_counter()
+        table = connection_manager.get_result_from_cursor(cursor, None)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertEqual(len(table.rows), self.num_rows)
+        return elapsed, peak
+
+    def test_typed_result_is_faster_and_smaller(self):
+        description = [(f"column_{i}", "integer" if i % 2 else "text") for i in range(20)]
+        rows = [
+            tuple(i if j % 2 else f"value_{i}" for j in range(self.num_columns))
+            for i in range(self.num_rows)
+        ]
+
+        typed_time, typed_peak = self._measure(
+            TypedConnectionManager, FakeCursor(rows, description)
+        )
+        inferred_time, inferred_peak = self._measure(
+            SQLConnectionManager, FakeCursor(rows, description)
+        )
+
+        self.assertLess(typed_time, inferred_time)
+        self.assertLess(typed_peak, inferred_peak)
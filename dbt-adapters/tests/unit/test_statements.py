@@ -0,0 +1,61 @@
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.sql.statements import CONNECTOR_TRAILER, split_statements
+
+
+@pytest.mark.parametrize(
+    "sql,statements",
+    [
+        ("select 1", ["select 1"]),
+        ("select 1; select 2;", ["select 1;", "select 2;"]),
+        ("select 1;\n\n  select 2  ", ["select 1;", "select 2"]),
+        (
+            "select ';' as a, \"b;c\" from t; select 2",
+            ["select ';' as a, \"b;c\" from t;", "select 2"],
+        ),
+        ("select 'it''s'; select 2", ["select 'it''s';", "select 2"]),
+        ("select 1; -- one\n-- two\nselect 2", ["select 1; -- one\n-- two", "select 2"]),
+        ("select 1 /* ; */; select 2", ["select 1 /* ; */;", "select 2"]),
+        ("select $$ a; b $$; select 2", ["select $$ a; b $$;", "select 2"]),
+        ("select (1) ; select (2)", ["select (1) ;", "select (2)"]),
+        ("select 1;;", ["select 1;", ";"]),
+        ("", []),
+        ("  -- just a comment", ["-- just a comment"]),
+    ],
+)
+def test_split_statements(sql, statements):
+    # as split by sqlparse.split
+    assert split_statements(sql, mock.Mock()) == statements
+
+
+@pytest.mark.parametrize(
+    "sql,statements",
+    [
+        ("select 1; -- c1\n-- c2\nselect 2", ["select 1; -- c1", "-- c2\nselect 2"]),
+        ("select 1;\n-- c2\nselect 2", ["select 1;", "-- c2\nselect 2"]),
+        ("select 1; -- c1\nselect 2;", ["select 1; -- c1", "select 2;"]),
+        ("select 1;\r\n\r\nselect 2", ["select 1;", "select 2"]),
+    ],
+)
+def test_split_statements_with_connector_trailer(sql, statements):
+    # as split by snowflake.connector.util_text.split_statements
+    assert split_statements(sql, mock.Mock(), trailer=CONNECTOR_TRAILER) == statements
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "create procedure p() begin select 1; end; select 2",
+        "select 'unterminated; select 2",
+        "select (1; 2); select 3",
+        "select $tag$ a; b $tag$; select 2",
+        "select 'a\\'; b'; select 2",
+        "select 1 -- a\r; select 2; select 3",
+    ],
+)
+def test_falls_back_on_what_it_does_not_model(sql):
+    fallback = mock.Mock(return_value=["statements"])
+    assert split_statements(sql, fallback) == ["statements"]
+    fallback.assert_called_once_with(sql)
@@ -0,0 +1,106 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.token_cache import TokenCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with mock.patch("dbt.adapters.token_cache.monotonic", clock):
+        yield clock
+
+
+def _tokens(lifetime=600):
+    tokens = iter(range(100))
+    return mock.Mock(side_effect=lambda: (f"token_{next(tokens)}", lifetime))
+
+
+class TestTokenCache:
+    def test_tokens_are_fetched_once_until_refresh(self, clock):
+        cache, fetch = TokenCache(), _tokens()
+
+        assert cache.get("key", fetch, name="test") == "token_0"
+        clock.now += 250
+        assert cache.get("key", fetch, name="test") == "token_0"
+        assert cache.get("other", fetch, name="test") == "token_1"
+        # refreshed 300 seconds before expiring
+        clock.now += 100
+        assert cache.get("key", fetch, name="test") == "token_2"
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_short_lived_tokens_are_refreshed_halfway(self, clock):
+        cache, fetch = TokenCache(), _tokens(lifetime=60)
+        cache.get("key", fetch, name="test")
+        clock.now += 29
+        assert cache.get("key", fetch, name="test") == "token_0"
+        clock.now += 2
+        assert cache.get("key", fetch, name="test") == "token_1"
+
+    def test_concurrent_misses_fetch_once(self):
+        cache = TokenCache()
+        release = threading.Event()
+        fetch = mock.Mock(side_effect=lambda: release.wait(5) and ("token", 600))
+        tokens = []
+
+        threads = [
+            threading.Thread(target=lambda: tokens.append(cache.get("key", fetch, name="test")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ["token"] * 8
+        assert fetch.call_count == 1
+
+    def test_refreshing_does_not_block_other_threads(self, clock):
+        cache, fetch = TokenCache(), _tokens()
+        cache.get("key", fetch, name="test")
+        clock.now += 400
+        refreshing, release = threading.Event(), threading.Event()
+
+        def slow_fetch():
+            refreshing.set()
+            release.wait(5)
+            return "refreshed", 600
+
+        refresher = threading.Thread(target=lambda: cache.get("key", slow_fetch, name="test"))
+        refresher.start()
+        refreshing.wait(5)
+        assert cache.get("key", fetch, name="test") == "token_0"
+        release.set()
+        refresher.join()
+
+        assert cache.get("key", fetch, name="test") == "refreshed"
+        assert fetch.call_count == 1
+
+    def test_failed_refresh_keeps_the_token_until_it_expires(self, clock):
+        cache, fetch = TokenCache(), _tokens()
+        cache.get("key", fetch, name="test")
+        failing = mock.Mock(side_effect=RuntimeError("idp is down"))
+
+        clock.now += 400
+        assert cache.get("key", failing, name="test") == "token_0"
+        clock.now += 400
+        with pytest.raises(RuntimeError):
+            cache.get("key", failing, name="test")
+        assert failing.call_count == 2
+
+    def test_invalidate(self, clock):
+        cache, fetch = TokenCache(), _tokens()
+        cache.get("key", fetch, name="test")
+        cache.invalidate("key")
+        assert cache.get("key", fetch, name="test") == "token_1"
@@ -10,7 +10,7 @@ from typing import Any, ContextManager, Dict, List, Optional, Tuple
 
 from dbt_common.exceptions import ConnectionError, DbtRuntimeError
 from dbt_common.utils import md5
-from pyathena.connection import Connection as AthenaConnection
+from pyathena.connection import Connection as PyAthenaConnection
 from pyathena.cursor import Cursor
 from pyathena.error import OperationalError, ProgrammingError
 
@@ -35,7 +35,7 @@ from typing_extensions import Self
 from dbt.adapters.athena.config import get_boto3_config
 from dbt.adapters.athena.constants import LOGGER
 from dbt.adapters.athena.query_headers import AthenaMacroQueryStringSetter
-from dbt.adapters.athena.session import get_boto3_session
+from dbt.adapters.athena.session import Boto3ClientCache, get_boto3_session
 from dbt.adapters.contracts.connection import (
     AdapterResponse,
     Connection,
@@ -229,6 +229,13 @@ class AthenaCursor(Cursor):
         return inner()
 
 
+class AthenaConnection(PyAthenaConnection[AthenaCursor]):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # the boto3 clients of the adapter helpers, shared by the threads using this connection
+        self.boto3_clients = Boto3ClientCache(self.session)
+
+
 class AthenaConnectionManager(SQLConnectionManager):
     TYPE = "athena"
 
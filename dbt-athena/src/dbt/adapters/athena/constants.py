@@ -8,6 +8,8 @@ DEFAULT_SPARK_MAX_CONCURRENT_DPUS = 2
 DEFAULT_SPARK_EXECUTOR_DPU_SIZE = 1
 DEFAULT_CALCULATION_TIMEOUT = 43200  # seconds = 12 hours
 SESSION_IDLE_TIMEOUT_MIN = 10  # minutes
+# error codes of the keys that S3 DeleteObjects did not delete because of throttling
+S3_THROTTLING_ERROR_CODES = frozenset({"SlowDown", "ServiceUnavailable", "InternalError"})
 
 DEFAULT_SPARK_PROPERTIES = {
     # https://docs.aws.amazon.com/athena/latest/ug/notebooks-spark-table-formats.html
@@ -4,12 +4,29 @@ import posixpath as path
 import re
 import struct
 import tempfile
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, datetime
 from functools import lru_cache
+from itertools import count
+from multiprocessing.context import SpawnContext
 from textwrap import dedent
 from threading import Lock
-from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type
+from time import monotonic, sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -23,6 +40,7 @@ from mypy_boto3_athena.type_defs import DataCatalogTypeDef, GetWorkGroupOutputTy
 from mypy_boto3_glue.type_defs import (
     ColumnTypeDef,
     GetTableResponseTypeDef,
+    PartitionTypeDef,
     TableInputTypeDef,
     TableTypeDef,
     TableVersionTypeDef,
@@ -33,7 +51,7 @@ from dbt.adapters.athena import AthenaConnectionManager
 from dbt.adapters.athena.column import AthenaColumn
 from dbt.adapters.athena.config import get_boto3_config
 from dbt.adapters.athena.connections import AthenaCursor
-from dbt.adapters.athena.constants import LOGGER
+from dbt.adapters.athena.constants import LOGGER, S3_THROTTLING_ERROR_CODES
 from dbt.adapters.athena.exceptions import (
     S3LocationException,
     SnapshotMigrationRequired,
@@ -67,14 +85,13 @@ from dbt.adapters.base.impl import AdapterConfig
 from dbt.adapters.base.relation import BaseRelation, InformationSchema
 from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.contracts.relation import RelationConfig
+from dbt.adapters.retry import RetryPolicy
 from dbt.adapters.sql import SQLAdapter
 
 
 if TYPE_CHECKING:
     from mypy_boto3_glue.client import GlueClient
 
-boto3_client_lock = Lock()
-
 
 @dataclass
 class AthenaConfig(AdapterConfig):
@@ -132,6 +149,17 @@ class AthenaConfig(AdapterConfig):
 class AthenaAdapter(SQLAdapter):
     BATCH_CREATE_PARTITION_API_LIMIT = 100
     BATCH_DELETE_PARTITION_API_LIMIT = 25
+    S3_DELETE_OBJECTS_API_LIMIT = 1000
+    # the most S3 requests deleting files at once, within the default connection pool of boto3
+    S3_DELETE_PARALLELISM = 8
+    # how keys throttled by DeleteObjects are retried
+    S3_DELETE_RETRY_POLICY = RetryPolicy(retries=5, base_delay=0.5, max_delay=20.0)
+    # seconds a resolved data catalog is reused for
+    DATA_CATALOG_CACHE_TTL = 3600
+    # the segments the partitions of a table are listed in concurrently, at most 10
+    GET_PARTITIONS_SEGMENTS = 4
+    # the most tables whose partitions are cached, the least recently used are forgotten first
+    PARTITIONS_CACHE_TABLES = 32
     INTEGER_MAX_VALUE_32_BIT_SIGNED = 0x7FFFFFFF
 
     ConnectionManager = AthenaConnectionManager
@@ -167,19 +195,27 @@ class AthenaAdapter(SQLAdapter):
     def convert_datetime_type(cls, agate_table: agate.Table, col_idx: int) -> str:
         return "timestamp"
 
+    def __init__(self, config, mp_context: SpawnContext) -> None:
+        super().__init__(config, mp_context)
+        # data catalogs by database, with the time until which they are reused
+        self._data_catalogs: Dict[str, Tuple[float, Optional[DataCatalogTypeDef]]] = {}
+        # partitions by catalog id, schema and table, listed at most once per run while they are
+        # cached, least recently used first
+        self._partitions: "OrderedDict[Tuple[Optional[str], str, str], List[PartitionTypeDef]]" = (
+            OrderedDict()
+        )
+        # the generation of the listing in progress of each table, dropped when the table's
+        # partitions are forgotten, so that partitions listed meanwhile are not cached
+        self._partitions_listings: Dict[Tuple[Optional[str], str, str], int] = {}
+        self._partitions_generations = count()
+        self._partitions_lock = Lock()
+
     @available
     def add_lf_tags_to_database(self, relation: AthenaRelation) -> None:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         if lf_tags := conn.credentials.lf_tags_database:
             config = LfTagsConfig(enabled=True, tags=lf_tags)
-            with boto3_client_lock:
-                lf_client = client.session.client(
-                    "lakeformation",
-                    client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            lf_client = self._get_boto3_client("lakeformation")
             manager = LfTagsManager(lf_client, relation, config)
             manager.process_lf_tags_database()
         else:
@@ -189,15 +225,7 @@ class AthenaAdapter(SQLAdapter):
     def add_lf_tags(self, relation: AthenaRelation, lf_tags_config: Dict[str, Any]) -> None:
         config = LfTagsConfig(**lf_tags_config)
         if config.enabled:
-            conn = self.connections.get_thread_connection()
-            creds = conn.credentials
-            client = conn.handle
-            with boto3_client_lock:
-                lf_client = client.session.client(
-                    "lakeformation",
-                    client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            lf_client = self._get_boto3_client("lakeformation")
             manager = LfTagsManager(lf_client, relation, config)
             manager.process_lf_tags()
             return
@@ -207,37 +235,33 @@ class AthenaAdapter(SQLAdapter):
     def apply_lf_grants(self, relation: AthenaRelation, lf_grants_config: Dict[str, Any]) -> None:
         lf_config = LfGrantsConfig(**lf_grants_config)
         if lf_config.data_cell_filters.enabled:
-            conn = self.connections.get_thread_connection()
-            creds = conn.credentials
-            client = conn.handle
-            with boto3_client_lock:
-                lf = client.session.client(
-                    "lakeformation",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            lf = self._get_boto3_client("lakeformation")
             catalog = self._get_data_catalog(relation.database)  # type:ignore
             catalog_id = get_catalog_id(catalog)
             lf_permissions = LfPermissions(catalog_id, relation, lf)  # type: ignore
             lf_permissions.process_filters(lf_config)
             lf_permissions.process_permissions(lf_config)
 
+    def _get_boto3_client(self, service_name: str) -> Any:
+        """
+        Returns the boto3 client of the thread connection for the service
+        """
+        conn = self.connections.get_thread_connection()
+        client = conn.handle
+        return client.boto3_clients.client(
+            service_name,
+            client.region_name,
+            get_boto3_config(num_retries=conn.credentials.effective_num_retries),
+        )
+
     @lru_cache()
     def _get_work_group(self, work_group: str) -> GetWorkGroupOutputTypeDef:
         """
         helper function to cache the result of the get_work_group to avoid APIs throttling
         """
         LOGGER.debug("get_work_group for %s", work_group)
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
-        with boto3_client_lock:
-            athena_client = client.session.client(
-                "athena",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        athena_client = self._get_boto3_client("athena")
 
         return athena_client.get_work_group(WorkGroup=work_group)
 
@@ -340,19 +364,10 @@ class AthenaAdapter(SQLAdapter):
         """
         Helper function to get a relation via Glue
         """
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         try:
             table = glue_client.get_table(
@@ -402,19 +417,10 @@ class AthenaAdapter(SQLAdapter):
 
     @available
     def clean_up_partitions(self, relation: AthenaRelation, where_condition: str) -> None:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
         paginator = glue_client.get_paginator("get_partitions")
         partition_params = {
             "CatalogId": catalog_id,
@@ -423,16 +429,47 @@ class AthenaAdapter(SQLAdapter):
             "Expression": where_condition,
             "ExcludeColumnSchema": True,
         }
-        partition_pg = paginator.paginate(**partition_params)
-        partitions = partition_pg.build_full_result().get("Partitions")
-        for partition in partitions:
-            self.delete_from_s3(partition["StorageDescriptor"]["Location"])
-            glue_client.delete_partition(
-                CatalogId=catalog_id,
-                DatabaseName=relation.schema,
-                TableName=relation.identifier,
-                PartitionValues=partition["Values"],
+        s3_client = self._get_boto3_client("s3")
+        errors = []
+        try:
+            # the data of the partitions is deleted a page at a time, that of all the partitions of
+            # a page concurrently. The data of each partition is deleted one request at a time, as
+            # the partitions already run in parallel. The partitions themselves are only deleted
+            # once all of them are listed, so that the pages are not listed from a changing table.
+            partition_values: List[List[str]] = []
+            with ThreadPoolExecutor(max_workers=self.S3_DELETE_PARALLELISM) as executor:
+                for page in paginator.paginate(**partition_params):
+                    partitions = page.get("Partitions", [])
+                    for _ in executor.map(
+                        lambda partition: self._delete_s3_prefix(
+                            s3_client, partition["StorageDescriptor"]["Location"], parallelism=1
+                        ),
+                        partitions,
+                    ):
+                        pass
+                    partition_values.extend(partition["Values"] for partition in partitions)
+            for values_batch in get_chunks(
+                partition_values, AthenaAdapter.BATCH_DELETE_PARTITION_API_LIMIT
+            ):
+                response = glue_client.batch_delete_partition(
+                    CatalogId=catalog_id,
+                    DatabaseName=relation.schema,
+                    TableName=relation.identifier,
+                    PartitionsToDelete=[{"Values": values} for values in values_batch],
+                )
+                errors.extend(response.get("Errors", []))
+        finally:
+            self._forget_table_partitions(catalog_id, relation.schema, relation.identifier)
+
+        for err in errors:
+            LOGGER.error(
+                "Failed to delete partition: Values='{}', Code='{}', Message='{}'",
+                err["PartitionValues"],
+                err["ErrorDetail"].get("ErrorCode"),
+                err["ErrorDetail"].get("ErrorMessage"),
             )
+        if errors:
+            raise DbtRuntimeError(f"Failed to delete partitions of {relation.render()}.")
 
     @available
     def clean_up_table(self, relation: AthenaRelation) -> None:
@@ -472,10 +509,6 @@ class AthenaAdapter(SQLAdapter):
         external_location: Optional[str] = None,
         seed_s3_upload_args: Optional[Dict[str, Any]] = None,
     ) -> str:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         # TODO: consider using the workgroup default location when configured
         s3_location = self.generate_s3_location(
             relation, s3_data_dir, s3_data_naming, external_location=external_location
@@ -485,17 +518,12 @@ class AthenaAdapter(SQLAdapter):
         file_name = f"{relation.identifier}.csv"
         object_name = path.join(prefix, file_name)
 
-        with boto3_client_lock:
-            s3_client = client.session.client(
-                "s3",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
-            # This ensures cross-platform support, tempfile.NamedTemporaryFile does not
-            tmpfile = os.path.join(tempfile.gettempdir(), os.urandom(24).hex())
-            table.to_csv(tmpfile, quoting=csv.QUOTE_NONNUMERIC)
-            s3_client.upload_file(tmpfile, bucket, object_name, ExtraArgs=seed_s3_upload_args)
-            os.remove(tmpfile)
+        s3_client = self._get_boto3_client("s3")
+        # This ensures cross-platform support, tempfile.NamedTemporaryFile does not
+        tmpfile = os.path.join(tempfile.gettempdir(), os.urandom(24).hex())
+        table.to_csv(tmpfile, quoting=csv.QUOTE_NONNUMERIC)
+        s3_client.upload_file(tmpfile, bucket, object_name, ExtraArgs=seed_s3_upload_args)
+        os.remove(tmpfile)
 
         return str(s3_location)
 
@@ -503,41 +531,98 @@ class AthenaAdapter(SQLAdapter):
     def delete_from_s3(self, s3_path: str) -> None:
         """
         Deletes files from s3 given a s3 path in the format: s3://my_bucket/prefix
-        Additionally, parses the response from the s3 delete request and raises
-        a DbtRuntimeError in case it included errors.
+        Additionally, parses the responses from the s3 delete requests and raises
+        a DbtRuntimeError in case they included errors.
+        """
+        self._delete_s3_prefix(self._get_boto3_client("s3"), s3_path)
+
+    def _delete_s3_prefix(
+        self, s3_client: Any, s3_path: str, parallelism: Optional[int] = None
+    ) -> None:
+        """
+        Deletes the files under a s3 path. The keys are listed a page at a time, and deleted with
+        DeleteObjects requests of S3_DELETE_OBJECTS_API_LIMIT keys, at most `parallelism`
+        (S3_DELETE_PARALLELISM by default) at once.
+        The client is passed in, so that it can be called from other threads than the adapter's.
         """
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         bucket_name, prefix = self._parse_s3_path(s3_path)
-        if self._s3_path_exists(bucket_name, prefix):
-            s3_resource = client.session.resource(
-                "s3",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
-            s3_bucket = s3_resource.Bucket(bucket_name)
-            LOGGER.debug(
-                f"Deleting table data: path='{s3_path}', bucket='{bucket_name}', prefix='{prefix}'"
+        LOGGER.debug(
+            f"Deleting table data: path='{s3_path}', bucket='{bucket_name}', prefix='{prefix}'"
+        )
+        parallelism = parallelism or self.S3_DELETE_PARALLELISM
+        paginator = s3_client.get_paginator("list_objects_v2")
+        deleted = 0
+        errors: List[Dict[str, Any]] = []
+        pending: Set[Future[Tuple[int, List[Dict[str, Any]]]]] = set()
+
+        def collect(done: Iterable[Future[Tuple[int, List[Dict[str, Any]]]]]) -> None:
+            nonlocal deleted
+            for future in done:
+                batch_deleted, batch_errors = future.result()
+                deleted += batch_deleted
+                errors.extend(batch_errors)
+
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                keys = [obj["Key"] for obj in page.get("Contents", [])]
+                for key_batch in get_chunks(keys, AthenaAdapter.S3_DELETE_OBJECTS_API_LIMIT):
+                    pending.add(
+                        executor.submit(self._delete_s3_objects, s3_client, bucket_name, key_batch)
+                    )
+                # keep listing only while few deletions are waiting, so that memory stays bounded
+                while len(pending) > 2 * parallelism:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                if deleted:
+                    LOGGER.debug(f"Deleted {deleted} files from '{s3_path}' so far")
+            collect(pending)
+
+        for err in errors:
+            LOGGER.error(
+                "Failed to delete files: Key='{}', Code='{}', Message='{}', s3_bucket='{}'",
+                err["Key"],
+                err["Code"],
+                err["Message"],
+                bucket_name,
             )
-            response = s3_bucket.objects.filter(Prefix=prefix).delete()
-            is_all_successful = True
-            for res in response:
-                if "Errors" in res:
-                    for err in res["Errors"]:
-                        is_all_successful = False
-                        LOGGER.error(
-                            "Failed to delete files: Key='{}', Code='{}', Message='{}', s3_bucket='{}'",
-                            err["Key"],
-                            err["Code"],
-                            err["Message"],
-                            bucket_name,
-                        )
-            if is_all_successful is False:
-                raise DbtRuntimeError("Failed to delete files from S3.")
+        if errors:
+            raise DbtRuntimeError("Failed to delete files from S3.")
+        if deleted:
+            LOGGER.debug(f"Deleted {deleted} files from '{s3_path}'")
         else:
             LOGGER.debug("S3 path does not exist")
 
+    def _delete_s3_objects(
+        self, s3_client: Any, bucket_name: str, keys: List[str]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Deletes the keys with one DeleteObjects request, retrying the keys S3 throttled with
+        S3_DELETE_RETRY_POLICY. Returns the number of keys deleted and the errors of the others.
+        """
+        policy = self.S3_DELETE_RETRY_POLICY
+        deleted = 0
+        failed: List[Dict[str, Any]] = []
+        attempt = 0
+        while True:
+            response = s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            deleted += len(keys) - len(errors)
+            throttled: List[Dict[str, Any]] = []
+            for err in errors:
+                (throttled if err["Code"] in S3_THROTTLING_ERROR_CODES else failed).append(err)
+            if not throttled or attempt >= policy.retries:
+                return deleted, failed + throttled
+            keys = [err["Key"] for err in throttled]
+            delay = policy.backoff(attempt)
+            LOGGER.debug(
+                f"{len(keys)} files were throttled by S3, retrying to delete them in {delay:.2f}s"
+            )
+            sleep(delay)
+            attempt += 1
+
     @staticmethod
     def _parse_s3_path(s3_path: str) -> Tuple[str, str]:
         """
@@ -550,20 +635,6 @@ class AthenaAdapter(SQLAdapter):
         prefix = o.path.lstrip("/").rstrip("/") + "/"
         return bucket_name, prefix
 
-    def _s3_path_exists(self, s3_bucket: str, s3_prefix: str) -> bool:
-        """Checks whether a given s3 path exists."""
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-        with boto3_client_lock:
-            s3_client = client.session.client(
-                "s3",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
-        response = s3_client.list_objects_v2(Bucket=s3_bucket, Prefix=s3_prefix)
-        return True if "Contents" in response else False
-
     def _get_one_table_for_catalog(
         self, table: TableTypeDef, database: str
     ) -> List[Dict[str, Any]]:
@@ -629,16 +700,8 @@ class AthenaAdapter(SQLAdapter):
         data_catalog = self._get_data_catalog(information_schema.database)  # type:ignore
         data_catalog_type = get_catalog_type(data_catalog)
 
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         if data_catalog_type == AthenaCatalogType.GLUE:
-            with boto3_client_lock:
-                glue_client = client.session.client(
-                    "glue",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            glue_client = self._get_boto3_client("glue")
 
             catalog = []
             paginator = glue_client.get_paginator("get_tables")
@@ -662,12 +725,7 @@ class AthenaAdapter(SQLAdapter):
                         )
             table = agate.Table.from_object(catalog)
         else:
-            with boto3_client_lock:
-                athena_client = client.session.client(
-                    "athena",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            athena_client = self._get_boto3_client("athena")
 
             catalog = []
             paginator = athena_client.get_paginator("list_table_metadata")
@@ -696,35 +754,172 @@ class AthenaAdapter(SQLAdapter):
         """
         info_schema_name_map = AthenaSchemaSearchMap()
         for relation_config in relation_configs:
-            relation = self.Relation.create_from(
-                quoting=self.config, relation_config=relation_config
+            info_schema_name_map.add(
+                cast(AthenaRelation, self.relation_from_config(relation_config))
             )
-            info_schema_name_map.add(relation)
         return info_schema_name_map
 
     def _get_data_catalog(self, database: str) -> Optional[DataCatalogTypeDef]:
+        """
+        Returns the data catalog of the database, resolved at most once per DATA_CATALOG_CACHE_TTL
+        """
+        if not database:
+            return None
+        now = monotonic()
+        cached = self._data_catalogs.get(database)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        data_catalog = self._resolve_data_catalog(database)
+        self._data_catalogs[database] = (now + self.DATA_CATALOG_CACHE_TTL, data_catalog)
+        return data_catalog
+
+    def _resolve_data_catalog(self, database: str) -> Optional[DataCatalogTypeDef]:
         if database:
-            conn = self.connections.get_thread_connection()
-            creds = conn.credentials
-            client = conn.handle
             if database.lower() == "awsdatacatalog":
-                with boto3_client_lock:
-                    sts = client.session.client(
-                        "sts",
-                        region_name=client.region_name,
-                        config=get_boto3_config(num_retries=creds.effective_num_retries),
-                    )
+                sts = self._get_boto3_client("sts")
                 catalog_id = sts.get_caller_identity()["Account"]
                 return {"Name": database, "Type": "GLUE", "Parameters": {"catalog-id": catalog_id}}
-            with boto3_client_lock:
-                athena = client.session.client(
-                    "athena",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            athena = self._get_boto3_client("athena")
             return athena.get_data_catalog(Name=database)["DataCatalog"]
         return None
 
+    @staticmethod
+    def _partitions_key(
+        catalog_id: Optional[str], schema: Optional[str], table: Optional[str]
+    ) -> Tuple[Optional[str], str, str]:
+        # glue stores names in lower case
+        return catalog_id, str(schema).lower(), str(table).lower()
+
+    def _get_table_partitions(
+        self,
+        glue_client: "GlueClient",
+        catalog_id: Optional[str],
+        schema: Optional[str],
+        table: Optional[str],
+    ) -> List[PartitionTypeDef]:
+        """
+        Returns the partitions of a table, listed at most once per run: they are kept in sync with
+        the adapter's own changes to them, and listed again after it ran a query on the table.
+        """
+        key = self._partitions_key(catalog_id, schema, table)
+        with self._partitions_lock:
+            partitions = self._partitions.get(key)
+            if partitions is not None:
+                self._partitions.move_to_end(key)
+            else:
+                generation = next(self._partitions_generations)
+                self._partitions_listings[key] = generation
+        if partitions is not None:
+            LOGGER.debug(f"Using the {len(partitions)} cached partitions of {schema}.{table}")
+            return list(partitions)
+
+        partitions = self._list_table_partitions(glue_client, catalog_id, schema, table)
+        with self._partitions_lock:
+            # the partitions are cached by the latest listing of the table, unless they were
+            # forgotten while it was listed
+            if self._partitions_listings.get(key) == generation:
+                del self._partitions_listings[key]
+                self._store_table_partitions(key, partitions)
+        return list(partitions)
+
+    def _list_table_partitions(
+        self,
+        glue_client: "GlueClient",
+        catalog_id: Optional[str],
+        schema: Optional[str],
+        table: Optional[str],
+    ) -> List[PartitionTypeDef]:
+        paginator = glue_client.get_paginator("get_partitions")
+
+        def list_segment(segment_number: int) -> List[PartitionTypeDef]:
+            partition_params: Dict[str, Any] = {
+                "CatalogId": catalog_id,
+                "DatabaseName": schema,
+                "TableName": table,
+                "Segment": {
+                    "SegmentNumber": segment_number,
+                    "TotalSegments": self.GET_PARTITIONS_SEGMENTS,
+                },
+            }
+            return paginator.paginate(**partition_params).build_full_result().get("Partitions", [])
+
+        # a partition changed while the segments are listed can be listed twice, its latest
+        # version is kept
+        partitions: Dict[Tuple[str, ...], PartitionTypeDef] = {}
+        changed_at = self._partition_changed_at
+        with ThreadPoolExecutor(max_workers=self.GET_PARTITIONS_SEGMENTS) as executor:
+            for segment in executor.map(list_segment, range(self.GET_PARTITIONS_SEGMENTS)):
+                for partition in segment:
+                    values = tuple(partition["Values"])
+                    listed = partitions.get(values)
+                    if listed is None or changed_at(partition) >= changed_at(listed):
+                        partitions[values] = partition
+        LOGGER.debug(f"Listed {len(partitions)} partitions of {schema}.{table}")
+        return list(partitions.values())
+
+    @staticmethod
+    def _partition_changed_at(partition: PartitionTypeDef) -> float:
+        times = [partition.get("CreationTime"), partition.get("LastAccessTime")]
+        return max((time.timestamp() for time in times if time is not None), default=0.0)
+
+    def _cache_table_partitions(
+        self,
+        catalog_id: Optional[str],
+        schema: Optional[str],
+        table: Optional[str],
+        partitions: List[PartitionTypeDef],
+    ) -> None:
+        key = self._partitions_key(catalog_id, schema, table)
+        with self._partitions_lock:
+            self._partitions_listings.pop(key, None)
+            self._store_table_partitions(key, partitions)
+
+    def _store_table_partitions(
+        self, key: Tuple[Optional[str], str, str], partitions: List[PartitionTypeDef]
+    ) -> None:
+        # called with the partitions lock held
+        self._partitions[key] = partitions
+        self._partitions.move_to_end(key)
+        while len(self._partitions) > self.PARTITIONS_CACHE_TABLES:
+            self._partitions.popitem(last=False)
+
+    def _forget_table_partitions(
+        self, catalog_id: Optional[str], schema: Optional[str], table: Optional[str]
+    ) -> None:
+        key = self._partitions_key(catalog_id, schema, table)
+        with self._partitions_lock:
+            self._partitions_listings.pop(key, None)
+            self._partitions.pop(key, None)
+
+    def _forget_partitions_of_schemas_in(self, code: str) -> None:
+        """
+        Forgets the cached partitions of the tables, and those being listed, in the schemas named
+        in a query or in the default schema, which unqualified names resolve to: the query may
+        have changed them
+        """
+        schemas = set(re.findall(r"\w+", code.lower()))
+        schemas.add(str(self.config.credentials.schema).lower())
+        with self._partitions_lock:
+            for key in [key for key in self._partitions_listings if key[1] in schemas]:
+                del self._partitions_listings[key]
+            for key in [key for key in self._partitions if key[1] in schemas]:
+                del self._partitions[key]
+
+    def _relations_cache_for_schemas(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        cache_schemas: Optional[Set[BaseRelation]] = None,
+        clear: bool = False,
+    ) -> None:
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(relation_configs)
+        # resolve each data catalog once, before its schemas are listed concurrently
+        for database in sorted(
+            {str(schema.database) for schema in cache_schemas if schema.database}
+        ):
+            self._get_data_catalog(database)
+        super()._relations_cache_for_schemas(relation_configs, cache_schemas, clear)
+
     @available
     def list_relations_without_caching(
         self, schema_relation: AthenaRelation
@@ -734,15 +929,7 @@ class AthenaAdapter(SQLAdapter):
             # For non-Glue Data Catalogs, use the original Athena query against INFORMATION_SCHEMA approach
             return super().list_relations_without_caching(schema_relation)
 
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         kwargs = {
             "DatabaseName": schema_relation.schema,
@@ -814,19 +1001,10 @@ class AthenaAdapter(SQLAdapter):
 
     @available
     def swap_table(self, src_relation: AthenaRelation, target_relation: AthenaRelation) -> None:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(src_relation.database)  # type:ignore
         src_catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         src_table = glue_client.get_table(
             CatalogId=src_catalog_id,
@@ -834,29 +1012,15 @@ class AthenaAdapter(SQLAdapter):
             Name=src_relation.identifier,
         ).get("Table")
 
-        src_table_get_partitions_paginator = glue_client.get_paginator("get_partitions")
-        src_table_partitions_result = src_table_get_partitions_paginator.paginate(
-            **{
-                "CatalogId": src_catalog_id,
-                "DatabaseName": src_relation.schema,
-                "TableName": src_relation.identifier,
-            }
+        src_table_partitions = self._get_table_partitions(
+            glue_client, src_catalog_id, src_relation.schema, src_relation.identifier
         )
-        src_table_partitions = src_table_partitions_result.build_full_result().get("Partitions")
 
         data_catalog = self._get_data_catalog(src_relation.database)  # type:ignore
         target_catalog_id = get_catalog_id(data_catalog)
 
-        target_get_partitions_paginator = glue_client.get_paginator("get_partitions")
-        target_table_partitions_result = target_get_partitions_paginator.paginate(
-            **{
-                "CatalogId": target_catalog_id,
-                "DatabaseName": target_relation.schema,
-                "TableName": target_relation.identifier,
-            }
-        )
-        target_table_partitions = target_table_partitions_result.build_full_result().get(
-            "Partitions"
+        target_table_partitions = self._get_table_partitions(
+            glue_client, target_catalog_id, target_relation.schema, target_relation.identifier
         )
 
         target_table_version = {
@@ -868,6 +1032,10 @@ class AthenaAdapter(SQLAdapter):
             "Description": src_table.get("Description", ""),
         }
 
+        # the partitions of the target are cached again once they are all replaced
+        self._forget_table_partitions(
+            target_catalog_id, target_relation.schema, target_relation.identifier
+        )
         # perform a table swap
         glue_client.update_table(
             CatalogId=target_catalog_id,
@@ -894,11 +1062,12 @@ class AthenaAdapter(SQLAdapter):
                     ],
                 )
 
+        errors = []
         if src_table_partitions:
             for partition_batch in get_chunks(
                 src_table_partitions, AthenaAdapter.BATCH_CREATE_PARTITION_API_LIMIT
             ):
-                glue_client.batch_create_partition(
+                response = glue_client.batch_create_partition(
                     CatalogId=target_catalog_id,
                     DatabaseName=target_relation.schema,
                     TableName=target_relation.identifier,
@@ -911,6 +1080,24 @@ class AthenaAdapter(SQLAdapter):
                         for partition in partition_batch
                     ],
                 )
+                errors.extend(response.get("Errors", []))
+
+        # the partitions of the source have been consumed
+        self._forget_table_partitions(src_catalog_id, src_relation.schema, src_relation.identifier)
+        if not errors:
+            self._cache_table_partitions(
+                target_catalog_id,
+                target_relation.schema,
+                target_relation.identifier,
+                [
+                    {
+                        **partition,
+                        "DatabaseName": target_relation.schema,  # type:ignore
+                        "TableName": target_relation.identifier,  # type:ignore
+                    }
+                    for partition in src_table_partitions
+                ],
+            )
 
     def _get_glue_table_versions_to_expire(
         self, relation: AthenaRelation, to_keep: int
@@ -918,16 +1105,7 @@ class AthenaAdapter(SQLAdapter):
         """
         Given a table and the amount of its version to keep, it returns the versions to delete
         """
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         paginator = glue_client.get_paginator("get_table_versions")
         response_iterator = paginator.paginate(
@@ -947,19 +1125,10 @@ class AthenaAdapter(SQLAdapter):
     def expire_glue_table_versions(
         self, relation: AthenaRelation, to_keep: int, delete_s3: bool
     ) -> List[str]:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         versions_to_delete = self._get_glue_table_versions_to_expire(relation, to_keep)
         LOGGER.debug(f"Versions to delete: {[v['VersionId'] for v in versions_to_delete]}")
@@ -1008,19 +1177,10 @@ class AthenaAdapter(SQLAdapter):
             after CREATE OR REPLACE VIEW or ALTER TABLE statements.
             Every dbt run should create not more than one table version.
         """
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         # By default, there is no need to update Glue Table
         need_to_update_table = False
@@ -1150,16 +1310,7 @@ class AthenaAdapter(SQLAdapter):
 
     @available
     def list_schemas(self, database: str) -> List[str]:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         paginator = glue_client.get_paginator("get_databases")
         result = []
@@ -1176,19 +1327,10 @@ class AthenaAdapter(SQLAdapter):
 
     @available
     def get_columns_in_relation(self, relation: AthenaRelation) -> List[AthenaColumn]:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
         get_table_kwargs = dict(
             DatabaseName=relation.schema,
@@ -1224,20 +1366,12 @@ class AthenaAdapter(SQLAdapter):
         schema_name = relation.schema
         table_name = relation.identifier
 
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._get_boto3_client("glue")
 
+        self._forget_table_partitions(catalog_id, schema_name, table_name)
         try:
             glue_client.delete_table(
                 CatalogId=catalog_id, DatabaseName=schema_name, Name=table_name
@@ -1254,20 +1388,12 @@ class AthenaAdapter(SQLAdapter):
 
     @available
     def drop_glue_database(self, database_name: str, catalog_name: str = "awsdatacatalog") -> None:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         catalog = self._get_data_catalog(catalog_name)
         catalog_id = get_catalog_id(catalog)
 
-        with boto3_client_lock:
-            glue_client: GlueClient = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
-            glue_client.delete_database(Name=database_name, CatalogId=catalog_id)
-            LOGGER.debug(f"Glue database successfully deleted: {catalog_name}.{database_name}")
+        glue_client: GlueClient = self._get_boto3_client("glue")
+        glue_client.delete_database(Name=database_name, CatalogId=catalog_id)
+        LOGGER.debug(f"Glue database successfully deleted: {catalog_name}.{database_name}")
 
     @available.parse_none
     def valid_snapshot_target(self, relation: BaseRelation) -> None:
@@ -1478,8 +1604,30 @@ class AthenaAdapter(SQLAdapter):
         except OperationalError as e:
             LOGGER.debug(f"CAUGHT EXCEPTION: {e}")
             raise e
+        finally:
+            self._forget_partitions_of_schemas_in(sql)
         return cursor
 
+    def execute(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        limit: Optional[int] = None,
+    ) -> Tuple[AdapterResponse, agate.Table]:
+        try:
+            return super().execute(sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+        finally:
+            self._forget_partitions_of_schemas_in(sql)
+
+    def submit_python_job(
+        self, parsed_model: Dict[str, Any], compiled_code: str
+    ) -> AdapterResponse:
+        try:
+            return super().submit_python_job(parsed_model, compiled_code)
+        finally:
+            self._forget_partitions_of_schemas_in(compiled_code)
+
     @classmethod
     def _get_adapter_specific_run_info(cls, config: RelationConfig) -> Dict[str, Any]:
         try:
@@ -51,26 +51,17 @@ class AthenaRelation(BaseRelation):
         - https://aws.amazon.com/athena/faqs/ "Q: How do I create tables and schemas for my data on Amazon S3?"
         - https://cwiki.apache.org/confluence/display/Hive/LanguageManual+DDL
         """
-
-        old_quote_character = self.quote_character
-        object.__setattr__(self, "quote_character", "`")  # Hive quote char
-        old_include_policy = self.include_policy
-        object.__setattr__(self, "include_policy", AthenaHiveIncludePolicy())
-        rendered = self.render()
-        object.__setattr__(self, "quote_character", old_quote_character)
-        object.__setattr__(self, "include_policy", old_include_policy)
-        return str(rendered)
+        # ` is the Hive quote character
+        return str(
+            self.replace(quote_character="`", include_policy=AthenaHiveIncludePolicy()).render()
+        )
 
     def render_pure(self) -> str:
         """
         Render relation without quotes characters.
         This is needed for not standard executions like optimize and vacuum
         """
-        old_value = self.quote_character
-        object.__setattr__(self, "quote_character", "")
-        rendered = self.render()
-        object.__setattr__(self, "quote_character", old_value)
-        return str(rendered)
+        return str(self.replace(quote_character="").render())
 
     def _render_event_time_filtered(self, event_time_filter: EventTimeFilter) -> str:
         """
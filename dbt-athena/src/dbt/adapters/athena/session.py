@@ -3,11 +3,12 @@ import threading
 import time
 from functools import cached_property
 from hashlib import md5
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional, Tuple
 from uuid import UUID
 
 import boto3
 import boto3.session
+from botocore.config import Config
 from dbt_common.exceptions import DbtRuntimeError
 from dbt_common.invocation import get_invocation_id
 
@@ -44,6 +45,39 @@ def get_boto3_session_from_credentials(credentials: Any) -> boto3.session.Sessio
     )
 
 
+class Boto3ClientCache:
+    """
+    A cache of the boto3 clients created from one boto3 session.
+
+    Creating a client loads and parses the service model, which is slow, so helpers share the
+    clients of their connection instead. Creating clients from a session is not thread safe, so it
+    is serialized per session, while the clients themselves are thread safe once created.
+    """
+
+    def __init__(self, session: boto3.session.Session) -> None:
+        self.session = session
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[Hashable, ...], Any] = {}
+
+    def client(
+        self, service_name: str, region_name: Optional[str], config: Optional[Config] = None
+    ) -> Any:
+        # configs come from get_boto3_config, which returns the same config for the same retries
+        key = (service_name, region_name, config)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._cache:
+                # boto3-stubs only overloads client() on literal service names, and this cache
+                # is shared by all of them
+                self._cache[key] = self.session.client(  # type: ignore[call-overload]
+                    service_name, region_name=region_name, config=config
+                )
+            return self._cache[key]
+
+
 class AthenaSparkSessionManager:
     """
     A helper class to manage Athena Spark Sessions.
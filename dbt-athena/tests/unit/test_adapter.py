@@ -386,6 +386,290 @@ class TestAthenaAdapter:
             "tables/table/dt=2022-01-03/data2.parquet",
         }
 
+    @pytest.fixture
+    def clean_up_clients(self):
+        glue_client, s3_client = mock.Mock(), mock.Mock()
+        glue_client.batch_delete_partition.return_value = {}
+        s3_client.get_paginator.return_value.paginate.side_effect = lambda Bucket, Prefix: [
+            {"Contents": [{"Key": f"{Prefix}{i}.parquet"} for i in range(1500)]}
+        ]
+        s3_client.delete_objects.return_value = {}
+        clients = {"glue": glue_client, "s3": s3_client}
+        data_catalog = {
+            "Name": "awsdatacatalog",
+            "Type": "GLUE",
+            "Parameters": {"catalog-id": DEFAULT_ACCOUNT_ID},
+        }
+        with patch.object(self.adapter, "_get_boto3_client", side_effect=clients.get):
+            with patch.object(self.adapter, "_get_data_catalog", return_value=data_catalog):
+                yield glue_client, s3_client
+
+    def test_clean_up_partitions_in_batches(self, clean_up_clients):
+        glue_client, s3_client = clean_up_clients
+        partitions = [
+            {"Values": [str(i)], "StorageDescriptor": {"Location": f"s3://{BUCKET}/table/dt={i}"}}
+            for i in range(60)
+        ]
+        listed = []
+
+        def paginate(**kwargs):
+            yield {"Partitions": partitions[:50]}
+            yield {"Partitions": partitions[50:]}
+            listed.append(True)
+
+        def batch_delete_partition(**kwargs):
+            # the partitions are only deleted once all of them are listed
+            assert listed
+            return {}
+
+        glue_client.get_paginator.return_value.paginate.side_effect = paginate
+        glue_client.batch_delete_partition.side_effect = batch_delete_partition
+        relation = self.adapter.Relation.create(
+            database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="table"
+        )
+        self.adapter.clean_up_partitions(relation, "dt < '60'")
+
+        deleted_partitions = [
+            len(c.kwargs["PartitionsToDelete"])
+            for c in glue_client.batch_delete_partition.call_args_list
+        ]
+        assert deleted_partitions == [25, 25, 10]
+        deleted_objects = [
+            len(c.kwargs["Delete"]["Objects"]) for c in s3_client.delete_objects.call_args_list
+        ]
+        assert sorted(deleted_objects) == [500] * 60 + [1000] * 60
+
+    def test_clean_up_partitions_raises_on_errors(self, clean_up_clients):
+        glue_client, _ = clean_up_clients
+        glue_client.get_paginator.return_value.paginate.return_value = [
+            {"Partitions": [{"Values": ["1"], "StorageDescriptor": {"Location": "s3://b/t"}}]}
+        ]
+        glue_client.batch_delete_partition.return_value = {
+            "Errors": [
+                {
+                    "PartitionValues": ["1"],
+                    "ErrorDetail": {"ErrorCode": "InternalServiceException", "ErrorMessage": ""},
+                }
+            ]
+        }
+        relation = self.adapter.Relation.create(
+            database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="table"
+        )
+        with pytest.raises(DbtRuntimeError, match="Failed to delete partitions"):
+            self.adapter.clean_up_partitions(relation, "dt < '2'")
+
+    @staticmethod
+    def _partition_pages(partitions_by_segment):
+        def paginate(CatalogId, DatabaseName, TableName, Segment):
+            result = mock.Mock()
+            result.build_full_result.return_value = {
+                "Partitions": partitions_by_segment(TableName, Segment["SegmentNumber"])
+            }
+            return result
+
+        return paginate
+
+    def test__get_table_partitions_is_cached(self):
+        glue_client = mock.Mock()
+
+        def partitions(table, segment):
+            result = [{"Values": [str(segment)]}]
+            # a partition changed while the segments are listed
+            if segment < 2:
+                created = datetime.datetime(2024, 1, 1 + segment, tzinfo=datetime.timezone.utc)
+                result.append({"Values": ["changed"], "CreationTime": created})
+            return result
+
+        paginate = glue_client.get_paginator.return_value.paginate
+        paginate.side_effect = self._partition_pages(partitions)
+        args = (glue_client, DEFAULT_ACCOUNT_ID, "analytics", "my_table")
+
+        listed = self.adapter._get_table_partitions(*args)
+        assert sorted(p["Values"][0] for p in listed) == ["0", "1", "2", "3", "changed"]
+        assert [p["CreationTime"].day for p in listed if p["Values"] == ["changed"]] == [2]
+        assert sorted(c.kwargs["Segment"]["SegmentNumber"] for c in paginate.call_args_list) == [
+            0,
+            1,
+            2,
+            3,
+        ]
+
+        self.adapter._forget_partitions_of_schemas_in("select * from other_schema.my_table")
+        self.adapter._forget_partitions_of_schemas_in("insert into my_table values 1")
+        assert self.adapter._get_table_partitions(*args) == listed
+        assert paginate.call_count == 4
+
+        self.adapter._forget_partitions_of_schemas_in('insert into "Analytics"."orders" values 1')
+        self.adapter._get_table_partitions(*args)
+        assert paginate.call_count == 8
+
+    def test__get_table_partitions_forgotten_by_unqualified_queries(self):
+        glue_client = mock.Mock()
+        paginate = glue_client.get_paginator.return_value.paginate
+        paginate.side_effect = self._partition_pages(lambda table, segment: [])
+        args = (glue_client, DEFAULT_ACCOUNT_ID, DATABASE_NAME, "my_table")
+
+        self.adapter._get_table_partitions(*args)
+        self.adapter._forget_partitions_of_schemas_in("insert into orders values 1")
+        self.adapter._get_table_partitions(*args)
+        assert paginate.call_count == 8
+
+    def test__get_table_partitions_listed_while_other_tables_change_are_cached(self):
+        glue_client = mock.Mock()
+        changed_code = []
+
+        def partitions(table, segment):
+            if segment == 0 and changed_code:
+                self.adapter._forget_partitions_of_schemas_in(changed_code.pop())
+            return [{"Values": [str(segment)]}]
+
+        paginate = glue_client.get_paginator.return_value.paginate
+        paginate.side_effect = self._partition_pages(partitions)
+        args = (glue_client, DEFAULT_ACCOUNT_ID, "analytics", "my_table")
+
+        changed_code.append("insert into other_schema.other_table values 1")
+        self.adapter._get_table_partitions(*args)
+        self.adapter._get_table_partitions(*args)
+        assert paginate.call_count == 4
+
+        self.adapter._forget_table_partitions(DEFAULT_ACCOUNT_ID, "analytics", "my_table")
+        changed_code.append("insert into analytics.other_table values 1")
+        self.adapter._get_table_partitions(*args)
+        self.adapter._get_table_partitions(*args)
+        assert paginate.call_count == 12
+
+    def test__get_table_partitions_cache_is_bounded(self):
+        glue_client = mock.Mock()
+        paginate = glue_client.get_paginator.return_value.paginate
+        paginate.side_effect = self._partition_pages(lambda table, segment: [])
+
+        def get_partitions(table):
+            self.adapter._get_table_partitions(
+                glue_client, DEFAULT_ACCOUNT_ID, DATABASE_NAME, table
+            )
+            return paginate.call_count // self.adapter.GET_PARTITIONS_SEGMENTS
+
+        with mock.patch.object(self.adapter, "PARTITIONS_CACHE_TABLES", 2):
+            assert [get_partitions(table) for table in ("a", "b", "a", "c", "a", "b")] == [
+                1,
+                2,
+                2,
+                3,
+                3,
+                4,
+            ]
+
+    def test_swap_table_caches_target_partitions(self, clean_up_clients):
+        glue_client, _ = clean_up_clients
+        glue_client.get_table.return_value = {
+            "Table": {
+                "StorageDescriptor": {"Location": f"s3://{BUCKET}/tables/source"},
+                "PartitionKeys": [{"Name": "dt", "Type": "string"}],
+                "TableType": "EXTERNAL_TABLE",
+                "Parameters": {},
+            }
+        }
+        glue_client.batch_create_partition.return_value = {}
+
+        def partitions(table, segment):
+            return [
+                {
+                    "Values": [f"{table}_{segment}"],
+                    "StorageDescriptor": {"Location": f"s3://{BUCKET}/tables/{table}/{segment}"},
+                    "Parameters": {},
+                    "DatabaseName": DATABASE_NAME,
+                    "TableName": table,
+                }
+            ]
+
+        paginate = glue_client.get_paginator.return_value.paginate
+        paginate.side_effect = self._partition_pages(partitions)
+        source_relation, target_relation = [
+            self.adapter.Relation.create(
+                database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier=identifier
+            )
+            for identifier in ("source", "target")
+        ]
+        self.adapter.swap_table(source_relation, target_relation)
+        assert paginate.call_count == 8
+
+        target_partitions = self.adapter._get_table_partitions(
+            glue_client, DEFAULT_ACCOUNT_ID, DATABASE_NAME, "target"
+        )
+        assert paginate.call_count == 8
+        assert sorted(p["Values"][0] for p in target_partitions) == [
+            f"source_{segment}" for segment in range(4)
+        ]
+        assert {p["TableName"] for p in target_partitions} == {"target"}
+
+        self.adapter.delete_from_glue_catalog(target_relation)
+        self.adapter._get_table_partitions(
+            glue_client, DEFAULT_ACCOUNT_ID, DATABASE_NAME, "target"
+        )
+        assert paginate.call_count == 12
+
+    @pytest.fixture
+    def s3_client(self):
+        s3_client = mock.Mock()
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": f"table/{i}.parquet"} for i in range(1000)]},
+            {"Contents": [{"Key": f"table/{i}.parquet"} for i in range(1000, 2500)]},
+        ]
+        s3_client.delete_objects.return_value = {}
+        with patch.object(self.adapter, "_get_boto3_client", return_value=s3_client):
+            yield s3_client
+
+    def test_delete_from_s3_in_batches(self, s3_client):
+        self.adapter.delete_from_s3(f"s3://{BUCKET}/table")
+
+        s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket=BUCKET, Prefix="table/"
+        )
+        deleted = [c.kwargs["Delete"]["Objects"] for c in s3_client.delete_objects.call_args_list]
+        assert sorted(len(objects) for objects in deleted) == [500, 1000, 1000]
+        assert len({obj["Key"] for objects in deleted for obj in objects}) == 2500
+        s3_client.list_objects_v2.assert_not_called()
+
+    def test_delete_from_s3_retries_throttled_keys(self, s3_client):
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "table/1.parquet"}, {"Key": "table/2.parquet"}]}
+        ]
+        throttled = {"Key": "table/2.parquet", "Code": "SlowDown", "Message": "Reduce rate"}
+        s3_client.delete_objects.side_effect = [{"Errors": [throttled]}, {}]
+
+        with patch("dbt.adapters.athena.impl.sleep") as sleep:
+            self.adapter.delete_from_s3(f"s3://{BUCKET}/table")
+
+        assert s3_client.delete_objects.call_count == 2
+        assert s3_client.delete_objects.call_args.kwargs["Delete"]["Objects"] == [
+            {"Key": "table/2.parquet"}
+        ]
+        assert sleep.call_count == 1
+
+    def test_delete_from_s3_reports_errors_of_retried_batches(self, s3_client):
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "table/1.parquet"}, {"Key": "table/2.parquet"}]}
+        ]
+        denied = {"Key": "table/1.parquet", "Code": "AccessDenied", "Message": "Access Denied"}
+        throttled = {"Key": "table/2.parquet", "Code": "SlowDown", "Message": "Reduce rate"}
+        s3_client.delete_objects.side_effect = [{"Errors": [denied, throttled]}, {}]
+
+        with patch("dbt.adapters.athena.impl.sleep"):
+            with pytest.raises(DbtRuntimeError, match="Failed to delete files from S3."):
+                self.adapter.delete_from_s3(f"s3://{BUCKET}/table")
+        assert s3_client.delete_objects.call_count == 2
+
+    def test_delete_from_s3_raises_on_errors(self, s3_client):
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "table/1.parquet"}]}
+        ]
+        denied = {"Key": "table/1.parquet", "Code": "AccessDenied", "Message": "Access Denied"}
+        s3_client.delete_objects.return_value = {"Errors": [denied]}
+
+        with pytest.raises(DbtRuntimeError, match="Failed to delete files from S3."):
+            self.adapter.delete_from_s3(f"s3://{BUCKET}/table")
+        assert s3_client.delete_objects.call_count == 1
+
     @mock_aws
     def test_clean_up_table_table_does_not_exist(self, dbt_debug_caplog, mock_aws_service):
         mock_aws_service.create_data_catalog()
@@ -676,6 +960,21 @@ class TestAthenaAdapter:
             "Parameters": {"catalog-id": DEFAULT_ACCOUNT_ID},
         } == res
 
+    @mock_aws
+    def test__get_data_catalog_is_cached(self, mock_aws_service):
+        mock_aws_service.create_data_catalog()
+        self.adapter.acquire_connection("dummy")
+        with patch.object(
+            self.adapter, "_resolve_data_catalog", wraps=self.adapter._resolve_data_catalog
+        ) as resolve:
+            first = self.adapter._get_data_catalog(DATA_CATALOG_NAME)
+            assert self.adapter._get_data_catalog(DATA_CATALOG_NAME) == first
+            assert resolve.call_count == 1
+
+            with patch("dbt.adapters.athena.impl.monotonic", return_value=float("inf")):
+                assert self.adapter._get_data_catalog(DATA_CATALOG_NAME) == first
+            assert resolve.call_count == 2
+
     def _test_list_relations_without_caching(self, schema_relation):
         self.adapter.acquire_connection("dummy")
         relations = self.adapter.list_relations_without_caching(schema_relation)
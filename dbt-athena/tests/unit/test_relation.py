@@ -60,3 +60,14 @@ class TestAthenaRelation:
             schema=DATABASE_NAME,
         )
         assert relation.render_pure() == f"{DATA_CATALOG_NAME}.{DATABASE_NAME}.{TABLE_NAME}"
+
+    def test_render_hive_after_render(self):
+        relation = AthenaRelation.create(
+            identifier=TABLE_NAME,
+            database=DATA_CATALOG_NAME,
+            schema=DATABASE_NAME,
+        )
+        assert relation.render() == f'"{DATA_CATALOG_NAME}"."{DATABASE_NAME}"."{TABLE_NAME}"'
+        assert relation.render_hive() == f"`{DATABASE_NAME}`.`{TABLE_NAME}`"
+        assert relation.render_pure() == f"{DATA_CATALOG_NAME}.{DATABASE_NAME}.{TABLE_NAME}"
+        assert relation.render() == f'"{DATA_CATALOG_NAME}"."{DATABASE_NAME}"."{TABLE_NAME}"'
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock, patch
 from uuid import UUID
 
@@ -6,7 +7,12 @@ import pytest
 from dbt_common.exceptions import DbtRuntimeError
 
 from dbt.adapters.athena import AthenaCredentials
-from dbt.adapters.athena.session import AthenaSparkSessionManager, get_boto3_session
+from dbt.adapters.athena.config import get_boto3_config
+from dbt.adapters.athena.session import (
+    AthenaSparkSessionManager,
+    Boto3ClientCache,
+    get_boto3_session,
+)
 from dbt.adapters.contracts.connection import Connection
 
 
@@ -46,6 +52,40 @@ class TestSession:
         assert session.profile_name == boto_profile_name
 
 
+class TestBoto3ClientCache:
+    def test_clients_are_created_once(self):
+        session = Mock()
+        session.client.side_effect = lambda *args, **kwargs: Mock()
+        cache = Boto3ClientCache(session)
+        config = get_boto3_config(num_retries=3)
+
+        glue = cache.client("glue", "eu-west-1", config)
+        assert cache.client("glue", "eu-west-1", config) is glue
+        assert cache.client("glue", "us-east-1", config) is not glue
+        assert cache.client("glue", "eu-west-1", get_boto3_config(num_retries=5)) is not glue
+        assert cache.client("s3", "eu-west-1", config) is not glue
+        assert session.client.call_count == 4
+        session.client.assert_any_call("glue", region_name="eu-west-1", config=config)
+
+    def test_concurrent_threads_share_a_client(self):
+        session = Mock()
+        session.client.side_effect = lambda *args, **kwargs: Mock()
+        cache = Boto3ClientCache(session)
+        clients = []
+
+        threads = [
+            threading.Thread(target=lambda: clients.append(cache.client("glue", "eu-west-1")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(client) for client in clients}) == 1
+        assert session.client.call_count == 1
+
+
 @pytest.mark.usefixtures("athena_credentials", "athena_client")
 class TestAthenaSparkSessionManager:
     """
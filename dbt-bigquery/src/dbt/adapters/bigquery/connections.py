@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import json
 from multiprocessing.context import SpawnContext
 import re
-from typing import Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
+from typing import cast, Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
 import uuid
 
 from google.auth.exceptions import RefreshError
@@ -28,6 +28,7 @@ from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
 from dbt_common.invocation import get_invocation_id
 from dbt.adapters.base import BaseConnectionManager
+from dbt.adapters.base.results import arrow_available, table_from_arrow
 from dbt.adapters.contracts.connection import (
     AdapterRequiredConfig,
     AdapterResponse,
@@ -37,7 +38,7 @@ from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.events.types import SQLQuery
 from dbt.adapters.exceptions.connection import FailedToConnectError
 from dbt.adapters.bigquery.clients import create_bigquery_client
-from dbt.adapters.bigquery.credentials import Priority
+from dbt.adapters.bigquery.credentials import BigQueryCredentials, Priority
 from dbt.adapters.bigquery.retry import RetryFactory
 
 if TYPE_CHECKING:
@@ -202,10 +203,15 @@ class BigQueryConnectionManager(BaseConnectionManager):
             raise FailedToConnectError(str(e))
 
     @classmethod
-    def get_table_from_response(cls, resp) -> "agate.Table":
+    def get_table_from_response(cls, resp, create_bqstorage_client: bool = False) -> "agate.Table":
         from dbt_common.clients import agate_helper
 
         column_names = [field.name for field in resp.schema]
+        if arrow_available():
+            # large results are downloaded through the Storage Read API when it is enabled,
+            # otherwise the pages fetched over REST are converted to Arrow
+            arrow_table = resp.to_arrow(create_bqstorage_client=create_bqstorage_client)
+            return table_from_arrow([arrow_table], column_names)
         return agate_helper.table_from_data_flat(resp, column_names)
 
     def get_labels_from_query_comment(cls):
@@ -282,7 +288,8 @@ class BigQueryConnectionManager(BaseConnectionManager):
         query_job, iterator = self.raw_execute(sql, limit=limit)
 
         if fetch:
-            table = self.get_table_from_response(iterator)
+            credentials = cast(BigQueryCredentials, self.profile.credentials)
+            table = self.get_table_from_response(iterator, credentials.use_storage_read_api)
         else:
             from dbt_common.clients import agate_helper
 
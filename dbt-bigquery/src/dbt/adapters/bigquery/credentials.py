@@ -64,6 +64,9 @@ class BigQueryCredentials(Credentials):
     job_retries: Optional[int] = 1
     job_creation_timeout_seconds: Optional[int] = None
     job_execution_timeout_seconds: Optional[int] = None
+    # download large query results through the BigQuery Storage Read API, which requires the
+    # bigquery.readsessions.create permission
+    use_storage_read_api: bool = False
 
     # Keyfile json creds (unicode or base 64 encoded)
     keyfile: Optional[str] = None
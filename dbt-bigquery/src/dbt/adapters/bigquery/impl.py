@@ -145,6 +145,11 @@ class BigQueryAdapter(BaseAdapter):
         ConstraintType.foreign_key: ConstraintSupport.NOT_ENFORCED,
     }
 
+    # INFORMATION_SCHEMA queries are billed for the views they read whatever the filter, so
+    # catalog queries are few and select many relations each.
+    MAX_SCHEMA_METADATA_RELATIONS = 1000
+    CATALOG_QUERY_COST = 1000
+
     _capabilities: CapabilityDict = CapabilityDict(
         {
             Capability.TableLastModifiedMetadata: CapabilitySupport(support=Support.Full),
@@ -715,9 +720,10 @@ class BigQueryAdapter(BaseAdapter):
     def _catalog_filter_table(
         cls, table: "agate.Table", used_schemas: FrozenSet[Tuple[str, str]]
     ) -> "agate.Table":
-        table = table.rename(
-            column_names={col.name: col.name.replace("__", ":") for col in table.columns}
-        )
+        if any("__" in name for name in table.column_names):
+            table = table.rename(
+                column_names={col.name: col.name.replace("__", ":") for col in table.columns}
+            )
         return super()._catalog_filter_table(table, used_schemas)
 
     def _get_catalog_schemas(self, relation_config: Iterable[RelationConfig]) -> SchemaSearchMap:
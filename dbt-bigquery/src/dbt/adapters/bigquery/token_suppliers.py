@@ -1,10 +1,11 @@
 import requests
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, Optional
-from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Tuple
+from datetime import timedelta
 from google.auth.identity_pool import SubjectTokenSupplier
 from dbt.adapters.exceptions import FailedToConnectError
+from dbt.adapters.token_cache import get_token_cache
 from google.auth.external_account import SupplierContext
 from google.auth.transport import Request
 from dbt_common.exceptions import DbtRuntimeError
@@ -72,21 +73,13 @@ class EntraTokenSupplier(SubjectTokenSupplier):
 
     def __init__(self, token_endpoint: Dict[str, Any]):
         self.token_service = EntraIdpTokenService(token_endpoint)
-        self._cached_token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
+        # tokens are shared by the suppliers for the same token_endpoint
+        self._cache_key = ("entra", *sorted((k, str(v)) for k, v in token_endpoint.items()))
         # Add a 5-minute buffer before actual expiry to ensure we don't use an expired token
         self._expiry_buffer = timedelta(minutes=5)
 
-    def _is_token_valid(self) -> bool:
-        """Check if the cached token is still valid."""
-        if not self._token_expiry:
-            return False
-        return datetime.now(timezone.utc).replace(tzinfo=None) < (
-            self._token_expiry - self._expiry_buffer
-        )
-
-    def _fetch_new_token(self) -> str:
-        """Fetch a new token from Entra ID."""
+    def _fetch_new_token(self) -> Tuple[str, float]:
+        """Fetch a new token from Entra ID, and the seconds until it expires."""
         response = self.token_service.handle_request()
         token_data = response.json()
 
@@ -97,15 +90,8 @@ class EntraTokenSupplier(SubjectTokenSupplier):
                 "Idp can obtain an OIDC-compliant access token."
             )
 
-        # Extract expiration time from token response
-        # Default to 1 hour if not specified
-        expires_in = token_data.get("expires_in", 3600)
-        self._token_expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
-            seconds=expires_in
-        )
-        self._cached_token = token_data["access_token"]
-
-        return token_data["access_token"]
+        # Default to 1 hour if the expiration time is not specified
+        return token_data["access_token"], float(token_data.get("expires_in", 3600))
 
     def get_subject_token(self, context: SupplierContext, request: Request) -> str:
         """
@@ -121,10 +107,12 @@ class EntraTokenSupplier(SubjectTokenSupplier):
         Raises:
             FailedToConnectError: If token acquisition fails or response is invalid
         """
-        if self._cached_token and self._is_token_valid():
-            return self._cached_token
-
-        return self._fetch_new_token()
+        return get_token_cache().get(
+            self._cache_key,
+            self._fetch_new_token,
+            name="BigQuery",
+            refresh_ahead=self._expiry_buffer.total_seconds(),
+        )
 
 
 def create_token_supplier(token_endpoint: Dict[str, Any]) -> SubjectTokenSupplier:
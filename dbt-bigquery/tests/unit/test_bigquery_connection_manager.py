@@ -103,6 +103,19 @@ class TestBigQueryConnectionManager(unittest.TestCase):
             timeout=self.credentials.job_creation_timeout_seconds,
         )
 
+    def test_get_table_from_response_uses_arrow(self):
+        import pyarrow
+
+        response = MagicMock()
+        response.schema = [Mock(), Mock()]
+        response.schema[0].name, response.schema[1].name = "id", "name"
+        response.to_arrow.return_value = pyarrow.table({"id": [1, 2], "name": ["a", None]})
+
+        table = BigQueryConnectionManager.get_table_from_response(response, True)
+
+        response.to_arrow.assert_called_once_with(create_bqstorage_client=True)
+        self.assertEqual([tuple(row) for row in table.rows], [(1, "a"), (2, None)])
+
     def test_copy_bq_table_appends(self):
         self._copy_table(write_disposition=dbt.adapters.bigquery.impl.WRITE_APPEND)
         self.mock_client.copy_table.assert_called_once_with(
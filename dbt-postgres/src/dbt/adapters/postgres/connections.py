@@ -1,16 +1,26 @@
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Optional, Union
-
+from dataclasses import dataclass, replace
+from itertools import count
+import time
+from typing import IO, Optional, Tuple, Union, cast
+
+from dbt.adapters.base.connections import ConnectionPool
+from dbt.adapters.base.results import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    StreamingResult,
+    agate_type_for_name,
+)
 from dbt.adapters.contracts.connection import AdapterResponse, Credentials
 from dbt.adapters.events.logging import AdapterLogger
-from dbt.adapters.events.types import TypeCodeNotFound
+from dbt.adapters.events.types import SQLQuery, SQLQueryStatus, TypeCodeNotFound
 from dbt.adapters.postgres.record import PostgresRecordReplayHandle
 from dbt.adapters.sql import SQLConnectionManager
 from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
-from dbt_common.events.functions import warn_or_error
+from dbt_common.events.contextvars import get_node_info
+from dbt_common.events.functions import fire_event, warn_or_error
 from dbt_common.helper_types import Port
 from dbt_common.record import get_record_mode_from_env, RecorderMode
+from dbt_common.utils import cast_to_str
 from mashumaro.jsonschema.annotations import Maximum, Minimum
 import psycopg2
 from typing_extensions import Annotated
@@ -18,6 +28,9 @@ from typing_extensions import Annotated
 
 logger = AdapterLogger("Postgres")
 
+# server-side cursor names only need to be unique within a session
+_stream_ids = count()
+
 
 @dataclass
 class PostgresCredentials(Credentials):
@@ -36,6 +49,14 @@ class PostgresCredentials(Credentials):
     sslrootcert: Optional[str] = None
     application_name: Optional[str] = "dbt"
     retries: int = 1
+    # seconds to reuse persisted schema listings for; unset disables it
+    relations_cache_ttl: Optional[int] = None
+    # number of idle connections to keep open between nodes; 0 disables pooling. It only bounds
+    # the idle connections: up to one connection per thread is open on top of them.
+    pool_size: int = 0
+    pool_idle_timeout: Optional[int] = None
+    # load seeds with COPY ... FROM STDIN rather than batched INSERTs
+    copy_seeds: bool = False
 
     _ALIASES = {"dbname": "database", "pass": "password"}
 
@@ -98,6 +119,31 @@ class PostgresConnectionManager(SQLConnectionManager):
 
             raise DbtRuntimeError(e) from e
 
+    def create_connection_pool(self) -> Optional[ConnectionPool]:
+        credentials = cast(PostgresCredentials, self.profile.credentials)
+        if not credentials.pool_size:
+            return None
+        return ConnectionPool(
+            max_size=credentials.pool_size,
+            idle_timeout=credentials.pool_idle_timeout,
+            health_check=self.handle_is_healthy,
+        )
+
+    @classmethod
+    def handle_is_healthy(cls, handle) -> bool:
+        if handle.closed:
+            return False
+        handle.cursor().execute("select 1")
+        handle.rollback()
+        return True
+
+    @classmethod
+    def reset_handle(cls, handle) -> None:
+        # the role and search_path set on open are not affected by `reset all`
+        handle.rollback()
+        handle.cursor().execute("reset all")
+        handle.commit()
+
     @classmethod
     def open(cls, connection):
         if connection.state == "open":
@@ -161,25 +207,25 @@ class PostgresConnectionManager(SQLConnectionManager):
 
             return handle
 
-        retryable_exceptions = [
+        retryable_exceptions = (
             # OperationalError is subclassed by all psycopg2 Connection Exceptions and it's raised
             # by generic connection timeouts without an error code. This is a limitation of
             # psycopg2 which doesn't provide subclasses for errors without a SQLSTATE error code.
             # The limitation has been known for a while and there are no efforts to tackle it.
             # See: https://github.com/psycopg/psycopg2/issues/682
             psycopg2.errors.OperationalError,
-        ]
-
-        def exponential_backoff(attempt: int):
-            return attempt * attempt
+        )
 
         return cls.retry_connection(
             connection,
             connect=connect,
             logger=logger,
-            retry_limit=credentials.retries,
-            retry_timeout=exponential_backoff,
             retryable_exceptions=retryable_exceptions,
+            retry_policy=replace(
+                cls.RETRY_POLICY,
+                retries=credentials.retries,
+                retryable_exceptions=retryable_exceptions,
+            ),
         )
 
     def cancel(self, connection):
@@ -207,6 +253,61 @@ class PostgresConnectionManager(SQLConnectionManager):
     def get_credentials(cls, credentials):
         return credentials
 
+    def execute_streaming(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, StreamingResult]:
+        # psycopg2 buffers a whole result client-side on execute, so read it through a
+        # server-side cursor instead. Cursors only live within a transaction.
+        name = f"dbt_stream_{next(_stream_ids)}"
+        declare_sql = self._add_query_comment(
+            f"declare {name} no scroll cursor for {sql.strip().rstrip(';')}"
+        )
+        _, cursor = self.add_query(declare_sql, auto_begin=True)
+        response = self.get_response(cursor)
+
+        def fetch(size: int):
+            fetch_sql = f"fetch forward {size} from {name}"
+            with self.exception_handler(fetch_sql):
+                cursor.execute(fetch_sql)
+                return cursor.fetchall()
+
+        def close() -> None:
+            with self.exception_handler(f"close {name}"):
+                cursor.execute(f"close {name}")
+
+        return response, StreamingResult.from_cursor(
+            cursor, fetch, limit=limit, batch_size=batch_size, on_close=close
+        )
+
+    def copy_from(self, sql: str, file: IO[str]) -> AdapterResponse:
+        """Run a `copy ... from stdin` statement in the current transaction,
+        with its data read from file.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+        fire_event(
+            SQLQuery(conn_name=cast_to_str(connection.name), sql=sql, node_info=get_node_info())
+        )
+        with self.exception_handler(sql):
+            pre = time.perf_counter()
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, file)
+            response = self.get_response(cursor)
+            fire_event(
+                SQLQueryStatus(
+                    status=str(response),
+                    elapsed=time.perf_counter() - pre,
+                    node_info=get_node_info(),
+                    query_id=response.query_id,
+                )
+            )
+        return response
+
     @classmethod
     def get_response(cls, cursor) -> AdapterResponse:
         message = str(cursor.statusmessage)
@@ -216,6 +317,13 @@ class PostgresConnectionManager(SQLConnectionManager):
         code = " ".join(status_messsage_strings)
         return AdapterResponse(_message=message, code=code, rows_affected=rows)
 
+    @classmethod
+    def agate_type_for_column(cls, column):
+        # unlike data_type_code_to_name, don't warn about type codes psycopg2 doesn't know
+        if column[1] not in psycopg2.extensions.string_types:
+            return None
+        return agate_type_for_name(psycopg2.extensions.string_types[column[1]].name)
+
     @classmethod
     def data_type_code_to_name(cls, type_code: Union[int, str]) -> str:
         if type_code in psycopg2.extensions.string_types:
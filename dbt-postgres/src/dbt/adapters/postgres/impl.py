@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, List, Optional, Set
+from tempfile import SpooledTemporaryFile
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING, cast
 
-from dbt.adapters.base import AdapterConfig, ConstraintSupport, available
+from dbt.adapters.base import AdapterConfig, BaseRelation, ConstraintSupport, available
 from dbt.adapters.capability import (
     Capability,
     CapabilityDict,
@@ -22,11 +23,16 @@ from dbt_common.exceptions import DbtRuntimeError
 from dbt_common.utils import encoding as dbt_encoding
 
 from dbt.adapters.postgres.column import PostgresColumn
-from dbt.adapters.postgres.connections import PostgresConnectionManager
+from dbt.adapters.postgres.connections import PostgresConnectionManager, PostgresCredentials
 from dbt.adapters.postgres.relation import PostgresRelation
 
 
+if TYPE_CHECKING:
+    import agate
+
+
 GET_RELATIONS_MACRO_NAME = "postgres__get_relations"
+GET_RELATIONS_CACHE_MARKERS_MACRO_NAME = "postgres__get_relations_cache_markers"
 
 
 @dataclass
@@ -82,7 +88,10 @@ class PostgresAdapter(SQLAdapter):
     CATALOG_BY_RELATION_SUPPORT = True
 
     _capabilities: CapabilityDict = CapabilityDict(
-        {Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full)}
+        {
+            Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full),
+            Capability.ParallelSeedLoad: CapabilitySupport(support=Support.Full),
+        }
     )
 
     @classmethod
@@ -103,6 +112,23 @@ class PostgresAdapter(SQLAdapter):
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
 
+    @available
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, agate_table: "agate.Table", cols_sql: str
+    ) -> Optional[str]:
+        credentials = cast(PostgresCredentials, self.config.credentials)
+        if not credentials.copy_seeds or not self.can_bulk_load(agate_table):
+            return None
+        sql = f"copy {relation.render()} ({cols_sql}) from stdin with (format csv)"
+        # small seeds are copied from memory, large ones from a temporary file
+        with SpooledTemporaryFile(
+            max_size=64 * 1024 * 1024, mode="w+", encoding="utf-8", newline=""
+        ) as fp:
+            self.write_seed_csv(agate_table, fp)
+            fp.seek(0)
+            cast(PostgresConnectionManager, self.connections).copy_from(sql, fp)
+        return sql
+
     def _link_cached_database_relations(self, schemas: Set[str]):
         """
         :param schemas: The set of schemas that should have links added.
@@ -140,10 +166,23 @@ class PostgresAdapter(SQLAdapter):
 
         self._link_cached_database_relations(schemas)
 
-    def _relations_cache_for_schemas(self, manifest, cache_schemas=None):
-        super()._relations_cache_for_schemas(manifest, cache_schemas)
+    def _relations_cache_for_schemas(self, manifest, cache_schemas=None, clear=False):
+        super()._relations_cache_for_schemas(manifest, cache_schemas, clear=clear)
         self._link_cached_relations(manifest)
 
+    def get_relations_cache_markers(
+        self, schemas: Iterable[BaseRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        schema_names = sorted({relation.schema.lower() for relation in schemas if relation.schema})
+        if not schema_names:
+            return {}
+        table = self.execute_macro(
+            GET_RELATIONS_CACHE_MARKERS_MACRO_NAME, kwargs={"schemas": schema_names}
+        )
+        # postgres only allows one database (the main one)
+        database = self.config.credentials.database.lower()
+        return {(database, schema): marker for schema, marker in table}
+
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         return f"{add_to} + interval '{number} {interval}'"
 
@@ -111,6 +111,28 @@
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
+{% macro postgres__get_relations_cache_markers(schemas) %}
+  {#
+      -- a schema's marker changes whenever one of its pg_class rows is
+      -- created, altered or dropped: creates and alters stamp a newer xmin,
+      -- and drops change the count
+  #}
+  {% call statement('get_relations_cache_markers', fetch_result=True, auto_begin=False) -%}
+    select
+      lower(pg_namespace.nspname) as schema,
+      count(pg_class.oid)::text || ':' || coalesce(max(pg_class.xmin::text::bigint), 0)::text as marker
+    from pg_namespace
+    left join pg_class on pg_class.relnamespace = pg_namespace.oid
+    where lower(pg_namespace.nspname) in (
+      {%- for schema in schemas -%}
+        '{{ dbt.escape_single_quotes(schema) }}'{% if not loop.last %}, {% endif %}
+      {%- endfor -%}
+    )
+    group by lower(pg_namespace.nspname)
+  {%- endcall %}
+  {{ return(load_result('get_relations_cache_markers').table) }}
+{% endmacro %}
+
 {% macro postgres__information_schema_name(database) -%}
   {% if database_name -%}
     {{ adapter.verify_database(database_name) }}
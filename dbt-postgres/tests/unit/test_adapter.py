@@ -350,3 +350,110 @@ class TestPostgresAdapter(TestCase):
             self.assertEqual(tupled_catalog, {rows[0], rows[1], rows[3]})
 
         self.assertEqual(exceptions, [])
+
+    @mock.patch.object(PostgresAdapter, "execute_macro")
+    def test_get_relations_cache_markers(self, mock_execute):
+        mock_execute.return_value = agate.Table(
+            rows=[("foo", "3:1234")], column_names=["schema", "marker"]
+        )
+        schemas = [
+            BaseRelation.create(database="postgres", schema="FOO"),
+            BaseRelation.create(database="postgres", schema="foo"),
+            BaseRelation.create(database="postgres", schema="bar"),
+        ]
+
+        markers = self.adapter.get_relations_cache_markers(schemas)
+
+        mock_execute.assert_called_once_with(
+            "postgres__get_relations_cache_markers", kwargs={"schemas": ["bar", "foo"]}
+        )
+        self.assertEqual(markers, {("postgres", "foo"): "3:1234"})
+
+    def test_bulk_load_csv_rows_is_opt_in(self):
+        table = agate.Table(rows=[(1,)], column_names=["id"], column_types=[agate.Number()])
+        relation = BaseRelation.create(database="postgres", schema="public", identifier="seed")
+
+        self.assertIsNone(self.adapter.bulk_load_csv_rows(relation, table, '"id"'))
+
+    @mock.patch("dbt.adapters.postgres.connections.psycopg2")
+    def test_bulk_load_csv_rows(self, psycopg2):
+        self.config.credentials.copy_seeds = True
+        copied = []
+        cursor = psycopg2.connect.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = lambda sql, fp: copied.append((sql, fp.read()))
+        table = agate.Table(
+            rows=[(1, "a"), (None, "")],
+            column_names=["id", "name"],
+            column_types=[agate.Number(), agate.Text(cast_nulls=False)],
+        )
+        relation = BaseRelation.create(database="postgres", schema="public", identifier="seed")
+
+        with self.adapter.connection_named("seed"):
+            sql = self.adapter.bulk_load_csv_rows(relation, table, '"id", "name"')
+
+        self.assertEqual(
+            sql, 'copy "postgres"."public"."seed" ("id", "name") from stdin with (format csv)'
+        )
+        self.assertEqual(copied, [(sql, '"1","a"\n,""\n')])
+
+    @mock.patch("dbt.adapters.postgres.connections.psycopg2")
+    def test_load_csv_rows_in_parallel(self, psycopg2):
+        self.config.threads = 4
+        self.config.credentials.copy_seeds = True
+        copied = []
+        cursor = psycopg2.connect.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = lambda sql, fp: copied.append((sql, fp.read()))
+        table = agate.Table(
+            rows=[(1,), (2,), (3,)], column_names=["id"], column_types=[agate.Number()]
+        )
+        relation = BaseRelation.create(database="postgres", schema="public", identifier="seed")
+
+        set_invocation_context({})
+        uuid = mock.Mock(hex="0123456789abcdef")
+        with mock.patch.object(PostgresAdapter, "SEED_LOAD_CHUNK_MIN_ROWS", 2), mock.patch(
+            "dbt.adapters.sql.impl.uuid4", return_value=uuid
+        ):
+            with self.adapter.connection_named("seed"):
+                sql = self.adapter.load_csv_rows_in_parallel(
+                    relation, table, '"id" integer', '"id"', 4, 10000
+                )
+
+        self.assertEqual(
+            sql,
+            'insert into "postgres"."public"."seed" ("id") '
+            'select "id" from "postgres"."public"."seed__dbt_load_01234567_0" union all '
+            'select "id" from "postgres"."public"."seed__dbt_load_01234567_1"',
+        )
+        self.assertEqual(sorted(data for _, data in copied), ['"1"\n"2"\n', '"3"\n'])
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        self.assertIn(
+            'create table "postgres"."public"."seed__dbt_load_01234567_1" ("id" integer)', executed
+        )
+        self.assertIn(
+            'drop table if exists "postgres"."public"."seed__dbt_load_01234567_0"', executed
+        )
+
+    def test_seeds_are_not_loaded_in_parallel_without_free_connections(self):
+        table = agate.Table(
+            rows=[(1,), (2,), (3,)], column_names=["id"], column_types=[agate.Number()]
+        )
+        relation = BaseRelation.create(database="postgres", schema="public", identifier="seed")
+
+        # another seed is loaded in parallel over all but one of the run's threads
+        self.config.threads = 4
+        for _ in range(3):
+            self.adapter._seed_load_slots.acquire()
+        with mock.patch.object(PostgresAdapter, "SEED_LOAD_CHUNK_MIN_ROWS", 1):
+            self.assertIsNone(
+                self.adapter.load_csv_rows_in_parallel(
+                    relation, table, '"id" integer', '"id"', 4, 10000
+                )
+            )
+
+    def test_small_seeds_are_not_loaded_in_parallel(self):
+        table = agate.Table(rows=[(1,)], column_names=["id"], column_types=[agate.Number()])
+        relation = BaseRelation.create(database="postgres", schema="public", identifier="seed")
+
+        self.assertIsNone(
+            self.adapter.load_csv_rows_in_parallel(relation, table, '"id" integer', '"id"', 4, 1)
+        )
@@ -218,3 +218,53 @@ class TestPostgresConnection(TestCase):
         self.adapter.cleanup_connections()
         self._adapter = PostgresAdapter(self.config, self.mp_context)
         self.adapter.verify_database("postgres")
+
+    def test_connection_pool_disabled_by_default(self):
+        self.assertIsNone(self.adapter.connections.pool)
+
+    def test_pooled_handles_are_reset_and_reused(self):
+        self.target_dict["pool_size"] = 2
+        profile_cfg = {"outputs": {"test": self.target_dict}, "target": "test"}
+        project_cfg = {
+            "name": "X",
+            "version": "0.1",
+            "profile": "test",
+            "project-root": "/tmp/dbt/does-not-exist",
+            "config-version": 2,
+        }
+        config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        adapter = PostgresAdapter(config, self.mp_context)
+        self.handle.closed = 0
+        self.psycopg2.connect.reset_mock()
+
+        with adapter.connection_named("model.a"):
+            adapter.connections.get_thread_connection().handle
+        with adapter.connection_named("model.b"):
+            connection = adapter.connections.get_thread_connection()
+            self.assertIs(connection.handle, self.handle)
+
+        self.psycopg2.connect.assert_called_once()
+        self.mock_execute.assert_has_calls([mock.call("reset all"), mock.call("select 1")])
+        adapter.cleanup_connections()
+        self.assertEqual(len(adapter.connections.pool), 0)
+
+    def test_execute_streaming_uses_server_side_cursor(self):
+        self.cursor.description = [("id", 23)]
+        self.cursor.fetchall.side_effect = [[(1,), (2,)], [(3,)], []]
+
+        _, result = self.adapter.execute_streaming("select id from t;", batch_size=2)
+        self.assertEqual(result.column_names, ["id"])
+        self.assertEqual(list(result), [(1,), (2,), (3,)])
+
+        name = self.mock_execute.call_args_list[-1].args[0].split()[-1]
+        self.mock_execute.assert_has_calls(
+            [
+                mock.call(
+                    f"/* dbt */\ndeclare {name} no scroll cursor for select id from t", None
+                ),
+                mock.call(f"fetch forward 2 from {name}"),
+                mock.call(f"fetch forward 2 from {name}"),
+                mock.call(f"fetch forward 2 from {name}"),
+                mock.call(f"close {name}"),
+            ]
+        )
@@ -1,23 +1,43 @@
 import re
 import os
 
-import time
+from itertools import count
 
 import redshift_connector
 import sqlparse
 
 from multiprocessing.synchronize import RLock
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Generator, Tuple, Union, Optional, List, TYPE_CHECKING
-from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Tuple,
+    Union,
+    Optional,
+    List,
+    TYPE_CHECKING,
+    cast,
+)
+from dataclasses import dataclass, field, replace
+from weakref import WeakKeyDictionary
 
 from dbt.adapters.exceptions import FailedToConnectError
 from redshift_connector.utils.oids import get_datatype_name
 
+from dbt.adapters.base.connections import ConnectionPool
+from dbt.adapters.base.results import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    StreamingResult,
+    agate_type_for_name,
+)
 from dbt.adapters.sql import SQLConnectionManager
+from dbt.adapters.sql.statements import split_statements
 from dbt.adapters.contracts.connection import AdapterResponse, Connection, Credentials
 from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.redshift.auth_providers import create_token_service_client
+from dbt.adapters.token_cache import get_token_cache
 from dbt_common.contracts.util import Replaceable
 from dbt_common.dataclass_schema import dbtClassMixin, StrEnum, ValidationError
 from dbt_common.helper_types import Port
@@ -29,9 +49,14 @@ if TYPE_CHECKING:
     import agate
 
 COMMENT_REGEX = re.compile(r"(\".*?\"|\'.*?\')|(/\*.*?\*/|--[^\r\n]*$)", re.MULTILINE)
+# the lifetime of identity provider access tokens, in seconds, if a response does not say
+_DEFAULT_IDP_TOKEN_LIFETIME = 3600
 
 logger = AdapterLogger("Redshift")
 
+# leader node cursor names only need to be unique within a session
+_stream_ids = count()
+
 if os.getenv("DBT_REDSHIFT_CONNECTOR_DEBUG_LOGGING"):
     for logger_name in ["redshift_connector"]:
         logger.debug(f"Setting {logger_name} to DEBUG")
@@ -153,6 +178,14 @@ class RedshiftCredentials(Credentials):
     autocommit: Optional[bool] = True
     access_key_id: Optional[str] = None
     secret_access_key: Optional[str] = None
+    # number of idle connections to keep open between nodes; 0 disables pooling. It only bounds
+    # the idle connections: up to one connection per thread is open on top of them.
+    pool_size: int = 0
+    pool_idle_timeout: Optional[int] = None
+    # an S3 prefix (s3://bucket/prefix) to stage seeds in, to load them with COPY
+    s3_seed_staging_dir: Optional[str] = None
+    # the IAM role that COPY reads staged seeds with; the cluster's default role if unset
+    s3_seed_iam_role: Optional[str] = None
 
     #
     # IAM identity center methods
@@ -223,6 +256,11 @@ def is_serverless(credentials: RedshiftCredentials) -> bool:
     return "serverless" in credentials.host or credentials.is_serverless is True
 
 
+def _idp_token_key(credentials: RedshiftCredentials) -> Tuple[Any, ...]:
+    """The key the IdP token of credentials is cached under."""
+    return ("redshift", *sorted((credentials.token_endpoint or {}).items()))
+
+
 def get_connection_method(
     credentials: RedshiftCredentials,
 ) -> Callable[[], redshift_connector.Connection]:
@@ -382,13 +420,24 @@ def get_connection_method(
         __validate_required_fields("oauth_token_identity_center", ("token_endpoint",))
 
         token_service = create_token_service_client(credentials.token_endpoint)
-        response = token_service.handle_request()
-        try:
-            access_token = response.json()["access_token"]
-        except KeyError:
-            raise FailedToConnectError(
-                "access_token missing from Idp token request. Please confirm correct configuration of the token_endpoint field in profiles.yml and that your Idp can use a refresh token to obtain an OIDC-compliant access token."
-            )
+
+        def fetch_access_token() -> Tuple[str, float]:
+            token_data = token_service.handle_request().json()
+            try:
+                access_token = token_data["access_token"]
+            except KeyError:
+                raise FailedToConnectError(
+                    "access_token missing from Idp token request. Please confirm correct configuration of the token_endpoint field in profiles.yml and that your Idp can use a refresh token to obtain an OIDC-compliant access token."
+                )
+            return access_token, float(token_data.get("expires_in", _DEFAULT_IDP_TOKEN_LIFETIME))
+
+        # the token is shared by the connections opened with this token_endpoint, and only
+        # fetched again when it is about to expire
+        access_token = get_token_cache().get(
+            _idp_token_key(credentials),
+            fetch_access_token,
+            name="Redshift",
+        )
 
         return __iam_kwargs(credentials) | {
             "credentials_provider": "IdpTokenAuthPlugin",
@@ -429,9 +478,21 @@ def get_connection_method(
     return connect
 
 
+@dataclass(frozen=True)
+class _HandleSession:
+    """What a handle was set up with when it was opened."""
+
+    backend_pid: Optional[int]
+    role: Optional[str]
+
+
 class RedshiftConnectionManager(SQLConnectionManager):
     TYPE = "redshift"
 
+    # pooled handles outlive the connections that opened them, so what they were opened with is
+    # kept by handle, to reset them to it and to know their backend pid without querying it
+    _handle_sessions: "WeakKeyDictionary[Any, _HandleSession]" = WeakKeyDictionary()
+
     def cancel(self, connection: Connection):
         pid = connection.backend_pid
         sql = f"select pg_terminate_backend({pid})"
@@ -446,6 +507,46 @@ class RedshiftConnectionManager(SQLConnectionManager):
                 return
             raise
 
+    def create_connection_pool(self) -> Optional[ConnectionPool]:
+        credentials = cast(RedshiftCredentials, self.profile.credentials)
+        if not credentials.pool_size:
+            return None
+        return ConnectionPool(
+            max_size=credentials.pool_size,
+            idle_timeout=credentials.pool_idle_timeout,
+            health_check=self.handle_is_healthy,
+        )
+
+    @classmethod
+    def handle_is_healthy(cls, handle) -> bool:
+        with handle.cursor() as c:
+            c.execute("select 1")
+        if not handle.autocommit:
+            handle.rollback()
+        return True
+
+    @classmethod
+    def reset_handle(cls, handle) -> None:
+        # redshift has no `discard`, so only the settings are reset; the role set on open is set
+        # again in case `reset all` reverted it
+        session = cls._handle_sessions.get(handle)
+        if not handle.autocommit:
+            handle.rollback()
+        with handle.cursor() as c:
+            c.execute("reset all")
+            if session is not None and session.role:
+                c.execute(f"set role {session.role}")
+        if not handle.autocommit:
+            handle.commit()
+
+    def _checkout_or_open(self, connection):
+        connection = super()._checkout_or_open(connection)
+        # a pooled handle was opened for another connection, so its backend pid is not ours
+        session = self._handle_sessions.get(connection.handle)
+        if session is not None and session.backend_pid:
+            connection.backend_pid = session.backend_pid
+        return connection
+
     @classmethod
     def _get_backend_pid(cls, connection):
         with connection.handle.cursor() as c:
@@ -522,18 +623,35 @@ class RedshiftConnectionManager(SQLConnectionManager):
             redshift_connector.InterfaceError,
         )
         if credentials.retry_all:
-            retryable_exceptions = redshift_connector.Error
-
-        open_connection = cls.retry_connection(
-            connection,
-            connect=get_connection_method(credentials),
-            logger=logger,
-            retry_limit=credentials.retries,
-            retryable_exceptions=retryable_exceptions,
-        )
+            retryable_exceptions = (redshift_connector.Error,)
+
+        try:
+            open_connection = cls.retry_connection(
+                connection,
+                connect=get_connection_method(credentials),
+                logger=logger,
+                retryable_exceptions=retryable_exceptions,
+                retry_policy=replace(
+                    cls.RETRY_POLICY,
+                    retries=credentials.retries,
+                    retryable_exceptions=retryable_exceptions,
+                ),
+            )
+        except FailedToConnectError:
+            if (
+                credentials.method == RedshiftConnectionMethod.IAM_IDENTITY_CENTER_TOKEN
+                and credentials.token_endpoint
+            ):
+                # the cached token may have been rejected: fetch a new one next time
+                get_token_cache().invalidate(_idp_token_key(credentials))
+            raise
 
-        if backend_pid := cls._get_backend_pid(open_connection):
+        backend_pid = cls._get_backend_pid(open_connection)
+        if backend_pid:
             open_connection.backend_pid = backend_pid
+        cls._handle_sessions[open_connection.handle] = _HandleSession(
+            backend_pid=backend_pid, role=credentials.role
+        )
         return open_connection
 
     def execute(
@@ -543,62 +661,36 @@ class RedshiftConnectionManager(SQLConnectionManager):
         fetch: bool = False,
         limit: Optional[int] = None,
     ) -> Tuple[AdapterResponse, "agate.Table"]:
-        def _handle_execute_exception(
-            e: Exception, retries: int, backoff: int, retry_all: bool
-        ) -> Tuple[int, int]:
-            oid_not_found_msg = "could not open relation with OID"
-            if retries == 0:
-                raise e
-            if oid_not_found_msg in str(e):
-                pass
-            elif isinstance(e, DbtDatabaseError) and retry_all:
-                pass
-            else:
-                logger.debug(f"Not retrying error: {e}")
-                raise e
-            logger.debug(f"Retrying query due to error: {e}")
-            retries -= 1
+        credentials = self.profile.credentials
+        commented_sql = self._add_query_comment(sql)
+
+        def is_retryable(e: Exception) -> bool:
+            if "could not open relation with OID" in str(e):
+                return True
+            return isinstance(e, DbtDatabaseError) and credentials.retry_all
+
+        def reconnect(e: Exception) -> None:
             # we need to actually close and open to get a new connection
             # otherwise no queries will succeed on this connection
             self.close(self.get_thread_connection())
             self.open(self.get_thread_connection())
-            time.sleep(backoff)
-            # return with exponential backoff
-            return retries, min(max(backoff * 2, 2), 60)
-
-        def _execute_internal(
-            sql: str,
-            auto_begin: bool,
-            fetch: bool,
-            limit: Optional[int],
-            retries: int,
-            backoff: int,
-            retry_all: bool,
-        ) -> Tuple[Optional[AdapterResponse], Optional["agate.Table"]]:
-            try:
-                _, cursor = self.add_query(sql, auto_begin)
-                internal_response = self.get_response(cursor)
-                if fetch:
-                    internal_table = self.get_result_from_cursor(cursor, limit)
-                else:
-                    from dbt_common.clients import agate_helper
-
-                    internal_table = agate_helper.empty_table()
-                return internal_response, internal_table
-            except Exception as e:
-                retries, backoff = _handle_execute_exception(e, retries, backoff, retry_all)
-                return _execute_internal(
-                    sql, auto_begin, fetch, limit, retries, backoff, retry_all
-                )
 
-        response, table = _execute_internal(
-            self._add_query_comment(sql),
-            auto_begin,
-            fetch,
-            limit,
-            self.profile.credentials.retries,
-            1,
-            self.profile.credentials.retry_all,
+        def execute_once() -> Tuple[Optional[AdapterResponse], Optional["agate.Table"]]:
+            _, cursor = self.add_query(commented_sql, auto_begin)
+            response = self.get_response(cursor)
+            if fetch:
+                table = self.get_result_from_cursor(cursor, limit)
+            else:
+                from dbt_common.clients import agate_helper
+
+                table = agate_helper.empty_table()
+            return response, table
+
+        retry_policy = replace(
+            self.RETRY_POLICY, retries=credentials.retries, classify=is_retryable
+        )
+        response, table = retry_policy.call(
+            execute_once, "running a query", name=self.TYPE, on_retry=reconnect
         )
 
         # this should never happen but mypy doesn't know that and arguably neither do we
@@ -607,12 +699,40 @@ class RedshiftConnectionManager(SQLConnectionManager):
             raise DbtRuntimeError(f"Failed to execute SQL: {sql} on connection: {conn_name}")
         return response, table
 
+    def execute_streaming(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, StreamingResult]:
+        # redshift_connector buffers a whole result on execute, so read it through a cursor
+        # on the leader node instead. Cursors only live within a transaction.
+        name = f"dbt_stream_{next(_stream_ids)}"
+        declare_sql = self._add_query_comment(
+            f"declare {name} cursor for {sql.strip().rstrip(';')}"
+        )
+        _, cursor = self.add_query(declare_sql, auto_begin=True)
+        response = self.get_response(cursor)
+
+        def fetch(size: int):
+            fetch_sql = f"fetch forward {size} from {name}"
+            with self.exception_handler(fetch_sql):
+                cursor.execute(fetch_sql)
+                return cursor.fetchall()
+
+        def close() -> None:
+            with self.exception_handler(f"close {name}"):
+                cursor.execute(f"close {name}")
+
+        return response, StreamingResult.from_cursor(
+            cursor, fetch, limit=limit, batch_size=batch_size, on_close=close
+        )
+
     def add_query(self, sql, auto_begin=True, bindings=None, abridge_sql_log=False):  # type: ignore
         connection = None
         cursor = None
-        self._initialize_sqlparse_lexer()
-
-        queries = sqlparse.split(sql)
+        queries = split_statements(sql, self._split_with_sqlparse)
 
         redshift_retryable_exceptions = (
             redshift_connector.InterfaceError,
@@ -650,10 +770,23 @@ class RedshiftConnectionManager(SQLConnectionManager):
     def get_credentials(cls, credentials):
         return credentials
 
+    @classmethod
+    def agate_type_for_column(cls, column):
+        try:
+            return agate_type_for_name(get_datatype_name(column[1]))
+        except ValueError:
+            # not a type code redshift_connector knows
+            return None
+
     @classmethod
     def data_type_code_to_name(cls, type_code: Union[int, str]) -> str:
         return get_datatype_name(type_code)
 
+    @classmethod
+    def _split_with_sqlparse(cls, sql: str) -> List[str]:
+        cls._initialize_sqlparse_lexer()
+        return sqlparse.split(sql)
+
     @staticmethod
     def _initialize_sqlparse_lexer():
         """
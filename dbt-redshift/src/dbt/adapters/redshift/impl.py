@@ -1,5 +1,8 @@
+import gzip
 import os
 from dataclasses import dataclass
+from tempfile import TemporaryFile
+import uuid
 
 from dbt_common.contracts.constraints import ConstraintType
 from typing import Optional, Set, Any, Dict, Type, TYPE_CHECKING
@@ -63,6 +66,7 @@ class RedshiftAdapter(SQLAdapter):
             Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full),
             Capability.TableLastModifiedMetadata: CapabilitySupport(support=Support.Full),
             Capability.TableLastModifiedMetadataBatch: CapabilitySupport(support=Support.Full),
+            Capability.ParallelSeedLoad: CapabilitySupport(support=Support.Full),
         }
     )
 
@@ -101,6 +105,46 @@ class RedshiftAdapter(SQLAdapter):
     def convert_time_type(cls, agate_table: "agate.Table", col_idx):
         return "varchar(24)"
 
+    @available
+    def bulk_load_csv_rows(
+        self, relation: RedshiftRelation, agate_table: "agate.Table", cols_sql: str
+    ) -> Optional[str]:
+        credentials = self.config.credentials
+        if not credentials.s3_seed_staging_dir or not self.can_bulk_load(agate_table):
+            return None
+        import boto3
+
+        bucket, _, prefix = credentials.s3_seed_staging_dir[len("s3://") :].partition("/")
+        key = "/".join(
+            part
+            for part in [prefix.strip("/"), f"{relation.identifier}_{uuid.uuid4()}.csv.gz"]
+            if part
+        )
+        iam_role = (
+            f"'{credentials.s3_seed_iam_role}'" if credentials.s3_seed_iam_role else "default"
+        )
+        sql = (
+            f"copy {relation.render()} ({cols_sql}) from 's3://{bucket}/{key}' "
+            f"iam_role {iam_role} format as csv gzip null as '\\\\N'"
+        )
+        session = boto3.Session(
+            profile_name=credentials.iam_profile,
+            region_name=credentials.region,
+            aws_access_key_id=credentials.access_key_id,
+            aws_secret_access_key=credentials.secret_access_key,
+        )
+        s3 = session.client("s3")
+        with TemporaryFile() as fp:
+            with gzip.open(fp, "wt", encoding="utf-8", newline="") as csv_fp:
+                self.write_seed_csv(agate_table, csv_fp, null="\\N")
+            fp.seek(0)
+            s3.upload_fileobj(fp, bucket, key)
+        try:
+            self.connections.add_query(sql)
+        finally:
+            s3.delete_object(Bucket=bucket, Key=key)
+        return sql
+
     @available
     def verify_database(self, database):
         if database.startswith('"'):
@@ -167,8 +211,8 @@ class RedshiftAdapter(SQLAdapter):
         )
         self._link_cached_database_relations(schemas)
 
-    def _relations_cache_for_schemas(self, manifest, cache_schemas=None):
-        super()._relations_cache_for_schemas(manifest, cache_schemas)
+    def _relations_cache_for_schemas(self, manifest, cache_schemas=None, clear=False):
+        super()._relations_cache_for_schemas(manifest, cache_schemas, clear=clear)
         self._link_cached_relations(manifest)
 
     # avoid non-implemented abstract methods warning
@@ -839,6 +839,34 @@ class TestIAMIdcToken(AuthMethod):
 
         assert "400 Client Error: Bad Request for url" in str(context.exception)
 
+    @mock.patch(
+        "redshift_connector.connect",
+        MagicMock(side_effect=redshift_connector.InterfaceError("token rejected")),
+    )
+    @mock.patch("dbt.adapters.redshift.connections.create_token_service_client")
+    def test_idc_token_is_fetched_again_after_a_failed_connection(self, token_service_client):
+        token_service = token_service_client.return_value
+        token_service.handle_request.return_value.json.return_value = {
+            "access_token": "rejected_token",
+            "expires_in": "3600",
+        }
+        self.config.credentials = self.config.credentials.replace(
+            method="oauth_token_identity_center",
+            token_endpoint={
+                "type": "entra",
+                "request_url": "https://login.microsoftonline.com/rejected/oauth2/v2.0/token",
+                "request_data": "my_data",
+            },
+            retries=0,
+        )
+        for _ in range(2):
+            with self.assertRaises(FailedToConnectError):
+                connection = self.adapter.acquire_connection("dummy")
+                connection.handle
+            self.adapter.connections.cleanup_all()
+
+        assert token_service.handle_request.call_count == 2
+
     @mock.patch("redshift_connector.connect", MagicMock())
     def test_invalid_idc_token_missing_field(self):
         # Successful test
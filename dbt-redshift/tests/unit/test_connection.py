@@ -112,6 +112,28 @@ class TestConnection(TestCase):
             ]
         )
 
+    @mock.patch("redshift_connector.connect", MagicMock())
+    def test_pooled_handles_keep_their_backend_pid(self):
+        self.config.credentials.pool_size = 1
+        self.config.credentials.role = "analyst"
+        cursor = mock.MagicMock()
+        execute = cursor().__enter__().execute
+        execute().fetchone.return_value = (42,)
+        redshift_connector.connect().cursor = cursor
+
+        connection = self.adapter.acquire_connection("first")
+        connection.handle
+        handle = connection.handle
+        self.adapter.release_connection()
+        connection = self.adapter.acquire_connection("second")
+
+        assert connection.handle is handle
+        assert connection.backend_pid == 42
+        assert execute.call_args_list.count(call("select pg_backend_pid()")) == 1
+        execute.assert_has_calls([call("reset all"), call("set role analyst")])
+        # handles are opened in autocommit mode, so there is no transaction to end
+        handle.rollback.assert_not_called()
+
     @mock.patch("redshift_connector.connect", MagicMock())
     def test_backend_pid_used_in_pg_terminate_backend(self):
         with mock.patch.object(self.adapter.connections, "add_query") as add_query:
@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from io import StringIO
 from time import sleep
 
-from typing import Optional, Tuple, Union, Any, List, Iterable, TYPE_CHECKING, Dict
+from typing import Optional, Tuple, Union, Any, List, Iterable, TYPE_CHECKING, Dict, cast
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
@@ -36,6 +36,7 @@ from snowflake.connector.errors import (
     BadGatewayError,
     OtherHTTPRetryableError,
     BindUploadError,
+    NotSupportedError,
 )
 
 from dbt_common.exceptions import (
@@ -45,14 +46,24 @@ from dbt_common.exceptions import (
 )
 from dbt_common.exceptions import DbtDatabaseError
 from dbt_common.record import get_record_mode_from_env, RecorderMode
+from dbt.adapters.base.results import (
+    DEFAULT_FETCH_BATCH_SIZE,
+    StreamingResult,
+    agate_type_for_name,
+    arrow_available,
+    dedupe_column_names,
+    table_from_arrow,
+)
 from dbt.adapters.exceptions.connection import FailedToConnectError
 from dbt.adapters.contracts.connection import AdapterResponse, Connection, Credentials
 from dbt.adapters.sql import SQLConnectionManager
+from dbt.adapters.sql.statements import CONNECTOR_TRAILER, split_statements
 from dbt.adapters.events.logging import AdapterLogger
 from dbt_common.events.functions import warn_or_error
 from dbt.adapters.events.types import AdapterEventWarning, AdapterEventError
 from dbt_common.ui import line_wrap_message, warning_tag
 from dbt.adapters.snowflake.record import SnowflakeRecordReplayHandle
+from dbt.adapters.token_cache import get_token_cache
 
 from dbt.adapters.snowflake.auth import private_key_from_file, private_key_from_string
 from dbt.adapters.snowflake.query_headers import SnowflakeMacroQueryStringSetter
@@ -69,6 +80,12 @@ if os.getenv("DBT_SNOWFLAKE_CONNECTOR_DEBUG_LOGGING"):
         logger.set_adapter_dependency_log_level(logger_name, "DEBUG")
 
 _TOKEN_REQUEST_URL = "https://{}.snowflakecomputing.com/oauth/token-request"
+# the lifetime of Snowflake OAuth access tokens, in seconds, if a response does not say
+_DEFAULT_ACCESS_TOKEN_LIFETIME = 600
+# PUT and GET statements, after any comments
+_FILE_TRANSFER_REGEX = re.compile(
+    r"(?:\s|--[^\n]*\n?|/\*[\s\S]*?\*/)*(?:put|get)\b", re.IGNORECASE
+)
 
 ERROR_REDACTION_PATTERNS = {
     re.compile(r"Row Values: \[(.|\n)*\]"): "Row Values: [redacted]",
@@ -113,6 +130,13 @@ class SnowflakeCredentials(Credentials):
     insecure_mode: Optional[bool] = False
     # this needs to default to `None` so that we can tell if the user set it; see `__post_init__()`
     reuse_connections: Optional[bool] = None
+    # seconds to reuse persisted schema listings for; unset disables it
+    relations_cache_ttl: Optional[int] = None
+    # run the statements of multi-statement SQL in one request instead of one each
+    batch_statements: bool = False
+    # load seeds by staging them in their table's stage and copying them in, rather than with
+    # batched inserts
+    stage_seeds: bool = False
 
     def __post_init__(self):
         if self.authenticator != "oauth" and (self.oauth_client_secret or self.oauth_client_id):
@@ -180,6 +204,8 @@ class SnowflakeCredentials(Credentials):
             "retry_all",
             "insecure_mode",
             "reuse_connections",
+            "batch_statements",
+            "stage_seeds",
         )
 
     def auth_args(self):
@@ -206,7 +232,7 @@ class SnowflakeCredentials(Credentials):
                 token = self.token
                 # if we have a client ID/client secret, the token is a refresh
                 # token, not an access token
-                if self.oauth_client_id and self.oauth_client_secret:
+                if self._uses_access_token():
                     token = self._get_access_token()
                 elif self.oauth_client_id:
                     warn_or_error(
@@ -249,6 +275,21 @@ class SnowflakeCredentials(Credentials):
                 "need a client ID a client secret, and a refresh token to get " "an access token"
             )
 
+        # the token is shared by the connections opened with these credentials, and only
+        # fetched again when it is about to expire
+        return get_token_cache().get(
+            self._access_token_key(), self._fetch_access_token, name="Snowflake"
+        )
+
+    def _access_token_key(self) -> Tuple[Optional[str], ...]:
+        return ("snowflake", self.account, self.oauth_client_id, self.token)
+
+    def _uses_access_token(self) -> bool:
+        return bool(
+            self.authenticator == "oauth" and self.oauth_client_id and self.oauth_client_secret
+        )
+
+    def _fetch_access_token(self) -> Tuple[str, float]:
         # should the full url be a config item?
         token_url = _TOKEN_REQUEST_URL.format(self.account)
         # I think this is only used to redirect on success, which we ignore
@@ -294,7 +335,9 @@ class SnowflakeCredentials(Credentials):
                 "This error occurs when authentication has expired. "
                 "Please reauth with your auth provider."
             )
-        return result_json["access_token"]
+        return result_json["access_token"], float(
+            result_json.get("expires_in", _DEFAULT_ACCESS_TOKEN_LIFETIME)
+        )
 
     def _get_private_key(self) -> Optional[bytes]:
         """Get Snowflake private key by path, from a Base64 encoded DER bytestring or None."""
@@ -370,6 +413,9 @@ class SnowflakeConnectionManager(SQLConnectionManager):
 
             if creds.query_tag:
                 session_parameters.update({"QUERY_TAG": creds.query_tag})
+            if creds.batch_statements:
+                # allow any number of statements in a request
+                session_parameters.update({"MULTI_STATEMENT_COUNT": 0})
             handle = None
 
             # In replay mode, we won't connect to a real database at all, while
@@ -418,14 +464,20 @@ class SnowflakeConnectionManager(SQLConnectionManager):
         elif creds.retry_on_database_errors:
             retryable_exceptions.insert(0, DatabaseError)
 
-        return cls.retry_connection(
-            connection,
-            connect=connect,
-            logger=logger,
-            retry_limit=creds.connect_retries,
-            retry_timeout=timeout if timeout is not None else exponential_backoff,
-            retryable_exceptions=retryable_exceptions,
-        )
+        try:
+            return cls.retry_connection(
+                connection,
+                connect=connect,
+                logger=logger,
+                retry_limit=creds.connect_retries,
+                retry_timeout=timeout if timeout is not None else exponential_backoff,
+                retryable_exceptions=retryable_exceptions,
+            )
+        except FailedToConnectError:
+            if creds._uses_access_token():
+                # the cached access token may have been rejected: fetch a new one next time
+                get_token_cache().invalidate(creds._access_token_key())
+            raise
 
     def cancel(self, connection):
         handle = connection.handle
@@ -476,9 +528,13 @@ class SnowflakeConnectionManager(SQLConnectionManager):
     @classmethod
     def _split_queries(cls, sql):
         "Splits sql statements at semicolons into discrete queries"
+        return split_statements(
+            str(sql), cls._split_queries_with_connector, trailer=CONNECTOR_TRAILER
+        )
 
-        sql_s = str(sql)
-        sql_buf = StringIO(sql_s)
+    @staticmethod
+    def _split_queries_with_connector(sql: str) -> List[str]:
+        sql_buf = StringIO(sql)
         split_query = snowflake.connector.util_text.split_statements(sql_buf)
         return [part[0] for part in split_query]
 
@@ -505,6 +561,28 @@ class SnowflakeConnectionManager(SQLConnectionManager):
         # to replace them with sane timezones.
         return super().process_results(column_names, cls._fix_rows(rows))
 
+    @classmethod
+    def get_result_from_cursor(cls, cursor: Any, limit: Optional[int]) -> "agate.Table":
+        # Build the table from the Arrow batches the connector downloads, so that values are
+        # converted (and timezones fixed, see process_results) a column at a time. Batches
+        # are only downloaded until `limit` rows are loaded.
+        # Results that are not in the arrow format (e.g. those of `show` commands) are fetched
+        # as rows.
+        if cursor.description is not None and arrow_available():
+            try:
+                batches = cursor.fetch_arrow_batches()
+            except NotSupportedError:
+                pass
+            else:
+                column_names = dedupe_column_names(col[0] for col in cursor.description)
+                return table_from_arrow(batches, column_names, limit or None)
+        return super().get_result_from_cursor(cursor, limit)
+
+    @classmethod
+    def process_rows(cls, rows):
+        # See note in process_results().
+        return cls._fix_rows(rows)
+
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False, limit: Optional[int] = None
     ) -> Tuple[AdapterResponse, "agate.Table"]:
@@ -520,6 +598,19 @@ class SnowflakeConnectionManager(SQLConnectionManager):
             table = empty_table()
         return response, table
 
+    def execute_streaming(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, StreamingResult]:
+        # don't apply the query comment here, see execute(). The connector downloads result
+        # chunks as fetchmany consumes them, so the cursor can be streamed from directly.
+        _, cursor = self.add_query(sql, auto_begin)
+        response = self.get_response(cursor)
+        return response, self.get_stream_from_cursor(cursor, sql, limit, batch_size)
+
     def add_standard_query(self, sql: str, **kwargs) -> Tuple[Connection, Any]:
         # This is the happy path for a single query. Snowflake has a few odd behaviors that
         # require preprocessing within the 'add_query' method below.
@@ -596,6 +687,9 @@ class SnowflakeConnectionManager(SQLConnectionManager):
         return connection, cursor
 
     def _add_standard_queries(self, queries: List[str], **kwargs) -> Tuple[Connection, Any]:
+        if self._can_batch_queries(queries, kwargs.get("bindings")):
+            return self._add_batched_queries(queries, **kwargs)
+
         for query in queries:
             # Even though we turn off transactions by default for Snowflake,
             # the user/macro has passed them *explicitly*, probably to wrap a DML statement
@@ -611,6 +705,26 @@ class SnowflakeConnectionManager(SQLConnectionManager):
                 connection, cursor = self.add_standard_query(query, **kwargs)
         return connection, cursor
 
+    def _can_batch_queries(self, queries: List[str], bindings: Optional[Any]) -> bool:
+        credentials = cast(SnowflakeCredentials, self.profile.credentials)
+        if not credentials.batch_statements or len(queries) < 2 or bindings:
+            return False
+        # explicit transactions are handled statement by statement, and file transfers
+        # cannot be part of a multi-statement request
+        return not any(
+            query.lower() in ("begin;", "commit;") or _FILE_TRANSFER_REGEX.match(query)
+            for query in queries
+        )
+
+    def _add_batched_queries(self, queries: List[str], **kwargs) -> Tuple[Connection, Any]:
+        # Each statement gets a query comment, as in add_standard_query. The cursor is left on
+        # the results of the last statement, so that they are the ones reported.
+        sql = "\n".join(self._add_query_comment(query) for query in queries)
+        connection, cursor = super().add_query(sql, **kwargs)
+        while cursor.nextset():
+            pass
+        return connection, cursor
+
     def _raise_cursor_not_found_error(self, sql: str):
         conn = self.get_thread_connection()
         try:
@@ -633,6 +747,17 @@ class SnowflakeConnectionManager(SQLConnectionManager):
             return
         super().release()
 
+    @classmethod
+    def agate_type_for_column(cls, column):
+        type_name = snowflake.connector.constants.FIELD_ID_TO_NAME[column[1]]
+        if type_name == "FIXED":
+            # NUMBER columns come back as ints without a scale, and as Decimals with one
+            scale = column[5] if len(column) > 5 else None
+            if scale is None:
+                return None
+            type_name = "INTEGER" if scale == 0 else "DECIMAL"
+        return agate_type_for_name(type_name)
+
     @classmethod
     def data_type_code_to_name(cls, type_code: Union[int, str]) -> str:
         assert isinstance(type_code, int)
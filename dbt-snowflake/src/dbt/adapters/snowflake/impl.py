@@ -1,9 +1,25 @@
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Mapping, Any, Optional, List, Union, Dict, FrozenSet, Tuple, TYPE_CHECKING
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import (
+    Mapping,
+    Any,
+    Optional,
+    List,
+    Union,
+    Dict,
+    FrozenSet,
+    Tuple,
+    TYPE_CHECKING,
+    Iterable,
+    cast,
+)
+from uuid import uuid4
 
 from dbt.adapters.base.impl import AdapterConfig, ConstraintSupport
 from dbt.adapters.base.meta import available
+from dbt.adapters.base.relation import BaseRelation
 from dbt.adapters.capability import CapabilityDict, CapabilitySupport, Support, Capability
 from dbt.adapters.catalogs import CatalogRelation, CatalogIntegration, CatalogIntegrationConfig
 from dbt.adapters.contracts.relation import RelationConfig
@@ -32,12 +48,14 @@ from dbt.adapters.snowflake.relation_configs import SnowflakeRelationType
 
 from dbt.adapters.snowflake import SnowflakeColumn
 from dbt.adapters.snowflake import SnowflakeConnectionManager
+from dbt.adapters.snowflake.connections import SnowflakeCredentials
 from dbt.adapters.snowflake import SnowflakeRelation
 
 if TYPE_CHECKING:
     import agate
 
 SHOW_OBJECT_METADATA_MACRO_NAME = "snowflake__show_object_metadata"
+GET_RELATIONS_CACHE_MARKERS_MACRO_NAME = "snowflake__get_relations_cache_markers"
 
 
 @dataclass
@@ -81,6 +99,10 @@ class SnowflakeAdapter(SQLAdapter):
         ConstraintType.foreign_key: ConstraintSupport.NOT_ENFORCED,
     }
 
+    # information_schema queries have a high fixed latency, so select many relations in each.
+    MAX_SCHEMA_METADATA_RELATIONS = 1000
+    CATALOG_QUERY_COST = 500
+
     _capabilities: CapabilityDict = CapabilityDict(
         {
             Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full),
@@ -88,6 +110,7 @@ class SnowflakeAdapter(SQLAdapter):
             Capability.TableLastModifiedMetadataBatch: CapabilitySupport(support=Support.Full),
             Capability.GetCatalogForSingleRelation: CapabilitySupport(support=Support.Full),
             Capability.MicrobatchConcurrency: CapabilitySupport(support=Support.Full),
+            Capability.ParallelSeedLoad: CapabilitySupport(support=Support.Full),
         }
     )
 
@@ -117,9 +140,12 @@ class SnowflakeAdapter(SQLAdapter):
         cls, table: "agate.Table", used_schemas: FrozenSet[Tuple[str, str]]
     ) -> "agate.Table":
         # On snowflake, users can set QUOTED_IDENTIFIERS_IGNORE_CASE, so force
-        # the column names to their lowercased forms.
-        lowered = table.rename(column_names=[c.lower() for c in table.column_names])
-        return super()._catalog_filter_table(lowered, used_schemas)
+        # the column names to their lowercased forms. Renaming copies every
+        # row, so only do it when needed.
+        lowered = [c.lower() for c in table.column_names]
+        if lowered != list(table.column_names):
+            table = table.rename(column_names=lowered)
+        return super()._catalog_filter_table(table, used_schemas)
 
     def _make_match_kwargs(self, database, schema, identifier):
         quoting = self.config.quoting
@@ -279,6 +305,33 @@ class SnowflakeAdapter(SQLAdapter):
 
         return [self._parse_list_relations_result(obj) for obj in schema_objects.select(columns)]
 
+    def get_relations_cache_markers(
+        self, schemas: Iterable[BaseRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        schemas_by_database: Dict[Optional[str], List[BaseRelation]] = {}
+        for relation in schemas:
+            if relation.schema:
+                schemas_by_database.setdefault(relation.database, []).append(relation)
+
+        markers: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        for database, relations in schemas_by_database.items():
+            kwargs = {
+                "information_schema": relations[0].information_schema_only(),
+                "schemas": sorted(
+                    {relation.schema for relation in relations if relation.schema is not None}
+                ),
+            }
+            try:
+                results = self.execute_macro(GET_RELATIONS_CACHE_MARKERS_MACRO_NAME, kwargs=kwargs)
+            except DbtDatabaseError as exc:
+                # the database may not exist yet; its schemas just get listed
+                if "002043 (02000)" in str(exc):
+                    continue
+                raise
+            for schema, marker in results:
+                markers[(database.lower() if database else None, schema.lower())] = marker
+        return markers
+
     def _parse_list_relations_result(self, result: "agate.Row") -> SnowflakeRelation:
         database, schema, identifier, relation_type, is_dynamic, is_iceberg = result
 
@@ -325,6 +378,38 @@ class SnowflakeAdapter(SQLAdapter):
         else:
             return column
 
+    @available
+    def bulk_load_csv_rows(
+        self, relation: SnowflakeRelation, agate_table: "agate.Table", cols_sql: str
+    ) -> Optional[str]:
+        credentials = cast(SnowflakeCredentials, self.config.credentials)
+        if not credentials.stage_seeds or not self.can_bulk_load(agate_table):
+            return None
+        identifier = relation.identifier or ""
+        if relation.quote_policy.identifier:
+            identifier = self.quote(identifier)
+        # the table stage of the seed, which every table has
+        stage = f"@{relation.include(identifier=False).render()}.%{identifier}"
+        # each load stages a file of its own, so that loads into the same table do not overwrite
+        # or purge each other's file
+        file_name = f"seed_{uuid4().hex}.csv"
+        sql = (
+            f"copy into {relation.render()} ({cols_sql}) from {stage} "
+            f"files = ('{file_name}.gz') "
+            "file_format = (type = csv field_optionally_enclosed_by = '\"' "
+            "empty_field_as_null = true) purge = true"
+        )
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir, file_name)
+            with path.open("w", encoding="utf-8", newline="") as fp:
+                self.write_seed_csv(agate_table, fp)
+            self.connections.add_query(
+                f"put 'file://{path.as_posix()}' {stage} auto_compress = true",
+                auto_begin=False,
+            )
+        self.connections.add_query(sql, auto_begin=False)
+        return sql
+
     @available
     def standardize_grants_dict(self, grants_table: "agate.Table") -> dict:
         grants_dict: Dict[str, Any] = {}
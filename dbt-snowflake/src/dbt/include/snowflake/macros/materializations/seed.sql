@@ -1,6 +1,25 @@
 {% macro snowflake__load_csv_rows(model, agate_table) %}
     {% set batch_size = get_batch_size() %}
     {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+
+    {# Load large seeds in chunks across threads, if the seed is configured with load_threads #}
+    {% set load_threads = config.get('load_threads') %}
+    {% if load_threads and adapter.load_csv_rows_in_parallel is defined %}
+        {% set columns_sql = get_seed_column_definitions(model, agate_table) %}
+        {% set parallel_load_sql = adapter.load_csv_rows_in_parallel(this, agate_table, columns_sql, cols_sql, load_threads | int, batch_size) %}
+        {% if parallel_load_sql %}
+            {{ return(parallel_load_sql) }}
+        {% endif %}
+    {% endif %}
+
+    {# Load the rows in bulk through the table stage, and insert them in batches otherwise #}
+    {% if adapter.bulk_load_csv_rows is defined %}
+        {% set bulk_load_sql = adapter.bulk_load_csv_rows(this, agate_table, cols_sql) %}
+        {% if bulk_load_sql %}
+            {{ return(bulk_load_sql) }}
+        {% endif %}
+    {% endif %}
+
     {% set bindings = [] %}
 
     {% set statements = [] %}
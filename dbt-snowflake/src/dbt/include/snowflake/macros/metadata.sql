@@ -17,3 +17,45 @@
   {{ return(load_result('last_modified')) }}
 
 {% endmacro %}
+
+
+{% macro snowflake__get_relations_cache_markers(information_schema, schemas) -%}
+
+  {#-
+      -- a schema's marker only uses DDL metadata, so that loading data into its
+      -- tables (which bumps last_altered) does not change it: the schema's
+      -- creation time, and the number of objects in it with their latest
+      -- creation and DDL times, which creates, drops and renames all change
+  -#}
+  {%- call statement('get_relations_cache_markers', fetch_result=True) -%}
+        with objects as (
+            select upper(table_schema) as schema,
+                   count(*) as object_count,
+                   max(created) as created,
+                   max(last_ddl) as last_ddl
+            from {{ information_schema }}.tables
+            where upper(table_schema) in (
+              {%- for schema in schemas -%}
+                upper('{{ dbt.escape_single_quotes(schema) }}'){%- if not loop.last %}, {% endif -%}
+              {%- endfor -%}
+            )
+            group by 1
+        )
+        select upper(schemata.schema_name) as schema,
+               to_varchar(schemata.created, 'YYYY-MM-DD HH24:MI:SS.FF9 TZHTZM')
+                 || ':' || coalesce(objects.object_count, 0)
+                 || ':' || coalesce(to_varchar(objects.created, 'YYYY-MM-DD HH24:MI:SS.FF9 TZHTZM'), '')
+                 || ':' || coalesce(to_varchar(objects.last_ddl, 'YYYY-MM-DD HH24:MI:SS.FF9 TZHTZM'), '')
+                 as marker
+        from {{ information_schema }}.schemata
+        left join objects on objects.schema = upper(schemata.schema_name)
+        where upper(schemata.schema_name) in (
+          {%- for schema in schemas -%}
+            upper('{{ dbt.escape_single_quotes(schema) }}'){%- if not loop.last %}, {% endif -%}
+          {%- endfor -%}
+        )
+  {%- endcall -%}
+
+  {{ return(load_result('get_relations_cache_markers').table) }}
+
+{% endmacro %}
@@ -67,3 +67,79 @@ def test_snowflake_oauth_expired_token_raises_error():
 
         with pytest.raises(FailedToConnectError):
             adapter.open()
+
+
+def test_snowflake_oauth_access_tokens_are_shared():
+    credentials = connections.SnowflakeCredentials(
+        account="test_account",
+        user="test_user",
+        authenticator="oauth",
+        token="refresh_token",
+        oauth_client_id="client_id",
+        oauth_client_secret="client_secret",
+        database="database",
+        schema="schema",
+    )
+    response = Mock(json=Mock(return_value={"access_token": "access_token", "expires_in": 600}))
+
+    with patch("dbt.adapters.snowflake.connections.requests.post", return_value=response) as post:
+        tokens = [credentials.auth_args()["token"] for _ in range(3)]
+
+    assert tokens == ["access_token"] * 3
+    assert post.call_count == 1
+
+
+def test_snowflake_oauth_access_token_is_fetched_again_after_a_failed_connection():
+    credentials = connections.SnowflakeCredentials(
+        account="test_account",
+        user="test_user",
+        authenticator="oauth",
+        token="rejected_refresh_token",
+        oauth_client_id="client_id",
+        oauth_client_secret="client_secret",
+        database="database",
+        schema="schema",
+    )
+    response = Mock(json=Mock(return_value={"access_token": "access_token", "expires_in": 600}))
+    connection = Mock(state="init", credentials=credentials)
+
+    with patch(
+        "dbt.adapters.snowflake.connections.requests.post", return_value=response
+    ) as post, patch(
+        "dbt.adapters.snowflake.connections.snowflake.connector.connect",
+        side_effect=connections.DatabaseError("token rejected"),
+    ):
+        for _ in range(2):
+            with pytest.raises(FailedToConnectError):
+                connections.SnowflakeConnectionManager.open(connection)
+
+    assert post.call_count == 2
+
+
+def test_result_from_arrow_batches_stops_at_limit():
+    import pyarrow
+
+    read = []
+
+    def batches():
+        for i in range(0, 10, 2):
+            read.append(i)
+            yield pyarrow.RecordBatch.from_pydict({"ID": [i, i + 1]})
+
+    cursor = Mock(description=[("ID", 0)])
+    cursor.fetch_arrow_batches.return_value = batches()
+    table = connections.SnowflakeConnectionManager.get_result_from_cursor(cursor, limit=3)
+
+    assert [row["ID"] for row in table.rows] == [0, 1, 2]
+    assert read == [0, 2]
+    cursor.fetchmany.assert_not_called()
+
+
+def test_result_without_arrow_batches_is_fetched_as_rows():
+    cursor = Mock(description=[("name", 2)])
+    cursor.fetch_arrow_batches.side_effect = connections.NotSupportedError
+    cursor.fetchmany.return_value = [("a",)]
+    table = connections.SnowflakeConnectionManager.get_result_from_cursor(cursor, limit=1)
+
+    assert [row["name"] for row in table.rows] == ["a"]
+    cursor.fetchmany.assert_called_once_with(1)
@@ -59,6 +59,8 @@ class TestSnowflakeAdapter(unittest.TestCase):
 
         self.handle = mock.MagicMock(spec=snowflake_connector.SnowflakeConnection)
         self.cursor = self.handle.cursor.return_value
+        # results are mocked as rows, like the results the connector has no arrow batches for
+        self.cursor.fetch_arrow_batches.side_effect = snowflake_connector.errors.NotSupportedError
         self.mock_execute = self.cursor.execute
         self.mock_execute.return_value = mock.MagicMock(sfqid="42")
         self.patcher = mock.patch("dbt.adapters.snowflake.connections.snowflake.connector.connect")
@@ -619,6 +621,79 @@ class TestSnowflakeAdapter(unittest.TestCase):
             ]
         )
 
+    def test_statements_run_one_by_one(self):
+        self.adapter.execute("select 1; select 2")
+
+        self.mock_execute.assert_has_calls(
+            [
+                mock.call("/* dbt */\nselect 1;", None),
+                mock.call("/* dbt */\nselect 2", None),
+            ]
+        )
+
+    def test_batch_statements(self):
+        self.config.credentials = self.config.credentials.replace(batch_statements=True)
+        self.adapter = SnowflakeAdapter(self.config, get_context("spawn"))
+        self.adapter.connections.query_header = mock.Mock()
+        self.adapter.connections.query_header.add.side_effect = "/* dbt */\n{}".format
+        self.adapter.acquire_connection()
+        self.cursor.nextset.side_effect = [self.cursor, None]
+
+        self.adapter.execute("select 1; select 2; -- trailing comment\nselect 3")
+
+        self.assertEqual(
+            self.snowflake.call_args.kwargs["session_parameters"], {"MULTI_STATEMENT_COUNT": 0}
+        )
+        self.mock_execute.assert_called_once_with(
+            "/* dbt */\nselect 1;\n/* dbt */\nselect 2; -- trailing comment\n/* dbt */\nselect 3",
+            None,
+        )
+        self.assertEqual(self.cursor.nextset.call_count, 2)
+
+    def test_batch_statements_skips_file_transfers(self):
+        self.config.credentials = self.config.credentials.replace(batch_statements=True)
+        self.adapter = SnowflakeAdapter(self.config, get_context("spawn"))
+        self.adapter.connections.query_header = mock.Mock()
+        self.adapter.connections.query_header.add.side_effect = "/* dbt */\n{}".format
+        self.adapter.acquire_connection()
+
+        self.adapter.execute("put 'file:///tmp/data.csv' @stage; copy into t from @stage")
+
+        self.assertEqual(self.mock_execute.call_count, 2)
+        self.cursor.nextset.assert_not_called()
+
+    def test_bulk_load_csv_rows_is_opt_in(self):
+        table = agate.Table([(1,)], ["id"], [agate.Number()])
+        relation = SnowflakeAdapter.Relation.create(
+            database="test_database", schema="test_schema", identifier="seed"
+        )
+
+        self.assertIsNone(self.adapter.bulk_load_csv_rows(relation, table, "id"))
+        self.mock_execute.assert_not_called()
+
+    def test_bulk_load_csv_rows_stages_a_file_of_its_own(self):
+        self.config.credentials = self.config.credentials.replace(stage_seeds=True)
+        self.adapter = SnowflakeAdapter(self.config, get_context("spawn"))
+        self.adapter.connections.query_header = mock.Mock()
+        self.adapter.connections.query_header.add.side_effect = "{}".format
+        self.adapter.acquire_connection()
+        table = agate.Table([(1,)], ["id"], [agate.Number()])
+        relation = SnowflakeAdapter.Relation.create(
+            database="test_database", schema="test_schema", identifier="seed"
+        )
+
+        sqls = [
+            self.adapter.bulk_load_csv_rows(relation, table, "id"),
+            self.adapter.bulk_load_csv_rows(relation, table, "id"),
+        ]
+
+        puts = [c.args[0] for c in self.mock_execute.call_args_list if c.args[0].startswith("put")]
+        files = [re.search(r"/(seed_\w+\.csv)' ", put).group(1) for put in puts]
+        self.assertEqual(len(set(files)), 2)
+        for put, file_name, sql in zip(puts, files, sqls):
+            self.assertNotIn("overwrite", put)
+            self.assertIn(f"files = ('{file_name}.gz')", sql)
+
     def test_reuse_connections_with_keep_alive(self):
         self.config.credentials = self.config.credentials.replace(
             reuse_connections=True, client_session_keep_alive=True
@@ -718,6 +793,29 @@ class TestSnowflakeAdapter(unittest.TestCase):
             ]
         )
 
+    def test_get_relations_cache_markers(self):
+        schemas = [
+            self.adapter.Relation.create(database="db_1", schema="foo"),
+            self.adapter.Relation.create(database="db_1", schema="bar"),
+            self.adapter.Relation.create(database="db_2", schema="foo"),
+        ]
+        results = {
+            "db_1": [("FOO", "m1"), ("BAR", "m2")],
+            "db_2": [("FOO", "m3")],
+        }
+
+        def execute_macro(macro_name, kwargs):
+            self.assertEqual(macro_name, "snowflake__get_relations_cache_markers")
+            return results[kwargs["information_schema"].database]
+
+        with mock.patch.object(self.adapter, "execute_macro", side_effect=execute_macro):
+            markers = self.adapter.get_relations_cache_markers(schemas)
+
+        self.assertEqual(
+            markers,
+            {("db_1", "foo"): "m1", ("db_1", "bar"): "m2", ("db_2", "foo"): "m3"},
+        )
+
 
 class TestSnowflakeAdapterConversions(TestAdapterConversions):
     def test_convert_text_type(self):
@@ -195,6 +195,10 @@ class SparkConnectionWrapper(ABC):
     def fetchall(self) -> Optional[List]:
         pass
 
+    @abstractmethod
+    def fetchmany(self, size: int) -> Optional[List]:
+        pass
+
     @abstractmethod
     def execute(self, sql: str, bindings: Optional[List[Any]] = None) -> None:
         pass
@@ -251,6 +255,10 @@ class PyhiveConnectionWrapper(SparkConnectionWrapper):
         assert self._cursor, "Cursor not available"
         return self._cursor.fetchall()
 
+    def fetchmany(self, size: int) -> List["pyodbc.Row"]:
+        assert self._cursor, "Cursor not available"
+        return self._cursor.fetchmany(size)
+
     def execute(self, sql: str, bindings: Optional[List[Any]] = None) -> None:
         if sql.strip().endswith(";"):
             sql = sql.strip()[:-1]
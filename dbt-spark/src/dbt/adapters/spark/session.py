@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import datetime as dt
+from itertools import islice
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Tuple, Union, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, Sequence
 
 from dbt.adapters.spark.connections import SparkConnectionWrapper
 from dbt.adapters.events.logging import AdapterLogger
@@ -30,6 +31,7 @@ class Cursor:
     def __init__(self, *, server_side_parameters: Optional[Dict[str, Any]] = None) -> None:
         self._df: Optional[DataFrame] = None
         self._rows: Optional[List[Row]] = None
+        self._row_iterator: Optional[Iterator[Row]] = None
         self.server_side_parameters = server_side_parameters or {}
 
     def __enter__(self) -> Cursor:
@@ -89,6 +91,7 @@ class Cursor:
         """
         self._df = None
         self._rows = None
+        self._row_iterator = None
 
     def execute(self, sql: str, *parameters: Any) -> None:
         """
@@ -142,6 +145,30 @@ class Cursor:
             self._rows = self._df.collect()
         return self._rows
 
+    def fetchmany(self, size: int) -> List[Row]:
+        """
+        Fetch the next rows, collecting one partition at a time.
+
+        Parameters
+        ----------
+        size : int
+            The maximum number of rows to fetch.
+
+        Returns
+        -------
+        out : List[Row]
+            The rows, empty when there are no more.
+
+        Source
+        ------
+        https://github.com/mkleehammer/pyodbc/wiki/Cursor#fetchmanysize
+        """
+        if self._row_iterator is None and self._df is not None:
+            self._row_iterator = self._df.toLocalIterator()
+        if self._row_iterator is None:
+            return []
+        return list(islice(self._row_iterator, size))
+
     def fetchone(self) -> Optional[Row]:
         """
         Fetch the first output.
@@ -218,6 +245,10 @@ class SessionConnectionWrapper(SparkConnectionWrapper):
         assert self._cursor, "Cursor not available"
         return self._cursor.fetchall()
 
+    def fetchmany(self, size: int) -> List[Row]:
+        assert self._cursor, "Cursor not available"
+        return self._cursor.fetchmany(size)
+
     def execute(self, sql: str, bindings: Optional[List[Any]] = None) -> None:
         if sql.strip().endswith(";"):
             sql = sql.strip()[:-1]